@@ -5,6 +5,7 @@ from sqlmodel import Session, select
 from typing import List
 from datetime import datetime, timedelta
 from backend.models import Lead
+from backend.core.users import get_user_center_ids
 
 
 def get_abandoned_leads(db: Session, user=None, hours_threshold: int = 48) -> List[Lead]:
@@ -28,7 +29,7 @@ def get_abandoned_leads(db: Session, user=None, hours_threshold: int = 48) -> Li
     
     # Filter by user's centers if not team_lead
     if user and user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             query = query.where(Lead.center_id.in_(center_ids))
         else:
@@ -7,13 +7,15 @@ from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta, date, time
 from backend.models import Lead, AuditLog, Batch, BatchCoachLink, Attendance, User, Center, Student, StudentBatchLink
 from backend.core.staging import get_staging_leads
+from backend.core.users import get_user_center_ids, get_coach_batch_ids, SALES_ROLES
 
 # Simple 5-minute cache for analytics (avoids DB hit on every page refresh)
 _ANALYTICS_CACHE: Dict[str, Tuple[Any, datetime]] = {}
 _CACHE_TTL = timedelta(minutes=5)
+_COUNTS_CACHE_TTL = timedelta(seconds=60)  # Dashboard counters polled by the UI
 
 
-def _cached(key: str, fn, *args, **kwargs):
+def _cached(key: str, fn, *args, ttl: timedelta = _CACHE_TTL, **kwargs):
     """Return cached result if fresh, else compute and cache."""
     now = datetime.utcnow()
     if key in _ANALYTICS_CACHE:
@@ -21,7 +23,7 @@ def _cached(key: str, fn, *args, **kwargs):
         if expiry > now:
             return val
     result = fn(*args, **kwargs)
-    _ANALYTICS_CACHE[key] = (result, now + _CACHE_TTL)
+    _ANALYTICS_CACHE[key] = (result, now + ttl)
     return result
 
 
@@ -193,7 +195,19 @@ def get_conversion_funnel(db: Session) -> Dict:
     - Commitment: (Trial Scheduled / Total Leads)
     - Success: (Joined / Trial Attended) - Trial Attended approximated by Trial Scheduled count
     """
-    total_leads = db.exec(select(func.count(Lead.id))).first() or 0
+    # All four counts in one pass over the lead table (conditional aggregates) instead of four scans:
+    # total; Engagement = preferences set (preferred_batch_id or preferred_call_time);
+    # Commitment = Trial Scheduled; Success numerator = Joined
+    total_leads, with_prefs, trial_scheduled, joined = db.exec(
+        select(
+            func.count(Lead.id),
+            func.count(Lead.id).filter(
+                or_(Lead.preferred_batch_id.isnot(None), Lead.preferred_call_time.isnot(None))
+            ),
+            func.count(Lead.id).filter(Lead.status == "Trial Scheduled"),
+            func.count(Lead.id).filter(Lead.status == "Joined"),
+        )
+    ).one()
     if total_leads == 0:
         return {
             "engagement": {"rate": 0.0, "numerator": 0, "denominator": 0},
@@ -201,22 +215,10 @@ def get_conversion_funnel(db: Session) -> Dict:
             "success": {"rate": 0.0, "numerator": 0, "denominator": 0},
         }
 
-    # Engagement: Leads with preferences set (preferred_batch_id or preferred_call_time)
-    with_prefs = db.exec(
-        select(func.count(Lead.id)).where(
-            or_(Lead.preferred_batch_id.isnot(None), Lead.preferred_call_time.isnot(None))
-        )
-    ).first() or 0
     eng_rate = with_prefs / total_leads if total_leads > 0 else 0.0
-
-    # Commitment: Trial Scheduled count
-    trial_scheduled = db.exec(
-        select(func.count(Lead.id)).where(Lead.status == "Trial Scheduled")
-    ).first() or 0
     commitment_rate = trial_scheduled / total_leads if total_leads > 0 else 0.0
 
     # Success: Joined / Trial Attended. Use Trial Scheduled as proxy for Trial Attended (includes current + those who moved on)
-    joined = db.exec(select(func.count(Lead.id)).where(Lead.status == "Joined")).first() or 0
     trial_attended = trial_scheduled + joined
     success_rate = joined / trial_attended if trial_attended > 0 else 0.0
 
@@ -253,7 +255,8 @@ def calculate_average_time_to_contact(db: Session) -> Optional[float]:
     
     Returns average hours, or None if no data available.
     """
-    # First "Called" timestamp per lead via SQL (single query)
+    # First "Called" timestamp per lead via SQL, joined to just the lead's extra_data
+    # (one query, no full Lead rows or id IN-list round trip)
     first_called_q = (
         select(AuditLog.lead_id, func.min(AuditLog.timestamp).label("first_called"))
         .where(
@@ -262,29 +265,18 @@ def calculate_average_time_to_contact(db: Session) -> Optional[float]:
             AuditLog.lead_id.isnot(None),
         )
         .group_by(AuditLog.lead_id)
+        .subquery()
     )
-    first_called_rows = db.exec(first_called_q).all()
-    if not first_called_rows:
-        return None
-
-    lead_ids = [r.lead_id for r in first_called_rows if r.lead_id]
-    if not lead_ids:
-        return None
-
-    # Batch-fetch leads with preference_submitted_at (single query, filter by id in list)
-    leads = db.exec(select(Lead).where(Lead.id.in_(lead_ids))).all()
-    lead_pref: Dict[int, str] = {}
-    for lead in leads:
-        if lead and lead.extra_data and isinstance(lead.extra_data, dict):
-            pref = lead.extra_data.get("preference_submitted_at")
-            if pref:
-                lead_pref[lead.id] = pref
+    rows = db.exec(
+        select(first_called_q.c.first_called, Lead.extra_data)
+        .join(Lead, Lead.id == first_called_q.c.lead_id)
+    ).all()
 
     total_hours = 0.0
     count = 0
-    for row in first_called_rows:
-        lead_id = row.lead_id
-        pref_at = lead_pref.get(lead_id) if lead_id else None
+    for row in rows:
+        extra_data = row.extra_data
+        pref_at = extra_data.get("preference_submitted_at") if isinstance(extra_data, dict) else None
         if not pref_at:
             continue
         try:
@@ -313,6 +305,23 @@ def get_status_distribution(db: Session) -> Dict[str, int]:
     return {status: count for status, count in results}
 
 
+def get_status_distribution_cached(db: Session) -> Dict[str, int]:
+    """Status distribution (60s cached)."""
+    return _cached("status_distribution", get_status_distribution, db, ttl=_COUNTS_CACHE_TTL)
+
+
+def get_abandoned_leads_count_cached(db: Session) -> int:
+    """Abandoned leads count (60s cached)."""
+    from backend.core.abandoned_leads import get_abandoned_leads_count
+    return _cached("abandoned_count", get_abandoned_leads_count, db, ttl=_COUNTS_CACHE_TTL)
+
+
+def get_at_risk_leads_count_cached(db: Session) -> int:
+    """At-risk leads count (60s cached)."""
+    from backend.core.at_risk_leads import get_at_risk_leads_count
+    return _cached("at_risk_count", get_at_risk_leads_count, db, ttl=_COUNTS_CACHE_TTL)
+
+
 def get_command_center_analytics(
     db: Session,
     user: User,
@@ -354,7 +363,7 @@ def get_command_center_analytics(
         result = _get_sales_command_center_analytics(db, user, target_date, today_start, today_end)
         
         # Add new batch opportunities for sales users
-        if user.role in ["team_lead", "team_member"]:
+        if user.role in SALES_ROLES:
             result["new_batch_opportunities"] = get_new_batch_opportunities(db, user)
         
         # For team_lead, add executive analytics
@@ -379,7 +388,7 @@ def _get_sales_command_center_analytics(
     
     # Filter by user's centers (unless team_lead)
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             base_query = base_query.where(Lead.center_id.in_(center_ids))
         else:
@@ -526,7 +535,7 @@ def _get_sales_command_center_analytics(
     
     # Filter by user's centers if not team_lead
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             student_query = student_query.where(Student.center_id.in_(center_ids))
             # Execute query and count
@@ -552,7 +561,7 @@ def _get_sales_command_center_analytics(
     
     # Filter by user's centers if not team_lead
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             nurture_query = nurture_query.where(Lead.center_id.in_(center_ids))
             nurture_leads = list(db.exec(nurture_query).all())
@@ -568,7 +577,7 @@ def _get_sales_command_center_analytics(
     
     # Filter by user's centers if not team_lead
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             on_break_query = on_break_query.where(Lead.center_id.in_(center_ids))
             on_break_leads = list(db.exec(on_break_query).all())
@@ -590,7 +599,7 @@ def _get_sales_command_center_analytics(
     
     # Filter by user's centers if not team_lead
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             returning_soon_query = returning_soon_query.where(Lead.center_id.in_(center_ids))
             returning_soon_leads = list(db.exec(returning_soon_query).all())
@@ -608,7 +617,7 @@ def _get_sales_command_center_analytics(
     # Get all active students
     all_students_query = select(Student).where(Student.is_active == True)
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             all_students_query = all_students_query.where(Student.center_id.in_(center_ids))
     
@@ -658,7 +667,7 @@ def _get_sales_command_center_analytics(
         Lead.preferences_submitted == False,
     )
     if user.role != "team_lead":
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if center_ids:
             nudge_failure_query = nudge_failure_query.where(Lead.center_id.in_(center_ids))
     nudge_failure_leads = list(db.exec(nudge_failure_query).all())
@@ -712,10 +721,7 @@ def _get_coach_command_center_analytics(
 ) -> Dict:
     """Get coach-focused command center analytics."""
     # Get coach's assigned batches
-    batch_assignments = db.exec(
-        select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
-    ).all()
-    batch_ids = list(batch_assignments)
+    batch_ids = list(get_coach_batch_ids(db, user))
     
     if not batch_ids:
         # Coach has no batches
@@ -877,7 +883,7 @@ def get_new_batch_opportunities(db: Session, user: User, hours_back: int = 48) -
         center_ids = [c.id for c in db.exec(select(Center)).all()]
     else:
         # Regular users see their assigned centers
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
     
     if not center_ids:
         return []
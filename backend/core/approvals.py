@@ -3,7 +3,7 @@ Unified approval request system.
 Single table for all Team Member requests. Generic create_request and resolve_request.
 """
 from sqlmodel import Session, select
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from backend.models import ApprovalRequest, Lead, User, Student, StudentBatchLink, Center
@@ -93,6 +93,29 @@ def get_requests_for_lead(db: Session, lead_id: int) -> List[ApprovalRequest]:
     return sorted(direct, key=lambda r: r.created_at or datetime.min, reverse=True)
 
 
+def get_request_player_names(db: Session, requests: List[ApprovalRequest]) -> Dict[int, str]:
+    """
+    Player name per request id (from the request's lead, else the student's lead), batch-loaded
+    in at most two IN-queries instead of db.get() per request. Unresolvable requests are absent.
+    """
+    lead_ids = {r.lead_id for r in requests if r.lead_id}
+    student_ids = {r.student_id for r in requests if r.student_id}
+    lead_names = dict(db.exec(select(Lead.id, Lead.player_name).where(Lead.id.in_(lead_ids))).all()) if lead_ids else {}
+    student_names = dict(db.exec(
+        select(Student.id, Lead.player_name)
+        .join(Lead, Lead.id == Student.lead_id)
+        .where(Student.id.in_(student_ids))
+    ).all()) if student_ids else {}
+
+    player_names: Dict[int, str] = {}
+    for r in requests:
+        if r.lead_id in lead_names:
+            player_names[r.id] = lead_names[r.lead_id]
+        elif r.student_id in student_names:
+            player_names[r.id] = student_names[r.student_id]
+    return player_names
+
+
 def resolve_request(
     db: Session,
     request_id: int,
@@ -2,11 +2,13 @@
 Attendance management business logic.
 Framework-agnostic attendance operations.
 """
+from dataclasses import dataclass
 from sqlmodel import Session, select
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date, datetime
-from backend.models import Attendance, Lead, Batch, BatchCoachLink, User, AuditLog
+from backend.models import Attendance, Lead, Batch, BatchCoachLink, User, AuditLog, Student
 from backend.core.audit import log_lead_activity
+from backend.core.users import get_user_center_ids
 
 
 def check_coach_batch_assignment(
@@ -77,7 +79,6 @@ def record_attendance(
         raise ValueError(f"Batch {batch_id} not found")
     
     # Check if this lead has been converted to a student
-    from backend.models import Student
     student = db.exec(
         select(Student).where(Student.lead_id == lead_id)
     ).first()
@@ -248,6 +249,37 @@ def record_attendance(
     return attendance
 
 
+def _attendance_history_query(db: Session, lead_id: int, user: User, *columns):
+    """
+    Build the access-filtered attendance history query for a lead, selecting
+    either Attendance entities (no columns) or just the given columns.
+    
+    Raises:
+        ValueError: If lead not found or user doesn't have access
+    """
+    # Verify lead exists
+    lead = db.get(Lead, lead_id)
+    if not lead:
+        raise ValueError(f"Lead {lead_id} not found")
+    
+    query = select(*columns) if columns else select(Attendance)
+    query = query.where(Attendance.lead_id == lead_id)
+    
+    if user.role == "coach":
+        # Coaches can only see attendance for their batches (subquery: no extra round trip)
+        query = query.where(Attendance.batch_id.in_(
+            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
+        ))
+    elif user.role != "team_lead":
+        # Regular users: check if lead belongs to their centers
+        center_ids = get_user_center_ids(user)
+        if not center_ids or lead.center_id not in center_ids:
+            raise ValueError("Not authorized to view attendance for this lead")
+    
+    # Order by date descending (most recent first)
+    return query.order_by(Attendance.date.desc(), Attendance.recorded_at.desc())
+
+
 def get_attendance_history(
     db: Session,
     lead_id: int,
@@ -269,45 +301,167 @@ def get_attendance_history(
     Raises:
         ValueError: If lead not found or user doesn't have access
     """
-    # Verify lead exists
-    lead = db.get(Lead, lead_id)
-    if not lead:
-        raise ValueError(f"Lead {lead_id} not found")
+    query = _attendance_history_query(db, lead_id, user)
+    if limit:
+        query = query.limit(limit)
+    return list(db.exec(query).all())
+
+
+def record_attendance_bulk(
+    db: Session,
+    batch_id: int,
+    user_id: int,
+    date: date,
+    records: List[Dict]
+) -> Dict:
+    """
+    Record attendance for a whole batch session in one request.
+    The coach assignment and batch are checked once, leads and student links load in
+    one query each, and all plain records (with their audit entries) are written in a
+    single commit. Records that trigger trial side effects (Present/Absent for a
+    'Trial Scheduled' lead) go through record_attendance so promotion, reschedule and
+    notifications behave exactly as for a single check-in.
     
-    # Build query
-    if user.role == "team_lead":
-        # Team leads can see all attendance
-        query = select(Attendance).where(Attendance.lead_id == lead_id)
-    elif user.role == "coach":
-        # Coaches can only see attendance for their batches
-        # Get batch IDs assigned to this coach
-        batch_assignments = db.exec(
-            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
-        ).all()
-        batch_ids = list(batch_assignments)
+    Args:
+        db: Database session
+        batch_id: Batch ID
+        user_id: User ID of the coach recording attendance
+        date: Date of attendance
+        records: Dicts with lead_id, status and optional remarks / internal_note
         
-        if not batch_ids:
-            return []  # Coach has no batches, return empty
+    Returns:
+        Dictionary with recorded_count, attendance_ids and per-lead errors
         
-        from sqlalchemy import or_
-        query = select(Attendance).where(
-            Attendance.lead_id == lead_id,
-            Attendance.batch_id.in_(batch_ids)
+    Raises:
+        ValueError: If coach is not assigned to the batch or batch not found
+    """
+    if not check_coach_batch_assignment(db, user_id, batch_id):
+        raise ValueError(f"Coach {user_id} is not assigned to batch {batch_id}")
+    
+    batch = db.get(Batch, batch_id)
+    if not batch:
+        raise ValueError(f"Batch {batch_id} not found")
+    
+    lead_ids = [record["lead_id"] for record in records]
+    leads = {lead.id: lead for lead in db.exec(select(Lead).where(Lead.id.in_(lead_ids))).all()}
+    student_ids = dict(db.exec(
+        select(Student.lead_id, Student.id).where(Student.lead_id.in_(lead_ids))
+    ).all())
+    coach = db.get(User, user_id)
+    coach_name = coach.full_name if coach else f"Coach {user_id}"
+    
+    now = datetime.utcnow()
+    attendances = []
+    trial_records = []
+    errors = []
+    for record in records:
+        lead = leads.get(record["lead_id"])
+        if not lead:
+            errors.append(f"Lead {record['lead_id']} not found")
+            continue
+        if lead.status == "Trial Scheduled" and record["status"] in ("Present", "Absent"):
+            trial_records.append(record)
+            continue
+        attendance = Attendance(
+            lead_id=lead.id,
+            student_id=student_ids.get(lead.id),
+            batch_id=batch_id,
+            user_id=user_id,
+            date=date,
+            status=record["status"],
+            remarks=record.get("remarks"),
+            recorded_at=now
         )
-    else:
-        # Regular users: check if lead belongs to their centers
-        center_ids = [c.id for c in user.centers]
-        if not center_ids or lead.center_id not in center_ids:
-            raise ValueError("Not authorized to view attendance for this lead")
-        
-        query = select(Attendance).where(Attendance.lead_id == lead_id)
+        db.add(attendance)
+        db.add(AuditLog(
+            lead_id=lead.id,
+            user_id=user_id,
+            action_type="attendance_recorded",
+            description=f"Coach {coach_name} marked {lead.player_name} as {record['status']} for {batch.name}",
+            new_value=record["status"],
+            timestamp=now
+        ))
+        attendances.append(attendance)
     
-    # Order by date descending (most recent first)
-    query = query.order_by(Attendance.date.desc(), Attendance.recorded_at.desc())
+    attendance_ids = []
+    if attendances:
+        db.flush()  # Assign IDs before commit expires the instances
+        attendance_ids = [attendance.id for attendance in attendances]
+        db.commit()
     
+    for record in trial_records:
+        try:
+            attendance = record_attendance(
+                db=db,
+                lead_id=record["lead_id"],
+                batch_id=batch_id,
+                user_id=user_id,
+                date=date,
+                status=record["status"],
+                remarks=record.get("remarks"),
+                internal_note=record.get("internal_note")
+            )
+            attendance_ids.append(attendance.id)
+        except ValueError as e:
+            errors.append(str(e))
+    
+    return {
+        "recorded_count": len(attendance_ids),
+        "attendance_ids": attendance_ids,
+        "errors": errors
+    }
+
+
+@dataclass(slots=True)
+class AttendanceRow:
+    """
+    One attendance history record in API shape. Field order matches the column rows
+    from get_attendance_history_rows, so `AttendanceRow(*row)` builds it; orjson
+    serializes slotted dataclasses directly without an intermediate dict.
+    """
+    id: int
+    batch_id: int
+    date: date
+    status: str
+    remarks: Optional[str]
+    recorded_at: Optional[datetime]
+    coach_id: int
+
+
+def get_attendance_history_rows(
+    db: Session,
+    lead_id: int,
+    user: User,
+    limit: Optional[int] = None,
+    before: Optional[date] = None,
+    before_id: Optional[int] = None
+) -> List[Tuple]:
+    """
+    Same as get_attendance_history, but returns plain column rows
+    (id, batch_id, date, status, remarks, recorded_at, user_id) without ORM hydration.
+    For read-only serialization of long histories.
+    
+    Keyset pagination: pass the last row's date (and id) as before/before_id to get
+    the next page; rows are then ordered by (date, id) descending so pages never overlap.
+    """
+    from sqlalchemy import or_, and_
+    
+    query = _attendance_history_query(
+        db, lead_id, user,
+        Attendance.id, Attendance.batch_id, Attendance.date, Attendance.status,
+        Attendance.remarks, Attendance.recorded_at, Attendance.user_id,
+    )
+    if limit or before:
+        query = query.order_by(None).order_by(Attendance.date.desc(), Attendance.id.desc())
+    if before and before_id:
+        query = query.where(or_(
+            Attendance.date < before,
+            and_(Attendance.date == before, Attendance.id < before_id),
+        ))
+    elif before:
+        query = query.where(Attendance.date < before)
     if limit:
         query = query.limit(limit)
-    
     return list(db.exec(query).all())
 
 
@@ -344,7 +498,7 @@ def get_batch_attendance_for_date(
         if not batch:
             raise ValueError(f"Batch {batch_id} not found")
         
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if batch.center_id not in center_ids:
             raise ValueError("Not authorized to view attendance for this batch")
     
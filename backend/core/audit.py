@@ -4,7 +4,7 @@ Framework-agnostic audit logging utilities.
 """
 from sqlmodel import Session
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from backend.models import AuditLog, Lead, User
 
 
@@ -63,8 +63,12 @@ def log_status_change(
     new_status: str
 ) -> AuditLog:
     """Log a status change."""
-    return log_lead_activity(
-        db=db,
+    return log_lead_activity(db=db, **status_change_entry(lead_id, user_id, old_status, new_status))
+
+
+def status_change_entry(lead_id: int, user_id: int, old_status: str, new_status: str) -> dict:
+    """log_lead_activity fields for a status change (shared with log_lead_activities_bulk callers)."""
+    return dict(
         lead_id=lead_id,
         user_id=user_id,
         action_type='status_change',
@@ -102,8 +106,18 @@ def log_field_update(
     new_value: Optional[str]
 ) -> AuditLog:
     """Log a field update."""
-    return log_lead_activity(
-        db=db,
+    return log_lead_activity(db=db, **field_update_entry(lead_id, user_id, field_name, old_value, new_value))
+
+
+def field_update_entry(
+    lead_id: int,
+    user_id: int,
+    field_name: str,
+    old_value: Optional[str],
+    new_value: Optional[str]
+) -> dict:
+    """log_lead_activity fields for a field update (shared with log_lead_activities_bulk callers)."""
+    return dict(
         lead_id=lead_id,
         user_id=user_id,
         action_type='field_update',
@@ -113,7 +127,26 @@ def log_field_update(
     )
 
 
-def get_audit_logs_for_lead(db: Session, lead_id: int, limit: Optional[int] = None) -> list[AuditLog]:
+def log_lead_activities_bulk(db: Session, entries: List[dict]) -> None:
+    """
+    Insert many audit log entries (log_lead_activity fields) in one statement.
+    Unlike log_lead_activity this neither commits nor touches Lead.last_updated: the caller
+    updates the leads itself and commits once.
+    """
+    from sqlalchemy import insert
+
+    if not entries:
+        return
+    now = datetime.utcnow()
+    db.execute(insert(AuditLog), [{**entry, "timestamp": now} for entry in entries])
+
+
+def get_audit_logs_for_lead(
+    db: Session,
+    lead_id: int,
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None
+) -> list[AuditLog]:
     """
     Get audit logs for a specific lead, ordered by most recent first.
     
@@ -121,13 +154,25 @@ def get_audit_logs_for_lead(db: Session, lead_id: int, limit: Optional[int] = No
         db: Database session
         lead_id: ID of the lead
         limit: Optional limit on number of logs to return
+        before_id: Optional keyset cursor: only entries older than this audit log id
+            (seeks on the (lead_id, timestamp) index instead of an OFFSET scan)
         
     Returns:
         List of AuditLog entries
     """
     from sqlmodel import select
+    from sqlalchemy import and_, or_
+    
+    query = select(AuditLog).where(AuditLog.lead_id == lead_id)
+    
+    if before_id is not None:
+        cursor_ts = select(AuditLog.timestamp).where(AuditLog.id == before_id).scalar_subquery()
+        query = query.where(or_(
+            AuditLog.timestamp < cursor_ts,
+            and_(AuditLog.timestamp == cursor_ts, AuditLog.id < before_id),
+        ))
     
-    query = select(AuditLog).where(AuditLog.lead_id == lead_id).order_by(AuditLog.timestamp.desc())
+    query = query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
     
     if limit:
         query = query.limit(limit)
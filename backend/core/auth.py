@@ -3,10 +3,13 @@ Framework-agnostic authentication utilities.
 JWT encoding/decoding and password hashing.
 """
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+import hashlib
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,6 +18,19 @@ SECRET_KEY = os.getenv("SECRET_KEY", "unsafe_secret_key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
+# Verified tokens -> (email, user_id, role, expires_at), keyed by SHA-256 of the token (never the raw token).
+# forget_user_tokens clears this worker only; other workers keep the cached role (used by the
+# observer write guard) for up to _TOKEN_CACHE_TTL after a user change (see SETUP.md).
+_TOKEN_CACHE: Dict[bytes, Tuple[str, int, Optional[str], float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_TTL = 30  # seconds
+_TOKEN_CACHE_MAX_SIZE = 10000
+
+# Verified JWT payloads -> (payload, exp), keyed by BLAKE2b of the token. Valid signatures stay valid
+# until exp, so these outlive _TOKEN_CACHE entries (which are dropped on user changes).
+_DECODE_CACHE: Dict[bytes, Tuple[Dict, float]] = {}
+_DECODE_CACHE_LOCK = threading.Lock()
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Bcrypt has a 72-BYTE limit (not characters). Truncate by bytes to avoid ValueError in production.
@@ -51,12 +67,29 @@ def create_access_token(data: Dict) -> str:
 
 
 def decode_access_token(token: str) -> Optional[Dict]:
-    """Decode a JWT access token. Returns None if invalid."""
+    """Decode a JWT access token. Returns None if invalid. Successful decodes are cached until exp."""
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    with _DECODE_CACHE_LOCK:
+        entry = _DECODE_CACHE.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                return dict(entry[0])
+            del _DECODE_CACHE[key]
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)) and exp > now:
+        with _DECODE_CACHE_LOCK:
+            if len(_DECODE_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                for k in [k for k, v in _DECODE_CACHE.items() if v[1] <= now]:
+                    del _DECODE_CACHE[k]
+                if len(_DECODE_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                    _DECODE_CACHE.clear()
+            _DECODE_CACHE[key] = (dict(payload), float(exp))
+    return payload
 
 
 def get_user_email_from_token(token: str) -> Optional[str]:
@@ -66,3 +99,57 @@ def get_user_email_from_token(token: str) -> Optional[str]:
         return payload.get("sub")
     return None
 
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _get_cached_token_entry(token: str) -> Optional[Tuple[str, int, Optional[str], float]]:
+    key = _token_key(token)
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[3] <= time.time():
+            del _TOKEN_CACHE[key]
+            return None
+        return entry
+
+
+def get_cached_token_identity(token: str) -> Optional[Tuple[str, int]]:
+    """Return (email, user_id) for a recently verified token, or None on miss/expiry."""
+    entry = _get_cached_token_entry(token)
+    return (entry[0], entry[1]) if entry else None
+
+
+def get_cached_token_role(token: str) -> Optional[str]:
+    """Return the user's role for a recently verified token, or None on miss/expiry."""
+    entry = _get_cached_token_entry(token)
+    return entry[2] if entry else None
+
+
+def cache_token_identity(
+    token: str, email: str, user_id: int, exp: Optional[float] = None, role: Optional[str] = None
+) -> None:
+    """Cache a verified token's identity (and role) for at most _TOKEN_CACHE_TTL seconds, capped by the token's exp."""
+    now = time.time()
+    expires_at = now + _TOKEN_CACHE_TTL
+    if exp is not None:
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+    with _TOKEN_CACHE_LOCK:
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+            for k in [k for k, v in _TOKEN_CACHE.items() if v[3] <= now]:
+                del _TOKEN_CACHE[k]
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[_token_key(token)] = (email, user_id, role, expires_at)
+
+
+def forget_user_tokens(user_id: int) -> None:
+    """Drop cached token entries for a user (call after role/active changes so they apply immediately)."""
+    with _TOKEN_CACHE_LOCK:
+        for k in [k for k, v in _TOKEN_CACHE.items() if v[1] == user_id]:
+            del _TOKEN_CACHE[k]
@@ -3,9 +3,24 @@ Batch management business logic.
 Framework-agnostic batch operations.
 """
 from sqlmodel import Session, select, func
-from typing import List, Optional, Tuple
-from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, timedelta
 from backend.models import Batch, BatchCoachLink, User, Center, Lead, StudentBatchLink
+from backend.core.ttl_cache import TTLCache
+
+# Coach dashboards poll /batches/my-batches: each coach's serialized batches, cleared on any batch/coach write
+_COACH_BATCHES_CACHE: TTLCache[List[Dict[str, Any]]] = TTLCache(timedelta(seconds=30))
+
+
+def invalidate_batch_caches() -> None:
+    """Drop cached batch views (call after any batch or coach-assignment write)."""
+    from backend.core.reactivations import invalidate_reactivations_cache
+    from backend.core.public_preferences import invalidate_lead_preferences_cache
+    from backend.core.users import invalidate_coach_batch_ids_cache
+    _COACH_BATCHES_CACHE.clear()
+    invalidate_coach_batch_ids_cache()
+    invalidate_reactivations_cache()
+    invalidate_lead_preferences_cache()  # Preference pages list the center's active batches
 
 
 def get_all_batches(
@@ -68,6 +83,35 @@ def get_batch_coaches(
     return list(coaches)
 
 
+def get_coaches_for_batches(
+    db: Session,
+    batch_ids: List[int]
+) -> Dict[int, List[User]]:
+    """
+    Get coaches for many batches in one JOIN query (avoids a get_batch_coaches call per batch).
+    
+    Args:
+        db: Database session
+        batch_ids: Batch IDs
+        
+    Returns:
+        Dict of batch_id -> list of User objects (coaches); batches without coaches are absent
+    """
+    if not batch_ids:
+        return {}
+    
+    rows = db.exec(
+        select(BatchCoachLink.batch_id, User)
+        .join(User, User.id == BatchCoachLink.user_id)
+        .where(BatchCoachLink.batch_id.in_(batch_ids))
+    ).all()
+    
+    coaches_by_batch: Dict[int, List[User]] = {}
+    for batch_id, coach in rows:
+        coaches_by_batch.setdefault(batch_id, []).append(coach)
+    return coaches_by_batch
+
+
 def assign_coaches_to_batch(
     db: Session,
     batch_id: int,
@@ -115,6 +159,7 @@ def assign_coaches_to_batch(
         new_assignments.append(assignment)
     
     db.commit()
+    invalidate_batch_caches()
     
     # Refresh all assignments
     for assignment in new_assignments:
@@ -226,6 +271,7 @@ def create_batch(
         db.commit()
         db.refresh(batch)
     
+    invalidate_batch_caches()
     return batch
 
 
@@ -282,6 +328,7 @@ def assign_coach_to_batch(
     db.commit()
     db.refresh(assignment)
     
+    invalidate_batch_caches()
     return assignment
 
 
@@ -317,6 +364,14 @@ def get_coach_batches(
     return list(batches)
 
 
+def get_coach_batches_cached(
+    db: Session,
+    user_id: int
+) -> List[Dict[str, Any]]:
+    """Serialized get_coach_batches, served from a 30s in-process cache per coach."""
+    return _COACH_BATCHES_CACHE.get_or_load(user_id, lambda: [b.model_dump() for b in get_coach_batches(db, user_id)])
+
+
 def update_batch(
     db: Session,
     batch_id: int,
@@ -444,6 +499,7 @@ def update_batch(
     db.commit()
     db.refresh(batch)
     
+    invalidate_batch_caches()
     return batch
 
 
@@ -503,6 +559,7 @@ def delete_batch(
     db.delete(batch)
     db.commit()
     
+    invalidate_batch_caches()
     return True
 
 
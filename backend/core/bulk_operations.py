@@ -3,54 +3,94 @@ Bulk operations for leads.
 Framework-agnostic bulk update utilities.
 """
 from sqlmodel import Session, select
-from typing import List, Optional
+from sqlalchemy import update
+from typing import Dict, List, Optional
 from datetime import datetime
 from backend.models import Lead, User
-from backend.core.audit import log_status_change, log_field_update
+from backend.core.audit import status_change_entry, field_update_entry, log_lead_activities_bulk
+from backend.core.users import get_user_center_ids
+
+
+def _load_accessible_leads(db: Session, lead_ids: List[int], user: User) -> Dict[int, Lead]:
+    """
+    Fetch the requested leads the user may access in one query (team leads: all, others: their centers).
+    Returns {lead_id: Lead}; missing or inaccessible IDs are absent.
+    """
+    query = select(Lead).where(Lead.id.in_(lead_ids))
+    if user.role != "team_lead":
+        user_center_ids = get_user_center_ids(user)
+        if not user_center_ids:
+            return {}
+        query = query.where(Lead.center_id.in_(user_center_ids))
+    return {lead.id: lead for lead in db.exec(query).all()}
+
+
+def _apply_bulk_update(db: Session, lead_ids: List[int], values: dict, audit_entries: List[dict]) -> Optional[str]:
+    """
+    One UPDATE ... WHERE id IN (...) plus one multi-row audit log INSERT, committed together.
+    Returns an error message (after rolling back) instead of raising.
+    """
+    if not lead_ids:
+        return None
+    try:
+        db.execute(
+            update(Lead).where(Lead.id.in_(lead_ids)).values(**values, last_updated=datetime.utcnow())
+        )
+        log_lead_activities_bulk(db, audit_entries)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        return f"Error updating leads: {str(e)}"
+    return None
+
+
+def _inaccessible_result(lead_ids: List[int], leads_by_id: Dict[int, Lead]) -> dict:
+    return {
+        "updated_count": 0,
+        "errors": ["Some leads are not accessible or not found"],
+        "accessible_lead_ids": [lead_id for lead_id in lead_ids if lead_id in leads_by_id],
+    }
 
 
 def bulk_update_lead_status(
     db: Session,
     lead_ids: List[int],
     new_status: str,
-    user_id: int
+    user: User
 ) -> dict:
     """
     Bulk update status for multiple leads.
+    Access check and fetch happen in a single query; if any lead is not accessible
+    to a non-team-lead user, nothing is updated.
     
     Args:
         db: Database session
         lead_ids: List of lead IDs to update
         new_status: New status to set
-        user_id: User ID performing the update
+        user: User performing the update
         
     Returns:
         Dictionary with count of updated leads and any errors
+        (plus accessible_lead_ids when the access check fails)
     """
-    updated_count = 0
-    errors = []
+    leads_by_id = _load_accessible_leads(db, lead_ids, user)
+    if user.role != "team_lead" and len(leads_by_id) != len(lead_ids):
+        return _inaccessible_result(lead_ids, leads_by_id)
     
-    for lead_id in lead_ids:
-        try:
-            lead = db.get(Lead, lead_id)
-            if not lead:
-                errors.append(f"Lead {lead_id} not found")
-                continue
-            
-            old_status = lead.status
-            if old_status != new_status:
-                lead.status = new_status
-                lead.last_updated = datetime.utcnow()
-                db.add(lead)
-                
-                # Log the change
-                log_status_change(db, lead_id, user_id, old_status, new_status)
-                updated_count += 1
-        except Exception as e:
-            errors.append(f"Error updating lead {lead_id}: {str(e)}")
+    errors = [f"Lead {lead_id} not found" for lead_id in lead_ids if lead_id not in leads_by_id]
+    changed = [lead for lead in leads_by_id.values() if lead.status != new_status]
     
-    if updated_count > 0:
-        db.commit()
+    # Single UPDATE + single audit INSERT instead of a commit per lead
+    error = _apply_bulk_update(
+        db,
+        [lead.id for lead in changed],
+        {"status": new_status},
+        [status_change_entry(lead.id, user.id, lead.status, new_status) for lead in changed],
+    )
+    updated_count = len(changed)
+    if error:
+        errors.append(error)
+        updated_count = 0
     
     return {
         "updated_count": updated_count,
@@ -62,7 +102,7 @@ def bulk_update_lead_assignment(
     db: Session,
     lead_ids: List[int],
     new_center_id: int,
-    user_id: int
+    user: User
 ) -> dict:
     """
     Bulk update center assignment for multiple leads.
@@ -72,7 +112,7 @@ def bulk_update_lead_assignment(
         db: Database session
         lead_ids: List of lead IDs to update
         new_center_id: New center ID to assign
-        user_id: User ID performing the update (must be team_lead)
+        user: User performing the update (must be team_lead)
         
     Returns:
         Dictionary with count of updated leads and any errors
@@ -87,74 +127,34 @@ def bulk_update_lead_assignment(
             "errors": [f"Center {new_center_id} not found"]
         }
     
-    updated_count = 0
-    errors = []
+    leads_by_id = _load_accessible_leads(db, lead_ids, user)
+    if user.role != "team_lead" and len(leads_by_id) != len(lead_ids):
+        return _inaccessible_result(lead_ids, leads_by_id)
     
-    for lead_id in lead_ids:
-        try:
-            lead = db.get(Lead, lead_id)
-            if not lead:
-                errors.append(f"Lead {lead_id} not found")
-                continue
-            
-            old_center_id = lead.center_id
-            if old_center_id != new_center_id:
-                lead.center_id = new_center_id
-                lead.last_updated = datetime.utcnow()
-                db.add(lead)
-                
-                # Log the change
-                log_field_update(
-                    db, lead_id, user_id,
-                    'center_id',
-                    str(old_center_id) if old_center_id else None,
-                    str(new_center_id)
-                )
-                updated_count += 1
-        except Exception as e:
-            errors.append(f"Error updating lead {lead_id}: {str(e)}")
+    errors = [f"Lead {lead_id} not found" for lead_id in lead_ids if lead_id not in leads_by_id]
+    changed = [lead for lead in leads_by_id.values() if lead.center_id != new_center_id]
     
-    if updated_count > 0:
-        db.commit()
+    # Single UPDATE + single audit INSERT instead of a commit per lead
+    error = _apply_bulk_update(
+        db,
+        [lead.id for lead in changed],
+        {"center_id": new_center_id},
+        [
+            field_update_entry(
+                lead.id, user.id,
+                'center_id',
+                str(lead.center_id) if lead.center_id else None,
+                str(new_center_id)
+            )
+            for lead in changed
+        ],
+    )
+    updated_count = len(changed)
+    if error:
+        errors.append(error)
+        updated_count = 0
     
     return {
         "updated_count": updated_count,
         "errors": errors
     }
-
-
-def verify_leads_accessible(
-    db: Session,
-    lead_ids: List[int],
-    user: User
-) -> List[int]:
-    """
-    Verify that the user has access to all requested leads.
-    Returns list of accessible lead IDs.
-    
-    Args:
-        db: Database session
-        lead_ids: List of lead IDs to check
-        user: User object
-        
-    Returns:
-        List of lead IDs that user has access to
-    """
-    if user.role == "team_lead":
-        # Team leads can access all leads
-        return lead_ids
-    
-    # Other users can only access leads from their assigned centers
-    user_center_ids = [c.id for c in user.centers]
-    if not user_center_ids:
-        return []
-    
-    accessible_leads = db.exec(
-        select(Lead).where(
-            Lead.id.in_(lead_ids),
-            Lead.center_id.in_(user_center_ids)
-        )
-    ).all()
-    
-    return [lead.id for lead in accessible_leads]
-
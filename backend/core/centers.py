@@ -3,8 +3,13 @@ Center management business logic.
 Framework-agnostic center CRUD operations.
 """
 from sqlmodel import Session, select
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import timedelta
 from backend.models import Center
+from backend.core.ttl_cache import TTLCache
+
+# Centers rarely change: the serialized list, cleared on create/update
+_CENTERS_CACHE: TTLCache[Tuple[Dict[str, Any], ...]] = TTLCache(timedelta(seconds=60))
 
 
 def get_all_centers(db: Session) -> List[Center]:
@@ -12,6 +17,29 @@ def get_all_centers(db: Session) -> List[Center]:
     return list(db.exec(select(Center)).all())
 
 
+def _get_centers_snapshot(db: Session) -> Tuple[Dict[str, Any], ...]:
+    """The cached centers (shared; callers must not mutate)."""
+    return _CENTERS_CACHE.get_or_load("all", lambda: tuple(c.model_dump() for c in get_all_centers(db)))
+
+
+def get_all_centers_cached(db: Session) -> List[Dict[str, Any]]:
+    """Get all centers as plain dicts (fresh copies), served from a 60s in-process cache."""
+    return [dict(c) for c in _get_centers_snapshot(db)]
+
+
+def get_center_cached(db: Session, center_id: int) -> Optional[Dict[str, Any]]:
+    """Look up one center (as a dict) from the cached list; None if it does not exist."""
+    for center in _get_centers_snapshot(db):
+        if center["id"] == center_id:
+            return dict(center)
+    return None
+
+
+def invalidate_centers_cache() -> None:
+    """Drop the cached center list (call after any center write)."""
+    _CENTERS_CACHE.clear()
+
+
 def get_center_by_id(db: Session, center_id: int) -> Optional[Center]:
     """Get a center by ID."""
     return db.get(Center, center_id)
@@ -65,6 +93,7 @@ def create_center(
     db.add(new_center)
     db.commit()
     db.refresh(new_center)
+    invalidate_centers_cache()
     return new_center
 
 
@@ -122,5 +151,6 @@ def update_center(
     db.add(center)
     db.commit()
     db.refresh(center)
+    invalidate_centers_cache()
     return center
 
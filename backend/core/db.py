@@ -29,22 +29,75 @@ if "user:password" in DATABASE_URL or ":port" in DATABASE_URL or "/database" in
         "Please set actual database credentials in your .env file."
     )
 
+# Connection pool sizing (also used to size the request threadpool in fastapi_app).
+# Override via env for larger deployments; keep pool_size + max_overflow within the DB's connection limit.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Connections opened at startup so the first requests after a cold start skip connect/TLS setup (0 = off)
+POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "4"))
+
+# SQLite (local dev) connections are shared across the threadpool
+connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+
 # Create engine with connection pool settings for Supabase pooler (port 6543) and serverless (e.g. Cloud Run)
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # Most important for Cloud Run: verify connections before use (handles stale/disconnected)
-    pool_recycle=3600,   # Recycle connections after 1 hour
-    pool_size=5,
-    max_overflow=10,
+    pool_use_lifo=True,  # Reuse the most recently returned connection so surplus ones idle out (pooler can reap them)
+    pool_recycle=POOL_RECYCLE,  # Recycle connections before server/pooler idle timeouts
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,  # Seconds to wait for a free connection before raising
+    connect_args=connect_args,
 )
 
 
+# Optional read replica for read-only endpoints. Autocommit: plain SELECTs need no
+# BEGIN/COMMIT round-trips. Unset -> read endpoints use the primary request session.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+if DATABASE_READ_URL and DATABASE_READ_URL.startswith("postgres://"):
+    DATABASE_READ_URL = DATABASE_READ_URL.replace("postgres://", "postgresql://", 1)
+
+read_engine = create_engine(
+    DATABASE_READ_URL,
+    isolation_level="AUTOCOMMIT",
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+    pool_recycle=POOL_RECYCLE,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    connect_args={"check_same_thread": False} if DATABASE_READ_URL.startswith("sqlite") else {},
+) if DATABASE_READ_URL else None
+
+
 def get_session() -> Generator[Session, None, None]:
-    """Get a database session. Use as context manager or generator."""
+    """
+    Get a database session. Use as context manager or generator.
+    As a FastAPI dependency it is resolved once per request (dependency cache), so auth, role checks
+    and the endpoint share this session; it checks out a pooled connection only on its first query
+    and returns it when the request finishes.
+    """
     with Session(engine) as session:
         yield session
 
 
+def prewarm_pool(target_engine, count: int = POOL_PREWARM) -> None:
+    """Open up to `count` pooled connections and return them to the pool, ready for the first requests."""
+    connections = []
+    try:
+        for _ in range(min(count, POOL_SIZE)):
+            connections.append(target_engine.connect())
+    except Exception as e:
+        # Not fatal: requests will simply connect on demand
+        print(f"Note: Could not prewarm connection pool: {e}")
+    finally:
+        for connection in connections:
+            connection.close()
+
+
 def get_session_sync() -> Session:
     """Get a synchronous database session."""
     return Session(engine)
@@ -52,11 +105,13 @@ def get_session_sync() -> Session:
 
 def create_db_and_tables():
     """Create database tables if they don't exist."""
-    SQLModel.metadata.create_all(engine)
+    from sqlalchemy import text, inspect
+    # Warm database: one table-list query instead of create_all's per-table existence checks
+    if not set(SQLModel.metadata.tables).issubset(inspect(engine).get_table_names()):
+        SQLModel.metadata.create_all(engine)
     
     # Create composite index on AuditLog for performance
     # This index optimizes queries filtering by lead_id and ordering by timestamp
-    from sqlalchemy import text, inspect
     inspector = inspect(engine)
     
     try:
@@ -387,15 +387,15 @@ def send_welcome_email(db: Session, student_id: int) -> dict:
     Fetches student, lead, batches, and center; builds HTML and sends via Zoho SMTP.
     Returns dict with success flag and recipient email.
     """
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import joinedload, selectinload
 
     stmt = (
         select(Student)
         .where(Student.id == student_id)
         .options(
-            selectinload(Student.lead),
+            joinedload(Student.lead),
             selectinload(Student.batches),
-            selectinload(Student.center),
+            joinedload(Student.center),
         )
     )
     student = db.exec(stmt).first()
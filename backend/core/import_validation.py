@@ -2,12 +2,115 @@
 Import validation and preview functionality.
 Framework-agnostic validation utilities for lead imports.
 """
+import codecs
+import csv
 import re
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import BinaryIO, List, Dict, Optional, Tuple
 import pandas as pd
 from datetime import datetime
 from backend.models import Center
 
+# Byte-order marks -> encoding. Meta Ads CSV exports are usually UTF-16 with a BOM.
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# Checked in order when the file has no BOM (latin1 never fails to decode)
+_FALLBACK_ENCODINGS = ("utf-8", "cp1252", "latin1")
+# Encodings charset-normalizer may pick from a sample: the fallbacks plus BOM-less UTF-16.
+# Restricted on purpose; unrestricted detection mislabels short Windows-1252 files (e.g. as cp1250).
+_DETECT_CANDIDATES = ["utf_8", "utf_16_le", "utf_16_be", "cp1252", "latin_1"]
+_DETECT_SAMPLE_BYTES = 1 << 16
+_SNIFF_SAMPLE_BYTES = 8192
+_SNIFF_DELIMITERS = ",\t;|"
+
+# Optional faster Excel parser (Rust calamine reader). Used when installed; otherwise openpyxl.
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+try:
+    from charset_normalizer import from_bytes as _detect_charset  # installed with requests
+except ImportError:
+    _detect_charset = None
+
+
+def _decodes_cleanly(fileobj: BinaryIO, encoding: str) -> bool:
+    """Strictly decode the whole file in chunks (no DataFrame built) and rewind."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        for chunk in iter(lambda: fileobj.read(1 << 16), b""):
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+    finally:
+        fileobj.seek(0)
+
+
+def detect_csv_encoding(fileobj: BinaryIO) -> str:
+    """
+    Pick the encoding up front so pandas parses the file exactly once:
+    BOM first, then strict UTF-8 over the whole file, then charset-normalizer's guess from a
+    sample (when installed and the whole file decodes with it), otherwise the first fallback
+    that decodes cleanly.
+    """
+    sample = fileobj.read(_DETECT_SAMPLE_BYTES)
+    fileobj.seek(0)
+    for bom, encoding in _BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    # Valid UTF-8 wins over any guess (a sample cut mid-character can look like cp1252).
+    # NUL bytes mean BOM-less UTF-16, which also "decodes" as UTF-8; leave that to the guess.
+    if b"\x00" not in sample and _decodes_cleanly(fileobj, "utf-8"):
+        return "utf-8"
+    if _detect_charset is not None:
+        best = _detect_charset(sample, cp_isolation=_DETECT_CANDIDATES).best()
+        if best is not None and _decodes_cleanly(fileobj, best.encoding):
+            return best.encoding
+    for encoding in _FALLBACK_ENCODINGS[:-1]:
+        if _decodes_cleanly(fileobj, encoding):
+            return encoding
+    return _FALLBACK_ENCODINGS[-1]
+
+
+def sniff_csv_delimiter(fileobj: BinaryIO, encoding: str) -> str:
+    """Sniff the delimiter from the first few KB (one pass) and rewind. Defaults to ','."""
+    sample = fileobj.read(_SNIFF_SAMPLE_BYTES).decode(encoding, errors="ignore")
+    fileobj.seek(0)
+    # Drop the last (possibly truncated) line so the sniffer sees complete rows
+    if "\n" in sample:
+        sample = sample[:sample.rindex("\n")]
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def read_import_file(fileobj: BinaryIO, file_extension: str) -> Tuple[pd.DataFrame, Optional[str]]:
+    """
+    Parse an uploaded CSV/XLSX straight from its file object (no extra in-memory copy).
+    Returns (dataframe, encoding used or None for Excel). Raises ValueError if undecodable.
+    """
+    if file_extension in ['xlsx', 'xls']:
+        return pd.read_excel(fileobj, engine=_EXCEL_ENGINE), None
+
+    enc = detect_csv_encoding(fileobj)
+    try:
+        delimiter = sniff_csv_delimiter(fileobj, enc)
+        try:
+            # C engine + dtype=str: fast path, and values are re-validated per row anyway
+            return pd.read_csv(fileobj, encoding=enc, sep=delimiter, engine='c', dtype=str), enc
+        except pd.errors.ParserError:
+            fileobj.seek(0)
+            return pd.read_csv(fileobj, encoding=enc, sep=None, engine='python', dtype=str), enc
+    except UnicodeError:
+        raise ValueError("Could not decode CSV file. Please try saving the file as 'CSV UTF-8'.")
+
 def parse_date_of_birth(val) -> "Optional[date]":
     """Parse DOB from various formats. Returns date or None."""
     from datetime import date as date_type
@@ -19,6 +122,24 @@ def parse_date_of_birth(val) -> "Optional[date]":
     except Exception:
         return None
 
+def parse_date_of_birth_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_date_of_birth for a whole column: one pd.to_datetime pass instead of per-row calls.
+    Returns a Series of date objects (None where missing/unparseable), aligned with the input index.
+    """
+    parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+    return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+def column_looks_like_dates(values: pd.Series, sample_size: int = 20) -> bool:
+    """
+    Probe the first few non-empty values with a coercing parse (no exception control flow).
+    Majority vote, so one stray date-like cell doesn't turn an age-category column (U10, ...) into DOBs.
+    """
+    sample = values.dropna().head(sample_size)
+    if sample.empty:
+        return True
+    return bool(pd.to_datetime(sample, errors="coerce", format="mixed").notna().mean() > 0.5)
+
 def validate_lead_row(
     row: pd.Series,
     column_mapping: Dict[str, str],
@@ -82,6 +203,10 @@ def preview_import_data(
     invalid_rows = []
     total_errors = 0
     
+    # Parse the DOB column once up front rather than per row
+    dob_col = column_mapping.get('date_of_birth')
+    dob_dates = parse_date_of_birth_series(df[dob_col]) if dob_col in df.columns else None
+    
     for idx, row in df.iterrows():
         is_valid, errors = validate_lead_row(row, column_mapping, known_centers, idx)
         
@@ -92,7 +217,7 @@ def preview_import_data(
             
             # Map to date_of_birth for display
             if system_col == 'date_of_birth' and user_col:
-                dob = parse_date_of_birth(raw_val)
+                dob = dob_dates.at[idx] if dob_dates is not None else None
                 display_data[system_col] = dob.isoformat() if dob else ""
             else:
                 display_data[system_col] = str(raw_val) if pd.notna(raw_val) else ""
@@ -125,34 +250,39 @@ def preview_import_data(
         }
     }
 
-def auto_detect_column_mapping(df: pd.DataFrame) -> Dict[str, str]:
-    """
-    Automatically detect column mapping, handling Meta Ads specific symbols and questions.
-    """
-    mapping = {}
-    csv_cols = df.columns.tolist()
-
-    # Define patterns based on your specific Meta Ads CSV structure
-    patterns = {
+# Define patterns based on your specific Meta Ads CSV structure (compiled once per system column)
+_COLUMN_PATTERNS = {
+    system_key: [re.compile(kw) for kw in keywords]
+    for system_key, keywords in {
         'player_name': [r'player_name', r'player name'r' _player_name'],
         'phone': [r'contact_number', r'phone', r'mobile', r'contact'],
         'email': [r'email'],
         'center': [r'nearest_tofa_center', r'center', r'which_is_the_nearest'],
         'date_of_birth': [r'player_date_of_birth', r'dob', r'age', r'date_of_birth', r'category'],
         'address_and_pincode': [r'address_&_pincode', r'address', r'pincode']
-    }
+    }.items()
+}
+# Removes characters like ,  and extra spaces
+_HEADER_JUNK = re.compile(r'[^\w\s\?]')
 
-    def clean_header(header: str) -> str:
-        # Removes characters like ,  and extra spaces
-        cleaned = re.sub(r'[^\w\s\?]', '', header)
-        return cleaned.lower().strip()
 
-    for system_key, keywords in patterns.items():
-        for col in csv_cols:
-            cleaned_col = clean_header(col)
+@lru_cache(maxsize=128)
+def _detect_column_mapping(columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Column mapping for a header tuple. Memoized: Meta Ads exports repeat a handful of header shapes."""
+    cleaned = [(col, _HEADER_JUNK.sub('', col).lower().strip()) for col in columns]
+    mapping = {}
+    for system_key, keywords in _COLUMN_PATTERNS.items():
+        for col, cleaned_col in cleaned:
             # Check if any keyword appears in the cleaned column header
-            if any(re.search(kw, cleaned_col) for kw in keywords):
+            if any(kw.search(cleaned_col) for kw in keywords):
                 mapping[system_key] = col
                 break
-                
-    return mapping
\ No newline at end of file
+    return mapping
+
+
+def auto_detect_column_mapping(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Automatically detect column mapping, handling Meta Ads specific symbols and questions.
+    """
+    # Copy: callers may adjust the mapping, the memoized one must stay intact
+    return dict(_detect_column_mapping(tuple(df.columns)))
\ No newline at end of file
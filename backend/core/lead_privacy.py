@@ -1,33 +1,32 @@
 """
 Privacy and field masking utilities for leads.
 """
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from backend.models import Lead
 
 
+def format_datetime(dt: Optional[datetime]) -> Optional[str]:
+    """
+    Format datetime to ISO string, with a 'Z' suffix for UTC (Zod prefers this format).
+    Naive datetimes (what the DB returns) are UTC: fast path without building an aware copy.
+    """
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.isoformat() + "Z"
+    iso_str = dt.isoformat()
+    if dt.tzinfo == timezone.utc and not iso_str.endswith('Z'):
+        # Replace +00:00 with Z for better Zod compatibility
+        iso_str = iso_str.replace('+00:00', 'Z')
+    return iso_str
+
+
 def mask_lead_for_coach(lead: Lead) -> Dict[str, Any]:
     """
     Convert a Lead model to a dictionary with sensitive fields masked for coaches.
     Returns a dict suitable for JSON serialization with phone, email, and address hidden.
     """
-    from datetime import datetime, timezone
-    from typing import Optional
-    
-    def format_datetime(dt: Optional[datetime]) -> Optional[str]:
-        """Format datetime to ISO string with timezone if needed."""
-        if dt is None:
-            return None
-        # If datetime is naive (no timezone), assume it's UTC and make it timezone-aware
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        # Return ISO format with 'Z' suffix for UTC (more compatible with Zod)
-        iso_str = dt.isoformat()
-        # Ensure it ends with 'Z' if it's UTC (Zod prefers this format)
-        if dt.tzinfo == timezone.utc and not iso_str.endswith('Z'):
-            # Replace +00:00 with Z for better Zod compatibility
-            iso_str = iso_str.replace('+00:00', 'Z')
-        return iso_str
-    
     lead_dict = {
         "id": lead.id,
         "created_time": format_datetime(lead.created_time),
@@ -69,23 +68,6 @@ def serialize_leads_for_user(leads: List[Lead], user_role: str) -> List[Dict[str
     Returns:
         List of dictionaries suitable for JSON serialization
     """
-    from datetime import datetime, timezone
-    
-    def format_datetime(dt: Optional[datetime]) -> Optional[str]:
-        """Format datetime to ISO string with timezone if needed."""
-        if dt is None:
-            return None
-        # If datetime is naive (no timezone), assume it's UTC and make it timezone-aware
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        # Return ISO format with 'Z' suffix for UTC (more compatible with Zod)
-        iso_str = dt.isoformat()
-        # Ensure it ends with 'Z' if it's UTC (Zod prefers this format)
-        if dt.tzinfo == timezone.utc and not iso_str.endswith('Z'):
-            # Replace +00:00 with Z for better Zod compatibility
-            iso_str = iso_str.replace('+00:00', 'Z')
-        return iso_str
-    
     if user_role == "coach":
         return [mask_lead_for_coach(lead) for lead in leads]
     else:
@@ -5,15 +5,20 @@ Framework-agnostic lead CRUD operations.
 import logging
 from sqlmodel import Session, select, func
 from typing import List, Optional, Tuple
-from datetime import datetime, date
-from backend.models import Lead, Center, Comment, User, BatchCoachLink, Batch, StudentBatchLink, Student
-from sqlalchemy import or_
+from datetime import datetime, date, timedelta
+from backend.models import Lead, Center, Comment, User, BatchCoachLink, Batch, StudentBatchLink, Student, UserCenterLink
+from backend.core.users import get_user_center_ids
+from sqlalchemy import or_, exists
 import pandas as pd
 import uuid
 
 logger = logging.getLogger(__name__)
 
 
+# Default subscription length per plan, used when an end date isn't given
+SUBSCRIPTION_PLAN_DAYS = {"Monthly": 30, "Quarterly": 90, "6 Months": 180, "Yearly": 365}
+
+
 def get_leads_for_user(
     db: Session, 
     user: User,
@@ -50,14 +55,8 @@ def get_leads_for_user(
         count_query = select(func.count()).select_from(Lead)
     elif user.role == "coach":
         # Coaches only see leads in their assigned batches
-        # Get batch IDs assigned to this coach
-        batch_assignments = db.exec(
-            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
-        ).all()
-        batch_ids = list(batch_assignments)
-        
-        if not batch_ids:
-            return [], 0
+        # Coach's batch IDs as a subquery: resolved inside the lead/count queries, no extra round trip
+        batch_ids = select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
         
         # Filter leads where trial_batch_id or permanent_batch_id matches coach's batches
         query = select(Lead).where(
@@ -74,7 +73,7 @@ def get_leads_for_user(
         )
     else:
         # Regular users see leads from their assigned centers
-        center_ids = [c.id for c in user.centers]
+        center_ids = get_user_center_ids(user)
         if not center_ids:
             return [], 0
         query = select(Lead).where(Lead.center_id.in_(center_ids))
@@ -97,7 +96,7 @@ def get_leads_for_user(
     # Filter by next_follow_up_date (exact date match)
     if next_follow_up_date_filter:
         try:
-            filter_date = datetime.fromisoformat(next_follow_up_date_filter).date()
+            filter_date = date.fromisoformat(next_follow_up_date_filter)
             date_start = datetime.combine(filter_date, datetime.min.time())
             date_end = datetime.combine(filter_date, datetime.max.time())
             query = query.where(
@@ -178,8 +177,8 @@ def get_leads_for_user(
     if limit is not None:
         query = query.limit(limit).offset(offset)
     
-    # Note: student_batches relationship moved to Student model
-    # No need to eager load it for Lead queries
+    # No eager loading: serialize_leads_for_user only reads Lead columns, never relationships
+    # (student_batches moved to the Student model), so selectinload would only add queries.
     
     leads = list(db.exec(query).all())
     return leads, total
@@ -196,6 +195,62 @@ def get_lead_by_id(db: Session, lead_id: int) -> Optional[Lead]:
     return result
 
 
+def get_lead_with_access(db: Session, lead_id: int, user: User) -> Tuple[Optional[Lead], bool]:
+    """
+    Fetch a lead and whether the user's centers grant access to it, in a single query.
+    Team leads always have access.
+    
+    Returns:
+        Tuple of (lead or None if not found, has_center_access)
+    """
+    if user.role == "team_lead":
+        return db.get(Lead, lead_id), True
+    
+    in_user_centers = exists().where(
+        UserCenterLink.user_id == user.id,
+        UserCenterLink.center_id == Lead.center_id,
+    )
+    row = db.exec(select(Lead, in_user_centers).where(Lead.id == lead_id)).first()
+    if row is None:
+        return None, False
+    lead, has_access = row
+    return lead, bool(has_access)
+
+
+def lead_access_condition(user: User, lead_id: int):
+    """
+    EXISTS clause that is true when the lead is visible to the user (same rules as
+    get_leads_for_user), for embedding in larger queries. None for team leads (all leads).
+    """
+    if user.role == "team_lead":
+        return None
+    if user.role == "coach":
+        return exists().where(
+            Lead.id == lead_id,
+            BatchCoachLink.user_id == user.id,
+            or_(
+                BatchCoachLink.batch_id == Lead.trial_batch_id,
+                BatchCoachLink.batch_id == Lead.permanent_batch_id,
+            ),
+        )
+    return exists().where(
+        Lead.id == lead_id,
+        UserCenterLink.user_id == user.id,
+        UserCenterLink.center_id == Lead.center_id,
+    )
+
+
+def user_has_access_to_lead(db: Session, user: User, lead_id: int) -> bool:
+    """
+    Whether the lead is visible to the user, as a single EXISTS query
+    (same rules as get_leads_for_user, without loading any leads).
+    """
+    condition = lead_access_condition(user, lead_id)
+    if condition is None:
+        return True
+    return bool(db.exec(select(condition)).one())
+
+
 def update_lead(
     db: Session,
     lead_id: int,
@@ -211,6 +266,9 @@ def update_lead(
     call_confirmation_note: Optional[str] = None,  # Note confirming call with parent
     loss_reason: Optional[str] = None,  # Reason for loss (off-ramp: Nurture/Dead)
     loss_reason_notes: Optional[str] = None,  # Details when reason is 'Other'
+    subscription_plan: Optional[str] = None,  # Applied to the lead's Student record, if any
+    subscription_start_date: Optional[date] = None,
+    subscription_end_date: Optional[date] = None,
 ) -> Lead:
     """
     Update a lead's status and optionally add a comment.
@@ -224,6 +282,9 @@ def update_lead(
         comment: Optional comment text
         user_id: User ID for the comment (if comment is provided)
         date_of_birth: Optional new date of birth
+        subscription_plan / subscription_start_date / subscription_end_date: Optional subscription
+            changes for a joined lead's Student record, saved in the same commit. The end date is
+            derived from the plan when not given.
         
     Returns:
         Updated Lead object
@@ -601,6 +662,25 @@ def update_lead(
                 call_confirmation_note
             )
     
+    # Update subscription (lives on the Student record once the lead has joined)
+    if subscription_plan is not None or subscription_start_date is not None or subscription_end_date is not None:
+        student = lead.student
+        if student is None:
+            logger.info("Ignoring subscription update for lead %s: no student record", lead_id)
+        else:
+            if subscription_plan is not None:
+                student.subscription_plan = subscription_plan
+            if subscription_start_date is not None:
+                student.subscription_start_date = subscription_start_date
+            plan_days = SUBSCRIPTION_PLAN_DAYS.get(subscription_plan)
+            if subscription_end_date is not None:
+                student.subscription_end_date = subscription_end_date
+            elif plan_days and student.subscription_start_date and (
+                subscription_start_date is not None or not student.subscription_end_date
+            ):
+                student.subscription_end_date = student.subscription_start_date + timedelta(days=plan_days)
+            db.add(student)
+    
     # Add comment with mentions
     if comment and user_id:
         from backend.core.mentions import parse_mentions, resolve_mentions_to_user_ids, store_mentions
@@ -642,6 +722,16 @@ def _age_group_to_dob(age_group: str):
     return date_type(year, 1, 1)
 
 
+def _age_group_to_dob_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized _age_group_to_dob for an import column: converts each distinct age group once
+    (a file has a handful, e.g. U8-U16) and maps them back. None where the value is missing.
+    """
+    present = values.dropna()
+    dobs = {group: _age_group_to_dob(str(group)) for group in present.unique()}
+    return present.map(dobs).reindex(values.index).astype(object).where(values.notna(), None)
+
+
 def create_lead_from_meta(
     db: Session,
     phone: str,
@@ -730,7 +820,7 @@ def import_leads_from_dataframe(db: Session, df: pd.DataFrame, meta_col: str) ->
         Tuple of (number of leads created, list of error messages, summary_list).
         summary_list: [{"center_id": int, "center_name": str, "count": int}, ...] for centers with count > 1 only.
     """
-    from backend.core.duplicate_detection import find_duplicate_lead, handle_duplicate_lead
+    from backend.core.duplicate_detection import handle_duplicate_lead
     
     # Get all centers for validation
     centers = db.exec(select(Center)).all()
@@ -747,13 +837,50 @@ def import_leads_from_dataframe(db: Session, df: pd.DataFrame, meta_col: str) ->
     if unknown_tags:
         errors.append(f"Unknown center tags: {', '.join(unknown_tags)}")
     
+    # Parse DOBs for the whole frame in one vectorized pass (player_age_group as fallback source)
+    from backend.core.import_validation import parse_date_of_birth_series, column_looks_like_dates
+    if 'date_of_birth' in df.columns and 'player_age_group' not in df.columns and not column_looks_like_dates(df['date_of_birth']):
+        # Mapped "DOB" column actually holds age categories (e.g. U10) - use the age-group conversion
+        df = df.rename(columns={'date_of_birth': 'player_age_group'})
+    dob_raw = df['date_of_birth'] if 'date_of_birth' in df.columns else pd.Series(None, index=df.index, dtype=object)
+    if 'player_age_group' in df.columns:
+        dob_raw = dob_raw.where(dob_raw.notna() & (dob_raw != ''), df['player_age_group'])
+    dob_dates = parse_date_of_birth_series(dob_raw)
+    if 'player_age_group' in df.columns:
+        # Rows without a parseable DOB fall back to an approximate DOB from their age group
+        dob_dates = dob_dates.where(dob_dates.notna(), _age_group_to_dob_series(df['player_age_group']))
+    
+    centers_by_tag = {c.meta_tag_name: c for c in centers}
+    
+    # Possible duplicates already in the DB: one query on the file's phone numbers
+    # (same match rule as find_duplicate_lead: name + phone, and email or both emails empty)
+    phone_vals = [str(v) for v in df['phone']] if 'phone' in df.columns else []
+    existing_by_key: dict = {}
+    if phone_vals:
+        for lead in db.exec(select(Lead).where(Lead.phone.in_(list(set(phone_vals))))).all():
+            existing_by_key.setdefault((lead.player_name, lead.phone), []).append(lead)
+    
+    def email_matches(stored_email, email_val) -> bool:
+        return stored_email == email_val if email_val else stored_email is None
+    
+    # For CSV imports, always use current time (ignore any created_time column in CSV)
+    # This ensures next_followup_date is calculated from the actual import time
+    from datetime import timedelta
+    from sqlalchemy import insert
+    now = datetime.utcnow()
+    # Set initial next_followup_date to 24 hours from now
+    initial_followup = now + timedelta(hours=24)
+    
+    new_records: List[dict] = []
+    new_by_key: dict = {}  # (player_name, phone) -> records added from this file
+    repeated_records: List[dict] = []  # Rows repeating an earlier row of this file
     count = 0
     rows_processed = 0
     created_leads_info: List[dict] = []  # {center_id, center_name, player_name, phone} per new lead
-    for _, row in df.iterrows():
+    for idx, row in df.iterrows():
         rows_processed += 1
         center_val = str(row.get(meta_col, '')).strip() if pd.notna(row.get(meta_col)) else ''
-        center = db.exec(select(Center).where(Center.meta_tag_name == center_val)).first()
+        center = centers_by_tag.get(center_val)
         phone_val = str(row.get('phone', ''))
         player_name_val = row.get('player_name', 'Unknown')
         email_val = row.get('email', '')
@@ -763,45 +890,36 @@ def import_leads_from_dataframe(db: Session, df: pd.DataFrame, meta_col: str) ->
             continue
         
         # Check for duplicate lead
-        existing_lead = find_duplicate_lead(db, player_name_val, phone_val, email_val)
+        key = (player_name_val, phone_val)
+        existing_lead = next(
+            (lead for lead in existing_by_key.get(key, ()) if email_matches(lead.email, email_val)), None
+        )
         if existing_lead:
             handle_duplicate_lead(db, existing_lead, source="CSV Import")
             continue # Skip creating new lead, move to next row
+        earlier_record = next(
+            (record for record in new_by_key.get(key, ()) if email_matches(record["email"], email_val)), None
+        )
+        if earlier_record:
+            repeated_records.append(earlier_record)
+            continue
         
-        # For CSV imports, always use current time (ignore any created_time column in CSV)
-        # This ensures next_followup_date is calculated from the actual import time
-        from datetime import timedelta
-        now = datetime.utcnow()
-        
-        # Set initial next_followup_date to 24 hours from now
-        initial_followup = now + timedelta(hours=24)
-        
-        dob_val = row.get('date_of_birth') or row.get('player_age_group')
-        dob_parsed = None
-        if pd.notna(dob_val):
-            try:
-                dt = pd.to_datetime(dob_val)
-                from datetime import date as date_type
-                dob_parsed = date_type(dt.year, dt.month, dt.day)
-            except Exception:
-                pass
-        if not dob_parsed and pd.notna(row.get('player_age_group')):
-            dob_parsed = _age_group_to_dob(str(row.get('player_age_group', 'U10')))
-        
-        new_lead = Lead(
+        record = dict(
             created_time=now,  # Always use current time for CSV imports
             last_updated=now,  # Set last_updated to same as created_time for new leads
             player_name=player_name_val,
-            date_of_birth=dob_parsed,
+            date_of_birth=dob_dates.at[idx],
             phone=phone_val,
             email=email_val,
             address=row.get('address_and_pincode', ''),
             center_id=center.id,
             status="New",
             public_token=str(uuid.uuid4()),
-            next_followup_date=initial_followup  # 24 hours from now
+            next_followup_date=initial_followup,  # 24 hours from now
+            extra_data={},
         )
-        db.add(new_lead)
+        new_records.append(record)
+        new_by_key.setdefault(key, []).append(record)
         count += 1
         center_name = center.display_name or center.city or str(center.id)
         created_leads_info.append({
@@ -811,7 +929,20 @@ def import_leads_from_dataframe(db: Session, df: pd.DataFrame, meta_col: str) ->
             "phone": phone_val,
         })
     
+    # Bulk insert (executemany / insertmanyvalues) instead of one ORM unit-of-work entry per row
+    if new_records:
+        lead_ids = db.execute(
+            insert(Lead).returning(Lead.id, sort_by_parameter_order=True), new_records
+        ).scalars().all()
+        for record, lead_id in zip(new_records, lead_ids):
+            record["id"] = lead_id
     db.commit()
+    
+    # Repeats within the file refresh the lead created from the earlier row, as a DB duplicate would
+    for record in repeated_records:
+        lead = db.get(Lead, record["id"])
+        if lead:
+            handle_duplicate_lead(db, lead, source="CSV Import")
 
     # One summary per center with count > 1. No individual emails for CSV import.
     by_center: dict = {}
@@ -828,6 +959,65 @@ def import_leads_from_dataframe(db: Session, df: pd.DataFrame, meta_col: str) ->
     return count, errors, summary_list
 
 
+def create_leads_bulk(db: Session, records: List[dict]) -> Tuple[List[int], List[dict]]:
+    """
+    Create many "New" leads with one duplicate pre-check query per table and one bulk INSERT.
+    Each record holds player_name, phone, center_id and optional email, address, date_of_birth (date).
+    A record is skipped when check_duplicate_lead would reject it (same name, case-insensitive, and
+    phone or normalized phone in Lead or LeadStaging) or when it repeats an earlier record.
+    Caller validates centers/permissions; a single commit covers the whole batch.
+
+    Returns:
+        (created lead ids in record order, [{"index": i, "reason": "duplicate"}, ...] for skipped records)
+    """
+    from sqlalchemy import insert
+    from backend.models import LeadStaging
+    from backend.core.staging import _normalize_phone
+
+    # Existing (lower(name), phone) pairs for every phone variant in the batch: two IN-queries total
+    phones = {r["phone"] for r in records} | {_normalize_phone(r["phone"]) for r in records}
+    existing = set()
+    for model in (Lead, LeadStaging):
+        if phones:
+            rows = db.exec(select(model.player_name, model.phone).where(model.phone.in_(phones))).all()
+            existing.update((name.lower(), phone) for name, phone in rows if name)
+
+    now = datetime.utcnow()
+    initial_followup = now + timedelta(hours=24)
+    new_records = []
+    skipped = []
+    for index, record in enumerate(records):
+        name_key = record["player_name"].lower()
+        keys = {(name_key, record["phone"]), (name_key, _normalize_phone(record["phone"]))}
+        if keys & existing:
+            skipped.append({"index": index, "reason": "duplicate"})
+            continue
+        existing |= keys
+        new_records.append(dict(
+            created_time=now,
+            last_updated=now,  # Same as created_time for new leads
+            player_name=record["player_name"],
+            phone=record["phone"],
+            email=record.get("email"),
+            address=record.get("address"),
+            date_of_birth=record.get("date_of_birth"),
+            center_id=record["center_id"],
+            status="New",  # Manual adds always start as New
+            public_token=str(uuid.uuid4()),
+            next_followup_date=initial_followup,
+            extra_data={},
+        ))
+
+    lead_ids: List[int] = []
+    if new_records:
+        # executemany / insertmanyvalues batches the rows; no ORM unit-of-work entry per lead
+        lead_ids = list(db.execute(
+            insert(Lead).returning(Lead.id, sort_by_parameter_order=True), new_records
+        ).scalars().all())
+        db.commit()
+    return lead_ids, skipped
+
+
 def check_nudge_expiry(db: Session) -> List[int]:
     """
     Check for Nurture leads that have reached the 3-strike limit (nudge_count >= 3).
@@ -8,9 +8,15 @@ from sqlmodel import Session, select, and_
 from typing import Optional, Dict, List, Any
 from backend.models import Lead, Batch, Center, User, UserCenterLink
 from backend.core.age_utils import calculate_age
+from backend.core.ttl_cache import TTLCache
 
 LINK_EXPIRY_DAYS = 7
 
+# Preference links are opened from emails/WhatsApp in bursts (bulk sends, link previews):
+# the response per token, cleared on preference submit and batch writes (staff-side lead edits
+# show within the TTL). Bounded so scraped tokens cannot grow it without limit.
+_PREFERENCES_CACHE: TTLCache[Dict[str, Any]] = TTLCache(timedelta(seconds=60), max_entries=2000)
+
 
 def _to_maps_url(location: str) -> str:
     """Convert location string to Google Maps URL (use as-is if already a URL)."""
@@ -235,6 +241,19 @@ def get_lead_preferences_by_token(db: Session, token: str) -> Optional[Dict[str,
     }
 
 
+def get_lead_preferences_by_token_cached(db: Session, token: str) -> Optional[Dict[str, Any]]:
+    """Same as get_lead_preferences_by_token, served from a 60s in-process cache (unknown tokens are not cached)."""
+    return _PREFERENCES_CACHE.get_or_load(token, lambda: get_lead_preferences_by_token(db, token))
+
+
+def invalidate_lead_preferences_cache(token: Optional[str] = None) -> None:
+    """Drop the cached preferences for one token, or all of them (e.g. after batch changes)."""
+    if token is None:
+        _PREFERENCES_CACHE.clear()
+    else:
+        _PREFERENCES_CACHE.pop(token)
+
+
 def update_lead_preferences_by_token(
     db: Session,
     token: str,
@@ -359,6 +378,7 @@ def update_lead_preferences_by_token(
     db.add(lead)
     db.commit()
     db.refresh(lead)
+    invalidate_lead_preferences_cache(token)
 
     # Preference response alert to Center Head (only when preferences submitted, not loss)
     # Runs after commit so lead and center are persisted.
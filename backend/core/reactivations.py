@@ -2,8 +2,13 @@
 Reactivation logic for identifying potential leads to re-engage when new batches are created.
 """
 from sqlmodel import Session, select, and_, or_
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from datetime import timedelta
 from backend.models import Lead, Batch, Center
+from backend.core.ttl_cache import TTLCache
+
+# Sales poll a batch's reactivation list; cache the serialized list briefly per (batch, role)
+_REACTIVATIONS_CACHE: TTLCache[List[Dict[str, Any]]] = TTLCache(timedelta(seconds=30))
 
 
 def get_potential_reactivations(db: Session, batch_id: int) -> List[Lead]:
@@ -61,3 +66,17 @@ def get_potential_reactivations(db: Session, batch_id: int) -> List[Lead]:
     
     return list(leads)
 
+
+def get_potential_reactivations_cached(db: Session, batch_id: int, user_role: str) -> List[Dict[str, Any]]:
+    """get_potential_reactivations serialized for the given role, served from a 30s in-process cache."""
+    from backend.core.lead_privacy import serialize_leads_for_user
+    
+    return _REACTIVATIONS_CACHE.get_or_load(
+        (batch_id, user_role),
+        lambda: serialize_leads_for_user(get_potential_reactivations(db, batch_id), user_role),
+    )
+
+
+def invalidate_reactivations_cache() -> None:
+    """Drop cached reactivation lists (call after batch changes)."""
+    _REACTIVATIONS_CACHE.clear()
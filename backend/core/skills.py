@@ -3,7 +3,8 @@ Skill evaluation management logic.
 Handles creation and aggregation of player skill evaluations.
 """
 from sqlmodel import Session, select, func
-from typing import List, Optional, Dict
+from sqlalchemy import exists, true
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 from backend.models import SkillEvaluation, Lead, User
 
@@ -97,6 +98,56 @@ def get_skill_evaluations_for_lead(
     return list(db.exec(query).all())
 
 
+def _skill_summary_columns(lead_id: int) -> list:
+    """
+    Aggregate columns for a lead's skill summary, selected FROM skillevaluation
+    WHERE lead_id = lead_id: count, the four score sums, and the newest notes/date
+    (uncorrelated scalar subqueries, so the whole summary is one row).
+    """
+    def latest(column):
+        return (
+            select(column)
+            .where(SkillEvaluation.lead_id == lead_id)
+            .order_by(SkillEvaluation.created_at.desc(), SkillEvaluation.id.desc())
+            .limit(1)
+            .correlate(None)
+            .scalar_subquery()
+        )
+    
+    return [
+        func.count(SkillEvaluation.id),
+        func.sum(SkillEvaluation.technical_score),
+        func.sum(SkillEvaluation.fitness_score),
+        func.sum(SkillEvaluation.teamwork_score),
+        func.sum(SkillEvaluation.discipline_score),
+        latest(SkillEvaluation.coach_notes),
+        latest(SkillEvaluation.created_at),
+    ]
+
+
+def _format_skill_summary(total, technical, fitness, teamwork, discipline, notes, created_at) -> Dict:
+    """Build the skill summary response from one _skill_summary_columns row."""
+    if not total:
+        return {
+            "average_technical_score": None,
+            "average_fitness_score": None,
+            "average_teamwork_score": None,
+            "average_discipline_score": None,
+            "total_evaluations": 0,
+            "most_recent_notes": None,
+            "most_recent_evaluation_date": None,
+        }
+    return {
+        "average_technical_score": round(technical / total, 2),
+        "average_fitness_score": round(fitness / total, 2),
+        "average_teamwork_score": round(teamwork / total, 2),
+        "average_discipline_score": round(discipline / total, 2),
+        "total_evaluations": total,
+        "most_recent_notes": notes,
+        "most_recent_evaluation_date": created_at.isoformat() if created_at else None,
+    }
+
+
 def get_skill_summary_for_lead(
     db: Session,
     lead_id: int
@@ -120,36 +171,33 @@ def get_skill_summary_for_lead(
         - most_recent_notes: Optional[str]
         - most_recent_evaluation_date: Optional[datetime]
     """
-    evaluations = get_skill_evaluations_for_lead(db, lead_id)
-    
-    if not evaluations:
-        return {
-            "average_technical_score": None,
-            "average_fitness_score": None,
-            "average_teamwork_score": None,
-            "average_discipline_score": None,
-            "total_evaluations": 0,
-            "most_recent_notes": None,
-            "most_recent_evaluation_date": None,
-        }
-    
-    # Calculate averages
-    total = len(evaluations)
-    avg_technical = sum(e.technical_score for e in evaluations) / total
-    avg_fitness = sum(e.fitness_score for e in evaluations) / total
-    avg_teamwork = sum(e.teamwork_score for e in evaluations) / total
-    avg_discipline = sum(e.discipline_score for e in evaluations) / total
+    row = db.exec(
+        select(*_skill_summary_columns(lead_id)).where(SkillEvaluation.lead_id == lead_id)
+    ).one()
+    return _format_skill_summary(*row)
+
+
+def get_skill_summary_with_access(
+    db: Session,
+    lead_id: int,
+    user: User
+) -> Tuple[bool, bool, Dict]:
+    """
+    Lead existence, access check and skill summary in a single query.
+    Only coaches are restricted (to leads in their batches); other roles always have access.
     
-    # Get most recent evaluation (they're already ordered by created_at desc)
-    most_recent = evaluations[0]
+    Returns:
+        (lead_exists, has_access, summary) - summary as in get_skill_summary_for_lead
+    """
+    from backend.core.leads import lead_access_condition
     
-    return {
-        "average_technical_score": round(avg_technical, 2),
-        "average_fitness_score": round(avg_fitness, 2),
-        "average_teamwork_score": round(avg_teamwork, 2),
-        "average_discipline_score": round(avg_discipline, 2),
-        "total_evaluations": total,
-        "most_recent_notes": most_recent.coach_notes,
-        "most_recent_evaluation_date": most_recent.created_at.isoformat() if most_recent.created_at else None,
-    }
+    access = lead_access_condition(user, lead_id) if user.role == "coach" else None
+    row = db.exec(
+        select(
+            exists().where(Lead.id == lead_id),
+            access if access is not None else true(),
+            *_skill_summary_columns(lead_id),
+        ).where(SkillEvaluation.lead_id == lead_id)
+    ).one()
+    return bool(row[0]), bool(row[1]), _format_skill_summary(*row[2:])
 
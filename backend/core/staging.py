@@ -4,10 +4,11 @@ Handles creation, retrieval, and promotion of staged leads.
 """
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date, timedelta
 import uuid
-from backend.models import LeadStaging, Lead, Center, User
+from backend.models import LeadStaging, Lead, Center, User, AuditLog
+from backend.core.users import get_user_center_ids
 from sqlalchemy import or_
 
 # Export check_duplicate_lead for use in other modules
@@ -16,10 +17,16 @@ __all__ = [
     'create_staging_lead',
     'get_staging_leads',
     'get_staging_lead_by_id',
-    'promote_staging_lead'
+    'promote_staging_lead',
+    'promote_staging_leads_bulk'
 ]
 
 
+def _normalize_phone(phone: str) -> str:
+    """Phone with spaces, dashes and parentheses stripped (the duplicate-check match rule)."""
+    return phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
+
+
 def check_duplicate_lead(db: Session, player_name: str, phone: str) -> bool:
     """
     Check if a lead with the same player_name and phone already exists
@@ -34,7 +41,7 @@ def check_duplicate_lead(db: Session, player_name: str, phone: str) -> bool:
         True if duplicate exists, False otherwise
     """
     # Normalize phone number (remove spaces, dashes, etc.)
-    normalized_phone = phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
+    normalized_phone = _normalize_phone(phone)
     
     # Check in Lead table
     lead_exists = db.exec(
@@ -151,7 +158,7 @@ def get_staging_leads(
             pass
         else:
             # Other users see only their assigned centers
-            user_center_ids = [c.id for c in user.centers]
+            user_center_ids = get_user_center_ids(user)
             if user_center_ids:
                 query = query.where(LeadStaging.center_id.in_(user_center_ids))
             else:
@@ -184,6 +191,45 @@ def get_staging_lead_by_id(
     return db.get(LeadStaging, staging_id)
 
 
+def _lead_from_staging(
+    staging: LeadStaging,
+    date_of_birth: Optional[date] = None,
+    email: Optional[str] = None,
+    address: Optional[str] = None,
+) -> Lead:
+    """
+    Build (not add) the full Lead record for a staging lead.
+    
+    Raises:
+        ValueError: If no DOB is provided and none can be derived from staging
+    """
+    # Need date_of_birth - use provided, or from staging, or approximate from staging.age
+    final_dob = date_of_birth
+    if not final_dob and getattr(staging, "date_of_birth", None):
+        final_dob = staging.date_of_birth
+    if not final_dob and staging.age is not None:
+        year = datetime.utcnow().year - staging.age
+        final_dob = date(year, 1, 1)  # Approximate: Jan 1
+    if not final_dob:
+        raise ValueError("date_of_birth or age (from staging) is required to promote a staging lead")
+    
+    # Create full Lead record — Fast-track: Trial Attended + 24h follow-up for immediate closing
+    now = datetime.utcnow()
+    return Lead(
+        created_time=now,
+        last_updated=now,
+        player_name=staging.player_name,
+        date_of_birth=final_dob,
+        phone=staging.phone,
+        email=email or staging.email,  # Use email from staging if not provided
+        address=address,
+        center_id=staging.center_id,
+        status="Trial Attended",  # Fast-track: appears in "Hot: Ready to Join" for payment collection
+        public_token=str(uuid.uuid4()),
+        next_followup_date=now + timedelta(hours=24)
+    )
+
+
 def promote_staging_lead(
     db: Session,
     staging_id: int,
@@ -213,43 +259,12 @@ def promote_staging_lead(
     if not staging:
         raise ValueError(f"Staging lead {staging_id} not found")
     
-    # Need date_of_birth - use provided, or from staging, or approximate from staging.age
-    final_dob = date_of_birth
-    if not final_dob and getattr(staging, "date_of_birth", None):
-        final_dob = staging.date_of_birth
-    if not final_dob and staging.age is not None:
-        from datetime import date as date_type
-        year = datetime.utcnow().year - staging.age
-        final_dob = date_type(year, 1, 1)  # Approximate: Jan 1
-    if not final_dob:
-        raise ValueError("date_of_birth or age (from staging) is required to promote a staging lead")
-    
-    # Use email from staging if not provided
-    final_email = email or staging.email
+    new_lead = _lead_from_staging(staging, date_of_birth=date_of_birth, email=email, address=address)
     
     # Get center name for audit note
     center = db.get(Center, staging.center_id)
     center_name = center.display_name if center else "Unknown"
     
-    # Create full Lead record — Fast-track: Trial Attended + 24h follow-up for immediate closing
-    from datetime import timedelta
-    initial_followup = datetime.utcnow() + timedelta(hours=24)
-    
-    now = datetime.utcnow()
-    new_lead = Lead(
-        created_time=now,
-        last_updated=now,
-        player_name=staging.player_name,
-        date_of_birth=final_dob,
-        phone=staging.phone,
-        email=final_email,
-        address=address,
-        center_id=staging.center_id,
-        status="Trial Attended",  # Fast-track: appears in "Hot: Ready to Join" for payment collection
-        public_token=str(uuid.uuid4()),
-        next_followup_date=initial_followup
-    )
-    
     db.add(new_lead)
     db.flush()  # Get new_lead.id before audit
     
@@ -272,3 +287,73 @@ def promote_staging_lead(
     
     return new_lead
 
+
+def promote_staging_leads_bulk(
+    db: Session,
+    staging_ids: List[int],
+    user_id: Optional[int] = None,
+) -> Dict:
+    """
+    Promote many staging leads at once (DOB from staging, or approximated from staging.age).
+    All staging rows load in one query and every promotion + audit entry is written
+    in a single commit, instead of two commits per lead.
+    
+    Args:
+        db: Database session
+        staging_ids: Staging lead IDs to promote
+        user_id: Optional user ID who promoted these
+        
+    Returns:
+        Dictionary with promoted_count, promoted leads (id, player_name, phone, status, center_id)
+        and per-ID errors for staging leads that were missing or had no DOB/age
+    """
+    stagings = {
+        staging.id: staging
+        for staging in db.exec(select(LeadStaging).where(LeadStaging.id.in_(staging_ids))).all()
+    }
+    
+    new_leads = []
+    errors = []
+    for staging_id in dict.fromkeys(staging_ids):
+        staging = stagings.get(staging_id)
+        if not staging:
+            errors.append(f"Staging lead {staging_id} not found")
+            continue
+        try:
+            new_lead = _lead_from_staging(staging)
+        except ValueError as e:
+            errors.append(f"Staging lead {staging_id}: {e}")
+            continue
+        db.add(new_lead)
+        db.delete(staging)
+        new_leads.append(new_lead)
+    
+    if not new_leads:
+        return {"promoted_count": 0, "leads": [], "errors": errors}
+    
+    db.flush()  # Assign lead IDs for the audit entries
+    promoted = [
+        {
+            "id": lead.id,
+            "player_name": lead.player_name,
+            "phone": lead.phone,
+            "status": lead.status,
+            "center_id": lead.center_id,
+        }
+        for lead in new_leads
+    ]
+    if user_id:
+        now = datetime.utcnow()
+        db.add_all([
+            AuditLog(
+                lead_id=lead.id,
+                user_id=user_id,
+                action_type="field_capture_promotion",
+                description="Lead promoted from field capture; status set to Trial Attended for immediate closing.",
+                timestamp=now,
+            )
+            for lead in new_leads
+        ])
+    db.commit()
+    
+    return {"promoted_count": len(promoted), "leads": promoted, "errors": errors}
@@ -5,9 +5,14 @@ Handles conversion from Lead to Student and student operations.
 from sqlmodel import Session, select
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from backend.models import Student, Lead, StudentBatchLink, Batch
 from backend.core.audit import log_lead_activity
 
+# Loader options for students serialized with StudentRead.from_student: eager-load what it reads, and make
+# any other relationship access raise instead of silently lazy-loading per row (N+1).
+STUDENT_READ_OPTIONS = (joinedload(Student.lead), selectinload(Student.batches), raiseload("*"))
+
 
 def convert_lead_to_student(
     db: Session,
@@ -244,17 +249,8 @@ def get_student_by_lead_id(db: Session, lead_id: int) -> Optional[Student]:
     ).first()
 
 
-def get_all_students(
-    db: Session,
-    center_id: Optional[int] = None,
-    center_ids: Optional[List[int]] = None,
-    is_active: Optional[bool] = None
-) -> List[Student]:
-    """Get all students, optionally filtered by center(s) and active status."""
-    from sqlalchemy.orm import selectinload
-    
-    query = select(Student)
-    
+def _filter_students(query, center_id: Optional[int], center_ids: Optional[List[int]], is_active: Optional[bool]):
+    """Apply the center / active-status filters shared by get_all_students and count_students."""
     if center_ids:
         query = query.where(Student.center_id.in_(center_ids))
     elif center_id is not None:
@@ -262,14 +258,33 @@ def get_all_students(
     
     if is_active is not None:
         query = query.where(Student.is_active == is_active)
-    
-    # Eagerly load relationships
-    query = query.options(
-        selectinload(Student.lead),
-        selectinload(Student.batches)
-    )
-    
-    return list(db.exec(query).all())
+    return query
+
+
+def get_all_students(
+    db: Session,
+    center_id: Optional[int] = None,
+    center_ids: Optional[List[int]] = None,
+    is_active: Optional[bool] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> List[Student]:
+    """Get all students (ordered by id), optionally filtered by center(s) and active status, and paginated."""
+    query = _filter_students(select(Student), center_id, center_ids, is_active).order_by(Student.id)
+    if limit is not None:
+        query = query.limit(limit).offset(offset)
+    return list(db.exec(query.options(*STUDENT_READ_OPTIONS)).all())
+
+
+def count_students(
+    db: Session,
+    center_id: Optional[int] = None,
+    center_ids: Optional[List[int]] = None,
+    is_active: Optional[bool] = None
+) -> int:
+    """Count students matching the same filters as get_all_students."""
+    from sqlalchemy import func
+    return db.exec(_filter_students(select(func.count()).select_from(Student), center_id, center_ids, is_active)).one()
 
 
 def update_student(
@@ -283,7 +298,8 @@ def update_student(
     subscription_end_date: Optional[date] = None,
     payment_proof_url: Optional[str] = None,
     student_batch_ids: Optional[List[int]] = None,
-    is_active: Optional[bool] = None
+    is_active: Optional[bool] = None,
+    reset_renewal: bool = False
 ) -> Student:
     """
     Update a student record with strict governance for center transfers.
@@ -300,6 +316,7 @@ def update_student(
         payment_proof_url: Payment proof URL
         student_batch_ids: List of batch IDs to assign
         is_active: Active status
+        reset_renewal: Clear renewal_intent / grace period state (subscription renewed), in the same commit
         
     Returns:
         Updated Student object
@@ -380,6 +397,12 @@ def update_student(
     if is_active is not None:
         student.is_active = is_active
     
+    # Renewal Reset: a renewed subscription starts a fresh renewal cycle
+    if reset_renewal:
+        student.renewal_intent = False
+        student.in_grace_period = False
+        student.grace_nudge_count = 0
+    
     # Update batch assignments (only if provided and not a center transfer with no new batches)
     if student_batch_ids is not None:
         # Clear existing batch links (unless we already did during center transfer)
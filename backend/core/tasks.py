@@ -3,9 +3,15 @@ Task queue and calendar management logic.
 Framework-agnostic task utilities for lead follow-ups.
 """
 from sqlmodel import Session, select, func, and_, or_
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from datetime import datetime, date, timedelta
 from backend.models import Lead, User, Center
+from backend.core.users import get_user_center_ids
+from backend.core.ttl_cache import TTLCache
+
+# Calendar heatmaps are polled by dashboards: keyed by (user, year, month, centers), cleared by the
+# lead write endpoints (side-effect writes such as attendance, conversion, public forms show within the TTL)
+_CALENDAR_CACHE: TTLCache[Dict] = TTLCache(timedelta(seconds=60))
 
 
 def get_daily_task_queue(
@@ -52,7 +58,7 @@ def get_daily_task_queue(
     
     # Filter by user's centers (unless team_lead)
     if user.role != "team_lead":
-        user_center_ids = [c.id for c in user.centers]
+        user_center_ids = get_user_center_ids(user)
         if not user_center_ids:
             # User has no centers, return empty results
             return {"overdue": [], "due_today": [], "upcoming": []}
@@ -140,7 +146,7 @@ def get_calendar_month_view(
     
     # Filter by centers
     if user.role != "team_lead":
-        user_center_ids = [c.id for c in user.centers]
+        user_center_ids = get_user_center_ids(user)
         if not user_center_ids:
             return {}
         query = query.where(Lead.center_id.in_(user_center_ids))
@@ -182,6 +188,24 @@ def get_calendar_month_view(
     return calendar_data
 
 
+
+def get_calendar_month_view_cached(
+    db: Session,
+    user: User,
+    year: int,
+    month: int,
+    center_ids: Optional[List[int]] = None
+) -> Dict[str, Dict[str, int]]:
+    """Cached version of get_calendar_month_view (60s TTL)."""
+    key = (user.id, year, month, tuple(sorted(center_ids)) if center_ids else None)
+    return _CALENDAR_CACHE.get_or_load(key, lambda: get_calendar_month_view(db, user, year, month, center_ids))
+
+
+def invalidate_calendar_cache() -> None:
+    """Drop cached calendar views (call after leads are created or their status/follow-up changes)."""
+    _CALENDAR_CACHE.clear()
+
+
 def get_daily_stats(
     db: Session,
     user: User,
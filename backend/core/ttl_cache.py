@@ -0,0 +1,77 @@
+"""
+Short-lived in-process caches.
+Framework-agnostic read-through cache shared by the core modules.
+
+Entries live in this process only: the owning module clears them after its own writes,
+and other workers pick changes up within the TTL.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    key -> (value, expiry) map guarded by a lock. None is never cached (it means "miss").
+    Values are shared by every caller, so store immutable values or copy them on the way out.
+    Loads run outside the lock; a load that overlaps clear()/pop() is not stored, so an
+    invalidation is never overwritten by data read before the write.
+    """
+
+    def __init__(self, ttl: timedelta, max_entries: Optional[int] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[V, datetime]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """The cached value for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[1] > datetime.utcnow():
+            return entry[0]
+        return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store `value` for `key` for one TTL."""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Optional[V]]) -> Optional[V]:
+        """The cached value for `key`, else `loader()` (cached unless None or invalidated meanwhile)."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            generation = self._generation
+        value = loader()
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _store(self, key: Hashable, value: V) -> None:
+        now = datetime.utcnow()
+        if self.max_entries is not None and key not in self._entries and len(self._entries) >= self.max_entries:
+            # Bounded: drop expired entries first, then start over if still full
+            for k in [k for k, (_, expires) in self._entries.items() if expires <= now]:
+                del self._entries[k]
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+        self._entries[key] = (value, now + self.ttl)
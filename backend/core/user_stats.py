@@ -6,6 +6,10 @@ from sqlmodel import Session, select, func
 from typing import Optional, Dict
 from datetime import datetime, date, timedelta
 from backend.models import User, AuditLog, Lead
+from backend.core.ttl_cache import TTLCache
+
+# Streaks only move when the user acts: cache per user, cleared by the endpoints where they update leads
+_STREAK_CACHE: TTLCache[Dict[str, int]] = TTLCache(timedelta(seconds=300))
 
 
 def get_user_completion_streak(db: Session, user_id: int) -> Dict[str, int]:
@@ -83,6 +87,17 @@ def get_user_completion_streak(db: Session, user_id: int) -> Dict[str, int]:
     }
 
 
+
+def get_user_completion_streak_cached(db: Session, user_id: int) -> Dict[str, int]:
+    """Cached version of get_user_completion_streak (5 min TTL)."""
+    return _STREAK_CACHE.get_or_load(user_id, lambda: get_user_completion_streak(db, user_id))
+
+
+def invalidate_user_streak_cache(user_id: Optional[int]) -> None:
+    """Drop a user's cached streak (call after they update a lead)."""
+    _STREAK_CACHE.pop(user_id)
+
+
 def get_user_today_completion_stats(db: Session, user_id: int, target_date: Optional[date] = None) -> Dict[str, int]:
     """
     Get user's completion stats for today.
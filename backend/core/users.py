@@ -3,14 +3,63 @@ User management business logic.
 Framework-agnostic user CRUD operations.
 """
 from sqlmodel import Session, select
-from typing import List, Optional
-from backend.models import User, UserCenterLink
-from backend.core.auth import get_password_hash
+from sqlalchemy.orm import make_transient_to_detached, selectinload
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from datetime import timedelta
+from backend.models import User, UserCenterLink, BatchCoachLink
+from backend.core.auth import get_password_hash, forget_user_tokens
+from backend.core.ttl_cache import TTLCache
+
+# Roles that work the sales pipeline (leads, staging, reactivations)
+SALES_ROLES: FrozenSet[str] = frozenset({"team_lead", "team_member"})
+# Roles limited to the centers they are assigned to
+CENTER_SCOPED_ROLES: FrozenSet[str] = frozenset({"team_member", "observer"})
+
+# Authenticated users are re-read on every request: (detached snapshot, center IDs) per user id.
+# invalidate_user_cache only clears the worker that handled the update: with several workers, a
+# role/center/active change can take up to the 60s TTL to apply on the others (see SETUP.md).
+_USER_CACHE: TTLCache[Tuple[User, FrozenSet[int]]] = TTLCache(timedelta(seconds=60))
+
+# Coach -> assigned batch IDs, shared across requests; cleared by batches.invalidate_batch_caches
+_COACH_BATCH_IDS_CACHE: TTLCache[FrozenSet[int]] = TTLCache(timedelta(seconds=30))
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    """Get a user by email address."""
-    return db.exec(select(User).where(User.email == email)).first()
+    """Get a user by email address, with centers loaded alongside (one IN query) rather than lazily."""
+    return db.exec(
+        select(User).where(User.email == email).options(selectinload(User.centers))
+    ).first()
+
+
+def get_user_center_ids(user: User) -> FrozenSet[int]:
+    """
+    IDs of the centers a user is assigned to.
+    Computed once per User instance (i.e. once per request) and memoized on it.
+    """
+    center_ids = getattr(user, "_center_ids", None)
+    if center_ids is None:
+        center_ids = frozenset(c.id for c in user.centers)
+        user._center_ids = center_ids
+    return center_ids
+
+
+def get_coach_batch_ids(db: Session, user: User) -> FrozenSet[int]:
+    """
+    IDs of the batches a coach is assigned to.
+    Memoized on the User instance (i.e. per request) and kept in a 30s in-process cache across requests.
+    """
+    batch_ids = getattr(user, "_coach_batch_ids", None)
+    if batch_ids is None:
+        batch_ids = _COACH_BATCH_IDS_CACHE.get_or_load(user.id, lambda: frozenset(db.exec(
+            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == user.id)
+        ).all()))
+        user._coach_batch_ids = batch_ids
+    return batch_ids
+
+
+def invalidate_coach_batch_ids_cache() -> None:
+    """Drop cached coach batch IDs (call after any coach-assignment write)."""
+    _COACH_BATCH_IDS_CACHE.clear()
 
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
@@ -18,11 +67,61 @@ def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.get(User, user_id)
 
 
+def get_user_by_id_cached(db: Session, user_id: int) -> Optional[User]:
+    """
+    Get a user by ID, attached to `db`. Within the 60s TTL the cached snapshot is merged in
+    with load=False and its center IDs pre-set for get_user_center_ids, so no query is issued.
+    """
+    entry = _USER_CACHE.get(user_id)
+    if entry is not None:
+        user = db.merge(entry[0], load=False)
+        user._center_ids = entry[1]
+        return user
+    user = db.get(User, user_id, options=[selectinload(User.centers)])
+    if user is not None:
+        cache_user_snapshot(user)
+    return user
+
+
+def cache_user_snapshot(user: User) -> None:
+    """Store a detached copy of a loaded user (and their center IDs) for get_user_by_id_cached."""
+    snapshot = User(**user.model_dump())
+    make_transient_to_detached(snapshot)
+    _USER_CACHE.set(user.id, (snapshot, get_user_center_ids(user)))
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a user's cached snapshot and verified tokens (call after any change to the user)."""
+    _USER_CACHE.pop(user_id)
+    forget_user_tokens(user_id)
+
+
 def get_all_users(db: Session) -> List[User]:
     """Get all users."""
     return list(db.exec(select(User)).all())
 
 
+def get_center_ids_by_user(db: Session, user_ids: List[int]) -> Dict[int, List[int]]:
+    """Center IDs assigned to each of the given users, in one query. Users without centers are absent."""
+    if not user_ids:
+        return {}
+    center_ids: Dict[int, List[int]] = {}
+    rows = db.exec(
+        select(UserCenterLink.user_id, UserCenterLink.center_id).where(UserCenterLink.user_id.in_(user_ids))
+    ).all()
+    for user_id, center_id in rows:
+        center_ids.setdefault(user_id, []).append(center_id)
+    return center_ids
+
+
+def get_user_names_by_id(db: Session, user_ids: Iterable[int]) -> Dict[int, str]:
+    """full_name of each of the given users, in one query. Unknown ids are absent."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    return dict(db.exec(select(User.id, User.full_name).where(User.id.in_(user_ids))).all())
+
+
 def create_user(
     db: Session,
     email: str,
@@ -147,6 +246,7 @@ def update_user(
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
     return user
 
 
@@ -213,5 +313,6 @@ def toggle_user_status(db: Session, user_id: int) -> User:
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
     return user
 
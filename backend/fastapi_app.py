@@ -5,19 +5,27 @@ All routes delegate to framework-agnostic core functions.
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, status, Body, Request, BackgroundTasks
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse, Response
+from fastapi.encoders import jsonable_encoder
 from sqlmodel import Session, select
 from sqlalchemy import and_
 from typing import List, Optional, Dict
 from pydantic import BaseModel
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, date as date_type
 import os
 import io
+import uuid
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from urllib.parse import quote
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+logger = logging.getLogger(__name__)
+
 # Sentry error tracking (optional)
 try:
     import sentry_sdk
@@ -36,71 +44,88 @@ try:
             traces_sample_rate=0.1,  # 10% of transactions
             environment=os.getenv("ENVIRONMENT", "development"),
         )
-        print("✅ Sentry error tracking initialized")
+        logger.debug("Sentry error tracking initialized")
     else:
-        print("ℹ️  Sentry DSN not provided, error tracking disabled")
+        logger.debug("Sentry DSN not provided, error tracking disabled")
 except ImportError:
-    print("ℹ️  Sentry SDK not installed. Install with: pip install sentry-sdk[fastapi]")
+    logger.debug("Sentry SDK not installed. Install with: pip install sentry-sdk[fastapi]")
 
-from backend.core.db import get_session, create_db_and_tables, engine
-from backend.core.auth import create_access_token, get_user_email_from_token
-from backend.core.users import verify_user_credentials, create_user, get_all_users, get_user_by_email, update_user
+from backend.core.db import (
+    get_session, create_db_and_tables, prewarm_pool, engine, read_engine, POOL_SIZE, MAX_OVERFLOW,
+)
+from backend.core.auth import (
+    create_access_token, decode_access_token,
+    get_cached_token_identity, get_cached_token_role, cache_token_identity,
+)
+from backend.core.users import (
+    verify_user_credentials, create_user, get_all_users, get_center_ids_by_user, get_user_names_by_id,
+    get_user_by_email, update_user,
+    get_user_by_id_cached, cache_user_snapshot,
+    get_user_center_ids, get_coach_batch_ids, SALES_ROLES, CENTER_SCOPED_ROLES,
+)
 from backend.core.leads import (
-    get_leads_for_user, update_lead, create_lead_from_meta, import_leads_from_dataframe, increment_nudge_count
+    get_leads_for_user, update_lead, create_lead_from_meta, import_leads_from_dataframe, increment_nudge_count,
+    get_lead_with_access, create_leads_bulk,
 )
 from backend.core.audit import get_audit_logs_for_lead
 from backend.core.bulk_operations import (
-    bulk_update_lead_status, bulk_update_lead_assignment, verify_leads_accessible
+    bulk_update_lead_status, bulk_update_lead_assignment
 )
-from backend.core.centers import get_all_centers, create_center, update_center
-from backend.core.import_validation import preview_import_data, auto_detect_column_mapping
+from backend.core.centers import get_all_centers_cached, get_center_cached, create_center, update_center
+from backend.core.import_validation import preview_import_data, auto_detect_column_mapping, read_import_file
 from backend.core.analytics import (
     get_conversion_rates_cached,
     calculate_average_time_to_contact_cached,
-    get_status_distribution
+    get_status_distribution_cached,
+    get_abandoned_leads_count_cached,
+    get_at_risk_leads_count_cached,
 )
 from backend.core.pending_reports import get_pending_student_reports
 from backend.core.report_audit import log_report_sent
-from backend.core.tasks import get_daily_task_queue, get_calendar_month_view, get_daily_stats
-from backend.core.user_stats import get_user_completion_streak, get_user_today_completion_stats
-from backend.core.abandoned_leads import get_abandoned_leads_count
-from backend.core.at_risk_leads import get_at_risk_leads_count
+from backend.core.tasks import get_daily_task_queue, get_calendar_month_view_cached, get_daily_stats, invalidate_calendar_cache
+from backend.core.user_stats import (
+    get_user_completion_streak_cached, get_user_today_completion_stats, invalidate_user_streak_cache
+)
 from backend.core.batches import (
-    create_batch, assign_coach_to_batch, get_coach_batches,
-    get_all_batches, get_batch_coaches, assign_coaches_to_batch,
-    update_batch
+    create_batch, assign_coach_to_batch, get_coach_batches_cached,
+    get_all_batches, get_coaches_for_batches, assign_coaches_to_batch,
+    update_batch, delete_batch
 )
 from backend.core.public_preferences import (
     record_lead_feedback_by_token,
-    get_lead_preferences_by_token, update_lead_preferences_by_token
+    get_lead_preferences_by_token_cached, update_lead_preferences_by_token
 )
 from backend.core.skills import (
-    create_skill_evaluation, get_skill_evaluations_for_lead, get_skill_summary_for_lead
+    create_skill_evaluation, get_skill_evaluations_for_lead, get_skill_summary_with_access
 )
 from backend.core.staging import (
-    create_staging_lead, get_staging_leads, get_staging_lead_by_id, promote_staging_lead,
+    create_staging_lead, get_staging_leads, get_staging_lead_by_id, promote_staging_lead, promote_staging_leads_bulk,
     check_duplicate_lead
 )
-from backend.core.reactivations import get_potential_reactivations
-from backend.core.attendance import record_attendance, get_attendance_history
+from backend.core.reactivations import get_potential_reactivations_cached
+from backend.core.attendance import record_attendance, record_attendance_bulk, get_attendance_history_rows, AttendanceRow
 from backend.core.approvals import (
     create_request,
     get_pending_requests,
+    get_request_player_names,
     get_requests_for_lead,
     resolve_request,
 )
-from backend.core.students import get_all_students, get_student_by_lead_id
+from backend.core.students import get_all_students, count_students, get_student_by_lead_id, STUDENT_READ_OPTIONS
 from backend.schemas.leads import LeadPreferencesRead, LeadPreferencesUpdate
-from backend.models import User, Center, Lead, Student
+from backend.models import User, Center, Lead, Student, Batch, StudentBatchLink, AuditLog, UserCenterLink
 from backend.schemas.users import UserCreateSchema, UserUpdateSchema
-from backend.schemas.bulk import BulkUpdateStatusRequest, BulkAssignCenterRequest
+from backend.schemas.bulk import (
+    BulkUpdateStatusRequest, BulkAssignCenterRequest, BulkPromoteStagingRequest, BulkAttendanceRequest,
+    BulkCreateLeadsRequest,
+)
 
 # FastAPI OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-# FastAPI dependency for getting current user
-async def get_current_user(
+# FastAPI dependency for getting current user (plain def: runs in the threadpool, DB calls never block the event loop)
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_session)
 ) -> User:
@@ -113,7 +138,16 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    email = get_user_email_from_token(token)
+    # Fast path: token verified recently -> cached user snapshot merged into this session (no query)
+    identity = get_cached_token_identity(token)
+    if identity is not None:
+        email, user_id = identity
+        user = get_user_by_id_cached(db, user_id)
+        if user is not None and user.email == email:
+            return user
+    
+    payload = decode_access_token(token)
+    email = payload.get("sub") if payload else None
     if email is None:
         raise credentials_exception
     
@@ -121,10 +155,200 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
     
+    cache_token_identity(token, email, user.id, payload.get("exp"), role=user.role)
+    cache_user_snapshot(user)
     return user
 
+
+# Methods observers may use; everything else is a mutation
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
+
+
+def require_writer(
+    request: Request,
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: Session = Depends(get_session)
+) -> None:
+    """
+    App-wide dependency blocking observers from POST, PUT, DELETE, PATCH requests.
+    Observers have read-only access.
+    Runs in the request's own dependency graph (same session, verified-token cache shared
+    with get_current_user), so a mutation does at most one user lookup. Missing or invalid
+    tokens are left to the endpoint, so public routes stay public.
+    """
+    if request.method in READ_ONLY_METHODS or not token:
+        return
+    role = get_cached_token_role(token)
+    if role is None:
+        try:
+            role = get_current_user(token, db).role
+        except HTTPException:
+            return
+    if role == "observer":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Observers have read-only access")
+
+
+def get_read_session(db: Session = Depends(get_session)):
+    """
+    FastAPI dependency for read-only endpoints.
+    With DATABASE_READ_URL set, yields an autocommit session on the read replica;
+    otherwise reuses the request session (same connection get_current_user already holds).
+    """
+    if read_engine is None:
+        yield db
+        return
+    with Session(read_engine) as session:
+        yield session
+
+
+def _authorize_lead(db: Session, lead_id: int, user: User, detail: str = "Not authorized for this lead") -> Lead:
+    """Fetch a lead and check center access in one query. Raises 404/403."""
+    lead, has_access = get_lead_with_access(db, lead_id, user)
+    if not lead:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    if not has_access:
+        raise HTTPException(status_code=403, detail=detail)
+    return lead
+
+
+# Staging leads are captured by coaches on the ground as well as the sales team
+STAGING_CREATOR_ROLES = SALES_ROLES | {"coach"}
+TEAM_LEAD_ROLES = frozenset({"team_lead"})
+
+
+def require_role(user: User, allowed_roles: frozenset, detail: str = "Access denied") -> None:
+    """Raise 403 with `detail` unless the user's role is in `allowed_roles`."""
+    if user.role not in allowed_roles:
+        raise HTTPException(status_code=403, detail=detail)
+
+
+def team_lead_only(detail: str):
+    """
+    Dependency factory for team-lead-only endpoints: resolves to the current user, or 403 with `detail`.
+    Usage: current_user: User = Depends(team_lead_only("Only team leads can ..."))
+    """
+    def dependency(current_user: User = Depends(get_current_user)) -> User:
+        require_role(current_user, TEAM_LEAD_ROLES, detail)
+        return current_user
+    return dependency
+
+
+def _parse_id_list(raw: str) -> List[int]:
+    """Parse a comma-separated id list ("1, 2,,3"), skipping blanks. Raises ValueError on non-ints."""
+    return list(map(int, filter(None, map(str.strip, raw.split(",")))))
+
+
+def coach_ids_query(coach_ids: Optional[str] = None) -> Optional[List[int]]:
+    """
+    Dependency: parse the `coach_ids` query param ("1,2,3") once, 400 on malformed input.
+    Returns None when absent or empty, [] when it holds only separators/blanks.
+    """
+    if not coach_ids:
+        return None
+    try:
+        return _parse_id_list(coach_ids)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid coach_ids format. Use comma-separated integers")
+
+
+def student_batch_ids_query(student_batch_ids: Optional[str] = None) -> Optional[List[int]]:
+    """Dependency (or plain helper): parse the `student_batch_ids` query param ("1,2,3") like coach_ids_query."""
+    if not student_batch_ids:
+        return None
+    try:
+        return _parse_id_list(student_batch_ids)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid student_batch_ids format. Use comma-separated integers")
+
+
+def _parse_date(value: str, field: Optional[str] = None, detail: Optional[str] = None) -> date_type:
+    """Parse a YYYY-MM-DD string, raising 400 (with `detail`, or a message naming `field`) if malformed."""
+    try:
+        return date_type.fromisoformat(value)
+    except (ValueError, TypeError):
+        if detail is None:
+            detail = f"Invalid {field} format: {value}. Use YYYY-MM-DD" if field else "Invalid date format. Use YYYY-MM-DD"
+        raise HTTPException(status_code=400, detail=detail)
+
+
+def _invalidate_lead_views(user_id: Optional[int] = None) -> None:
+    """
+    Drop in-process caches derived from leads after a lead write: the calendar heatmap and,
+    when given, the acting user's completion streak. Writes made as side effects elsewhere
+    (attendance, conversion, public forms) show up within the caches' TTL.
+    """
+    invalidate_calendar_cache()
+    if user_id is not None:
+        invalidate_user_streak_cache(user_id)
+
+
+# Billing months per plan for public join/renewal; a month is billed as 31 days
+_PLAN_MONTHS = {"Monthly": 1, "Quarterly": 3, "3 Months": 3, "6 Months": 6, "Yearly": 12}
+
+
+def _plan_end_date(plan: Optional[str], start_date: date_type) -> date_type:
+    """Subscription end date for `plan` starting on `start_date` (unknown plans bill one month)."""
+    return start_date + timedelta(days=_PLAN_MONTHS.get(plan, 1) * 31)
+
+# Sync (def) endpoints run in AnyIO's threadpool, which defaults to 40 tokens.
+# Size it to the DB pool so concurrent DB-bound requests aren't capped below what the pool can serve.
+# DB-bound handlers (users, centers, my_leads, lead updates, ...) stay `def` on purpose: backend.core
+# is sync SQLModel, and an `async def` calling it would block the event loop. The only async
+# handlers (webhook, exception handler) do no DB I/O; webhook work runs as a sync background task.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup: size the threadpool, create missing tables and prewarm DB pools off the event loop. Shutdown: close pools."""
+    import anyio.to_thread
+
+    tokens = int(os.getenv("THREADPOOL_TOKENS", "0")) or max(40, POOL_SIZE + MAX_OVERFLOW)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = tokens
+    print(f"Threadpool: {tokens} worker tokens")
+
+    await anyio.to_thread.run_sync(create_db_and_tables)
+    await anyio.to_thread.run_sync(prewarm_pool, engine)
+    if read_engine is not None:
+        await anyio.to_thread.run_sync(prewarm_pool, read_engine)
+    print("API Security: Allowing requests from:", origins)
+    yield
+    # Close pooled connections cleanly so the DB/pooler doesn't hold them until idle timeout
+    engine.dispose()
+    if read_engine is not None:
+        read_engine.dispose()
+
+
 # redirect_slashes=False: prevents 307 redirects that drop CORS headers (→ Mixed Content behind GCP proxy)
-app = FastAPI(redirect_slashes=False)
+# ORJSONResponse: orjson serializes dict/list payloads several times faster than stdlib json
+# require_writer: observers are read-only on every route
+app = FastAPI(
+    lifespan=lifespan,
+    redirect_slashes=False,
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(require_writer)],
+)
+
+# Proxy/HTTPS middleware - when behind Cloud Run (or similar), use X-Forwarded-Proto so redirects stay on https
+class ProxyHeadersMiddleware:
+    """Force scheme to https when the client connected via https (e.g. behind Cloud Run). Prevents Mixed Content from 307 redirects."""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-proto":
+                    if value.lower() == b"https":
+                        scope["scheme"] = "https"
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(ProxyHeadersMiddleware)
+
+# Gzip JSON bodies over 1KB (list/analytics payloads repeat field names and shrink 5-10x); smaller
+# responses pass through untouched. Sits inside CORS, so preflights are never compressed.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 # CORS: locked-down list; extend from CORS_ORIGINS env if set
 origins = [
@@ -138,13 +362,16 @@ if cors_origins_env:
 # Regex for Cloud Run URLs (deployments can change the hash)
 # Matches https://anything.run.app and https://anything.a.run.app
 cors_origin_regex = r"^https://[\w-]+(-[\w]+)*\.(run\.app|a\.run\.app)(:\d+)?$"
+# Added last so it is the outermost middleware: preflights are answered before anything else runs.
+# A frozenset makes the per-request origin membership test O(1).
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=frozenset(origins),
     allow_origin_regex=cors_origin_regex,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists (not "*") so preflight responses are served from precomputed headers
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "sentry-trace", "baggage"],
     expose_headers=["*"],
 )
 
@@ -176,7 +403,6 @@ async def global_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, HTTPException):
         raise exc  # Let FastAPI handle 4xx normally
     import traceback
-    import logging
     logging.getLogger("uvicorn.error").error(
         "Unhandled exception: %s\n%s", exc, traceback.format_exc()
     )
@@ -192,67 +418,11 @@ async def global_exception_handler(request: Request, exc: Exception):
         },
     )
 
-# Proxy/HTTPS middleware - when behind Cloud Run (or similar), use X-Forwarded-Proto so redirects stay on https
-@app.middleware("http")
-async def proxy_headers_middleware(request: Request, call_next):
-    """Force scheme to https when the client connected via https (e.g. behind Cloud Run). Prevents Mixed Content from 307 redirects."""
-    forwarded_proto = request.headers.get("x-forwarded-proto")
-    if forwarded_proto and forwarded_proto.lower() == "https":
-        request.scope["scheme"] = "https"
-    return await call_next(request)
-
-# Middleware to block observers from mutation operations
-@app.middleware("http")
-async def observer_read_only_middleware(request: Request, call_next):
-    """
-    Middleware to block observers from POST, PUT, DELETE, PATCH requests.
-    Observers have read-only access.
-    """
-    # Skip check for non-mutation methods
-    if request.method in ["GET", "OPTIONS", "HEAD"]:
-        return await call_next(request)
-    
-    # Check if user is authenticated and is an observer
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            from backend.core.auth import get_user_email_from_token
-            from backend.core.users import get_user_by_email
-            from backend.core.db import get_session
-            
-            email = get_user_email_from_token(token)
-            if email:
-                db = next(get_session())
-                try:
-                    user = get_user_by_email(db, email)
-                    if user and user.role == "observer":
-                        return JSONResponse(
-                            status_code=status.HTTP_403_FORBIDDEN,
-                            content={"detail": "Observers have read-only access"}
-                        )
-                finally:
-                    db.close()
-        except HTTPException:
-            # Re-raise HTTP exceptions
-            raise
-        except Exception:
-            # If token validation fails, let the endpoint handle it
-            pass
-    
-    return await call_next(request)
-
-# Initialize database on startup
-@app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
-    print("API Security: Allowing requests from:", origins)
-
 
 # --- AUTHENTICATION ENDPOINTS ---
 @app.post("/token")
 @limiter.limit("5/minute")
-async def login(
+def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_session)
@@ -278,12 +448,11 @@ async def login(
 
 
 @app.get("/me")
-async def get_current_user_info(
+def get_current_user_info(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Get current user information, including center_ids for coaches."""
-    from backend.models import UserCenterLink
     result = {
         "email": current_user.email,
         "full_name": current_user.full_name,
@@ -309,7 +478,7 @@ def get_notifications(
     """Fetch current user's notifications (paginated). Last 48 hours. team_lead: all; team_member/observer: only where notification.center_id is in the user's assigned centers (or null)."""
     from backend.core.notifications import get_notifications_for_user
     is_team_lead = current_user.role == "team_lead"
-    user_center_ids = [c.id for c in current_user.centers] if not is_team_lead else None
+    user_center_ids = list(get_user_center_ids(current_user)) if not is_team_lead else None
     since_hours = hours if hours > 0 else None
     notifications = get_notifications_for_user(
         db, current_user.id,
@@ -343,7 +512,7 @@ def get_notifications_unread_count(
     """Return unread notification count for the current user (role-filtered)."""
     from backend.core.notifications import get_unread_count
     is_team_lead = current_user.role == "team_lead"
-    user_center_ids = [c.id for c in current_user.centers] if not is_team_lead else None
+    user_center_ids = list(get_user_center_ids(current_user)) if not is_team_lead else None
     return {"count": get_unread_count(db, current_user.id, is_team_lead=is_team_lead, user_center_ids=user_center_ids)}
 
 
@@ -375,44 +544,33 @@ def mark_all_notifications_read(
 @app.get("/users")
 def get_users(
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can view all users"))
 ):
     """Get all users (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can view all users")
-    
     users = get_all_users(db)
-    # Include center_ids in response
-    from backend.models import UserCenterLink
-    result = []
-    for user in users:
-        user_dict = {
+    # Include center_ids in response (all users' links in one query)
+    center_ids_by_user = get_center_ids_by_user(db, [user.id for user in users])
+    return ORJSONResponse([
+        {
             "id": user.id,
             "email": user.email,
             "full_name": user.full_name,
             "phone": getattr(user, "phone", None),
             "role": user.role,
             "is_active": user.is_active,
+            "center_ids": center_ids_by_user.get(user.id, []),
         }
-        # Get center IDs for this user
-        center_links = db.exec(
-            select(UserCenterLink).where(UserCenterLink.user_id == user.id)
-        ).all()
-        user_dict["center_ids"] = [link.center_id for link in center_links]
-        result.append(user_dict)
-    return result
+        for user in users
+    ])
 
 
 @app.post("/users")
 def create_user_endpoint(
     user_data: UserCreateSchema,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can create users"))
 ):
     """Create a new user (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can create users")
-    
     try:
         new_user = create_user(
             db=db,
@@ -433,12 +591,9 @@ def update_user_endpoint(
     user_id: int,
     user_data: UserUpdateSchema,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can update users"))
 ):
     """Update an existing user (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can update users")
-    
     try:
         updated_user = update_user(
             db=db,
@@ -466,12 +621,9 @@ def update_user_endpoint(
 def toggle_user_status_endpoint(
     user_id: int,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can toggle user status"))
 ):
     """Toggle a user's active status (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can toggle user status")
-    
     # Prevent team lead from deactivating themselves
     if current_user.id == user_id:
         raise HTTPException(status_code=400, detail="You cannot deactivate your own account")
@@ -497,8 +649,7 @@ def get_centers(
     current_user: User = Depends(get_current_user)
 ):
     """Get all centers."""
-    centers = get_all_centers(db)
-    return centers
+    return ORJSONResponse(get_all_centers_cached(db))
 
 
 @app.post("/centers")
@@ -510,12 +661,9 @@ def create_center_endpoint(
     map_link: Optional[str] = None,
     group_email: Optional[str] = None,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can create centers"))
 ):
     """Create a new center (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can create centers")
-    
     try:
         new_center = create_center(db, display_name, meta_tag_name, city, location, map_link, group_email)
         return new_center
@@ -533,12 +681,9 @@ def update_center_endpoint(
     map_link: Optional[str] = None,
     group_email: Optional[str] = None,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can update centers"))
 ):
     """Update an existing center (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can update centers")
-    
     try:
         updated_center = update_center(
             db=db,
@@ -559,39 +704,20 @@ def update_center_endpoint(
 # --- LEAD IMPORT ENDPOINTS (UPDATED FOR META ADS CSV) ---
 
 @app.post("/leads/preview")
-async def preview_leads(
+def preview_leads(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = None,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only Team Leads can preview imports"))
 ):
     import json
-    import io
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only Team Leads can preview imports")
     
     file_extension = file.filename.split('.')[-1].lower() if file.filename else ''
     
     try:
-        content = await file.read()
-        df = None
-
-        if file_extension in ['xlsx', 'xls']:
-            df = pd.read_excel(io.BytesIO(content))
-        else:
-            # FIX: Meta Ads CSVs are often UTF-16 (starts with 0xff). 
-            # We try multiple encodings to prevent the 'utf-8' error.
-            encodings = ['utf-16', 'utf-8-sig', 'utf-8', 'cp1252', 'latin1']
-            for enc in encodings:
-                try:
-                    df = pd.read_csv(io.BytesIO(content), encoding=enc, sep=None, engine='python')
-                    print(f"✅ Preview: Successfully read CSV with {enc}")
-                    break
-                except Exception:
-                    continue
-            
-            if df is None:
-                raise ValueError("Could not decode CSV file. Please try saving the file as 'CSV UTF-8'.")
+        df, enc = read_import_file(file.file, file_extension)
+        if enc:
+            logger.debug("Preview: read CSV with %s", enc)
 
         if df.empty:
             return {"total_rows": 0, "valid_rows": 0, "preview_data": {"valid": [], "invalid": []}}
@@ -603,7 +729,7 @@ async def preview_leads(
         mapping_dict = json.loads(column_mapping) if column_mapping else auto_detect_column_mapping(df)
         
         # Get centers for validation
-        known_centers = get_all_centers(db)
+        known_centers = [Center(**c) for c in get_all_centers_cached(db)]
         
         # Run preview logic
         preview_result = preview_import_data(df, mapping_dict, known_centers)
@@ -613,59 +739,97 @@ async def preview_leads(
         return preview_result
 
     except Exception as e:
-        print(f"❌ Preview Error: {str(e)}")
+        logger.warning("Lead import preview failed: %s", e)
         raise HTTPException(status_code=400, detail=f"Preview Error: {str(e)}")
 
 
+# Background imports (/leads/upload?background=true): import_id -> job status, polled via
+# GET /leads/upload/{import_id}. Jobs live in this process, so polls must reach the same worker.
+IMPORT_JOB_TTL_SECONDS = 3600
+_IMPORT_JOBS: Dict[str, dict] = {}
+
+
+def _import_leads_file(db: Session, fileobj, file_extension: str, column_mapping: Optional[str]):
+    """Parse an uploaded CSV/XLSX, map its headers and import the rows. Returns (count, errors, summary_list)."""
+    import json
+    # 1. Read file (encoding detected once, before parsing)
+    df, enc = read_import_file(fileobj, file_extension)
+    if enc:
+        logger.debug("Upload: read CSV with %s", enc)
+
+    # 2. Clean headers
+    df.columns = [str(c).strip() for c in df.columns]
+
+    # 3. Get Mapping
+    mapping = json.loads(column_mapping) if column_mapping else auto_detect_column_mapping(df)
+    
+    # 4. Transform DataFrame: Map CSV headers to System Headers
+    # We rename columns like '_player_name?' -> 'player_name'
+    inv_map = {v: k for k, v in mapping.items()}
+    df_mapped = df.rename(columns=inv_map)
+    
+    # 5. Ensure date_of_birth column exists (might be mapped from dob/player_date_of_birth)
+    # 6. Call core import logic
+    return import_leads_from_dataframe(db, df_mapped, 'center')
+
+
+def _run_import_job(import_id: str, content: bytes, file_extension: str, column_mapping: Optional[str]) -> None:
+    """Background task: run a queued import with its own session and record the outcome on the job."""
+    import time
+    from backend.core.emails import send_import_summary_background
+    job = _IMPORT_JOBS[import_id]
+    with Session(engine) as db:
+        try:
+            count, errors, summary_list = _import_leads_file(db, io.BytesIO(content), file_extension, column_mapping)
+        except Exception as e:
+            logger.exception("Background import %s failed", import_id)
+            job.update(status="error", detail=f"Upload Error: {str(e)}", finished_at=time.monotonic())
+            return
+    job.update(status="success", leads_added=count, errors=errors, finished_at=time.monotonic())
+    _invalidate_lead_views()
+    # One summary email per center with count > 1
+    for s in summary_list:
+        send_import_summary_background(s["center_id"], s["center_name"], s["count"])
+
+
+def _prune_import_jobs() -> None:
+    """Drop finished jobs older than IMPORT_JOB_TTL_SECONDS."""
+    import time
+    now = time.monotonic()
+    for k, job in list(_IMPORT_JOBS.items()):
+        finished_at = job.get("finished_at")
+        if finished_at is not None and now - finished_at > IMPORT_JOB_TTL_SECONDS:
+            del _IMPORT_JOBS[k]
+
+
 @app.post("/leads/upload")
-async def upload_leads(
+def upload_leads(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = None,
+    background: bool = False,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(team_lead_only("Only Team Leads can import data")),
     background_tasks: BackgroundTasks = None,
 ):
-    import json
-    import io
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only Team Leads can import data")
-
+    """
+    Import leads from a CSV/XLSX file.
+    background=true: return {"import_id"} immediately and import after the response;
+    poll GET /leads/upload/{import_id} for the result.
+    """
     file_extension = file.filename.split('.')[-1].lower() if file.filename else ''
+
+    if background and background_tasks is not None:
+        _prune_import_jobs()
+        import_id = uuid.uuid4().hex
+        _IMPORT_JOBS[import_id] = {"status": "processing"}
+        # Copy the upload now: the spooled file is closed once the response is sent
+        background_tasks.add_task(_run_import_job, import_id, file.file.read(), file_extension, column_mapping)
+        return {"status": "processing", "import_id": import_id}
     
     try:
-        content = await file.read()
-        df = None
-
-        # 1. Read file with encoding loop
-        if file_extension in ['xlsx', 'xls']:
-            df = pd.read_excel(io.BytesIO(content))
-        else:
-            encodings = ['utf-16', 'utf-8-sig', 'utf-8', 'cp1252', 'latin1']
-            for enc in encodings:
-                try:
-                    df = pd.read_csv(io.BytesIO(content), encoding=enc, sep=None, engine='python')
-                    print(f"✅ Upload: Successfully read CSV with {enc}")
-                    break
-                except Exception:
-                    continue
-            
-            if df is None:
-                raise ValueError("Could not decode CSV file.")
-
-        # 2. Clean headers
-        df.columns = [str(c).strip() for c in df.columns]
-
-        # 3. Get Mapping
-        mapping = json.loads(column_mapping) if column_mapping else auto_detect_column_mapping(df)
-        
-        # 4. Transform DataFrame: Map CSV headers to System Headers
-        # We rename columns like '_player_name?' -> 'player_name'
-        inv_map = {v: k for k, v in mapping.items()}
-        df_mapped = df.rename(columns=inv_map)
-        
-        # 5. Ensure date_of_birth column exists (might be mapped from dob/player_date_of_birth)
-        # 6. Call core import logic; emails sent in background (one summary per center with count > 1)
-        count, errors, summary_list = import_leads_from_dataframe(db, df_mapped, 'center')
+        count, errors, summary_list = _import_leads_file(db, file.file, file_extension, column_mapping)
+        _invalidate_lead_views()
+        # Emails sent in background (one summary per center with count > 1)
         if background_tasks and summary_list:
             from backend.core.emails import send_import_summary_background
             for s in summary_list:
@@ -681,56 +845,87 @@ async def upload_leads(
             "errors": errors
         }
     except Exception as e:
-        print(f"❌ Upload Error: {str(e)}")
+        logger.warning("Lead upload failed: %s", e)
         raise HTTPException(status_code=400, detail=f"Upload Error: {str(e)}")
 
 
+@app.get("/leads/upload/{import_id}")
+def get_upload_status(
+    import_id: str,
+    current_user: User = Depends(team_lead_only("Only Team Leads can import data")),
+):
+    """Status of a background import: processing, success (leads_added, errors) or error (detail)."""
+    job = _IMPORT_JOBS.get(import_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return {k: v for k, v in job.items() if k != "finished_at"}
+
+
 # --- META WEBHOOK ENDPOINT ---
-@app.post("/webhook/meta")
-async def meta_webhook(
+# Meta retries aggressively; drop repeats of the same submission seen within this window
+META_WEBHOOK_DEDUPE_SECONDS = 300
+_RECENT_META_SUBMISSIONS: Dict[tuple, float] = {}
+
+
+def _seen_meta_submission(key: tuple) -> bool:
+    """Record a webhook submission key; True if it was already seen within the dedupe window."""
+    import time
+    now = time.monotonic()
+    if len(_RECENT_META_SUBMISSIONS) > 1000:
+        for k, seen_at in list(_RECENT_META_SUBMISSIONS.items()):
+            if now - seen_at > META_WEBHOOK_DEDUPE_SECONDS:
+                del _RECENT_META_SUBMISSIONS[k]
+    seen_at = _RECENT_META_SUBMISSIONS.get(key)
+    _RECENT_META_SUBMISSIONS[key] = now
+    return seen_at is not None and now - seen_at <= META_WEBHOOK_DEDUPE_SECONDS
+
+
+def _forget_meta_submission(key: tuple) -> None:
+    """Drop a submission key so Meta's retry of a lead we failed to create is processed."""
+    _RECENT_META_SUBMISSIONS.pop(key, None)
+
+
+def _process_meta_lead(
+    submission_key: tuple,
     phone: str,
     name: str,
-    email: Optional[str] = None,
-    center_tag: Optional[str] = None,
-    date_of_birth: Optional[str] = None,
-    age_group: Optional[str] = None,  # Legacy webhooks - converted to approximate DOB
-    address: Optional[str] = None,
-    db: Session = Depends(get_session),
-    background_tasks: BackgroundTasks = None,
-):
+    email: Optional[str],
+    center_tag: str,
+    date_of_birth: Optional[date_type],
+    age_group: Optional[str],
+    address: Optional[str],
+) -> None:
     """
-    Webhook endpoint for Meta lead ads.
-    Creates a new lead from Meta form submission. Email alert is sent in background.
+    Background task: create (or merge) the Meta lead and ring the center's bell.
+    If the lead cannot be created, the dedupe key is released so a retry is not dropped.
     """
-    try:
-        if not center_tag:
-            center_tag = "unknown"  # Default center tag if not provided
-        
-        from datetime import date as date_type
-        dob_parsed = None
-        if date_of_birth:
-            try:
-                dob_parsed = date_type.fromisoformat(date_of_birth)
-            except (ValueError, TypeError):
-                pass
-        
-        lead = create_lead_from_meta(
-            db=db,
-            phone=phone,
-            name=name,
-            email=email,
-            center_tag=center_tag,
-            date_of_birth=dob_parsed,
-            age_group=age_group,  # Fallback for legacy webhooks
-            address=address
-        )
+    with Session(engine) as db:
+        try:
+            lead = create_lead_from_meta(
+                db=db,
+                phone=phone,
+                name=name,
+                email=email,
+                center_tag=center_tag,
+                date_of_birth=date_of_birth,
+                age_group=age_group,  # Fallback for legacy webhooks
+                address=address
+            )
+        except ValueError as e:
+            _forget_meta_submission(submission_key)
+            logger.warning("Meta webhook lead rejected (%s, %s): %s", center_tag, phone, e)
+            return
+        except Exception:
+            _forget_meta_submission(submission_key)
+            logger.exception("Meta webhook lead creation failed (%s, %s)", center_tag, phone)
+            return
+        _invalidate_lead_views()
         # Bell only (Low Priority) - no email for new leads
         from backend.core.notifications import notify_center_users
         try:
             center = db.get(Center, lead.center_id)
             center_name = (center.display_name or center.city or "Unknown") if center else "Unknown"
             base_url = os.getenv("CRM_BASE_URL", "").strip().rstrip("/")
-            from urllib.parse import quote
             link = f"{base_url}/leads?search={quote(lead.phone or '')}" if base_url else None
             notify_center_users(
                 db, lead.center_id,
@@ -741,13 +936,45 @@ async def meta_webhook(
                 priority="low",
             )
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).exception("New lead in-app notification failed: %s", e)
-        return {"status": "success", "lead_id": lead.id}
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+            logger.exception("New lead in-app notification failed: %s", e)
+
+
+@app.post("/webhook/meta", status_code=status.HTTP_202_ACCEPTED)
+async def meta_webhook(
+    background_tasks: BackgroundTasks,
+    phone: str,
+    name: str,
+    email: Optional[str] = None,
+    center_tag: Optional[str] = None,
+    date_of_birth: Optional[str] = None,
+    age_group: Optional[str] = None,  # Legacy webhooks - converted to approximate DOB
+    address: Optional[str] = None,
+):
+    """
+    Webhook endpoint for Meta lead ads.
+    Acknowledges immediately (202); the lead is created in a background task so
+    Meta never waits on the database. Retries of the same submission are ignored.
+    """
+    if not phone.strip():
+        raise HTTPException(status_code=400, detail="Phone number is required")
+    if not center_tag:
+        center_tag = "unknown"  # Default center tag if not provided
+
+    dob_parsed = None
+    if date_of_birth:
+        try:
+            dob_parsed = date_type.fromisoformat(date_of_birth)
+        except (ValueError, TypeError):
+            pass
+
+    submission_key = (phone.strip(), center_tag, (name or "").strip().lower())
+    if _seen_meta_submission(submission_key):
+        return {"status": "duplicate"}
+
+    background_tasks.add_task(
+        _process_meta_lead, submission_key, phone, name, email, center_tag, dob_parsed, age_group, address
+    )
+    return {"status": "accepted"}
 
 
 # --- LEAD MANAGEMENT ENDPOINTS ---
@@ -761,6 +988,7 @@ def get_my_leads(
     next_follow_up_date: Optional[str] = None,  # Filter by follow-up date (YYYY-MM-DD)
     filter: Optional[str] = None,  # Special filter: "at-risk", "overdue", or "new"
     loss_reason: Optional[str] = None,  # Filter by loss_reason
+    stream: bool = False,  # Stream all matching leads as NDJSON (one lead per line) for large exports
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -774,16 +1002,13 @@ def get_my_leads(
         search: Search term for player name (optional)
         sort_by: Sort order - "created_time" (newest first) or "freshness" (rotting leads first)
         filter: Special filter - "at-risk" for inactive leads
+        stream: If true, respond with application/x-ndjson, fetching and serializing leads page by page
     """
     at_risk_filter = filter == "at-risk" if filter else None
     overdue_filter = filter == "overdue" if filter else None
     nudge_failures_filter = filter == "nudge_failures" if filter else None
     status_arg = status if status else ("New" if filter == "new" else None)
-    leads, total = get_leads_for_user(
-        db, 
-        current_user, 
-        limit=limit, 
-        offset=offset,
+    filters = dict(
         status_filter=status_arg,
         search=search,
         sort_by=sort_by,
@@ -794,17 +1019,66 @@ def get_my_leads(
         nudge_failures_filter=nudge_failures_filter,
     )
     
-    # Mask sensitive fields for coaches
     from backend.core.lead_privacy import serialize_leads_for_user
+    
+    if stream:
+        return StreamingResponse(
+            _stream_leads_ndjson(current_user.id, limit, offset, filters),
+            media_type="application/x-ndjson",
+        )
+    
+    leads, total = get_leads_for_user(
+        db, 
+        current_user, 
+        limit=limit, 
+        offset=offset,
+        **filters,
+    )
+    
+    # Mask sensitive fields for coaches
     serialized_leads = serialize_leads_for_user(leads, current_user.role)
     
-    return {
+    # Plain dicts of primitives: let orjson serialize directly (no jsonable_encoder pass)
+    return ORJSONResponse({
         "leads": serialized_leads,
         "total": total,
         "limit": limit,
         "offset": offset,
         "sort_by": sort_by
-    }
+    })
+
+
+LEADS_STREAM_PAGE_SIZE = 500
+
+
+def _stream_leads_ndjson(user_id: int, limit: Optional[int], offset: int, filters: Dict):
+    """
+    Yield matching leads as NDJSON lines, one page at a time, so large exports never hold
+    the full list in memory. Uses its own session: the request session is closed once the
+    endpoint returns, before the body is streamed.
+    """
+    import orjson
+    from backend.core.lead_privacy import serialize_leads_for_user
+    
+    with Session(engine) as stream_db:
+        user = stream_db.get(User, user_id)
+        if user is None:
+            return
+        remaining = limit
+        page_offset = offset
+        while remaining is None or remaining > 0:
+            page_size = LEADS_STREAM_PAGE_SIZE if remaining is None else min(LEADS_STREAM_PAGE_SIZE, remaining)
+            leads, _ = get_leads_for_user(stream_db, user, limit=page_size, offset=page_offset, **filters)
+            for lead_dict in serialize_leads_for_user(leads, user.role):
+                yield orjson.dumps(lead_dict, default=str) + b"\n"
+            if len(leads) < page_size:
+                break
+            page_offset += len(leads)
+            if remaining is not None:
+                remaining -= len(leads)
+            # Release the page's ORM objects before fetching the next one
+            for lead in leads:
+                stream_db.expunge(lead)
 
 
 @app.put("/leads/{lead_id}")
@@ -816,7 +1090,6 @@ def update_lead_endpoint(
     date_of_birth: Optional[str] = None,  # Legacy - converted to approximate DOB
     trial_batch_id: Optional[int] = None,
     permanent_batch_id: Optional[int] = None,
-    student_batch_ids: Optional[str] = None,  # Comma-separated list of batch IDs
     subscription_plan: Optional[str] = None,
     subscription_start_date: Optional[str] = None,
     subscription_end_date: Optional[str] = None,
@@ -825,32 +1098,18 @@ def update_lead_endpoint(
     loss_reason: Optional[str] = None,  # Off-ramp reason (e.g. Expensive fee, Other)
     loss_reason_notes: Optional[str] = None,  # Details when reason is 'Other'
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    student_batch_ids_list: Optional[List[int]] = Depends(student_batch_ids_query)  # ?student_batch_ids=1,2,3
 ):
     """Update a lead's status and add optional comment. Can also assign batches and subscription."""
-    from datetime import date as date_type
-    
-    # Parse student_batch_ids if provided
-    student_batch_ids_list = None
-    if student_batch_ids:
-        try:
-            student_batch_ids_list = [int(id.strip()) for id in student_batch_ids.split(",") if id.strip()]
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid student_batch_ids format. Use comma-separated integers")
     
     # Parse subscription dates if provided
     subscription_start_date_obj = None
     subscription_end_date_obj = None
     if subscription_start_date:
-        try:
-            subscription_start_date_obj = datetime.fromisoformat(subscription_start_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid subscription_start_date format: {subscription_start_date}. Use YYYY-MM-DD")
+        subscription_start_date_obj = _parse_date(subscription_start_date, field="subscription_start_date")
     if subscription_end_date:
-        try:
-            subscription_end_date_obj = datetime.fromisoformat(subscription_end_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid subscription_end_date format: {subscription_end_date}. Use YYYY-MM-DD")
+        subscription_end_date_obj = _parse_date(subscription_end_date, field="subscription_end_date")
     
     try:
         updated_lead = update_lead(
@@ -867,57 +1126,20 @@ def update_lead_endpoint(
             payment_proof_url=payment_proof_url,
             call_confirmation_note=call_confirmation_note,
             loss_reason=loss_reason,
-            loss_reason_notes=loss_reason_notes
+            loss_reason_notes=loss_reason_notes,
+            subscription_plan=subscription_plan,
+            subscription_start_date=subscription_start_date_obj,
+            subscription_end_date=subscription_end_date_obj,
         )
-        
-        # Update subscription fields if provided
-        if subscription_plan is not None or subscription_start_date_obj is not None or subscription_end_date_obj is not None:
-            from backend.core.leads import get_lead_by_id
-            lead = get_lead_by_id(db, lead_id)
-            if not lead:
-                raise HTTPException(status_code=404, detail="Lead not found")
-            if subscription_plan is not None:
-                lead.subscription_plan = subscription_plan
-            if subscription_start_date_obj is not None:
-                lead.subscription_start_date = subscription_start_date_obj
-                # Auto-calculate end date if plan is provided but end date is not
-                if subscription_plan and not subscription_end_date_obj:
-                    from datetime import timedelta
-                    if subscription_plan == "Monthly":
-                        lead.subscription_end_date = subscription_start_date_obj + timedelta(days=30)
-                    elif subscription_plan == "Quarterly":
-                        lead.subscription_end_date = subscription_start_date_obj + timedelta(days=90)
-                    elif subscription_plan == "6 Months":
-                        lead.subscription_end_date = subscription_start_date_obj + timedelta(days=180)
-                    elif subscription_plan == "Yearly":
-                        lead.subscription_end_date = subscription_start_date_obj + timedelta(days=365)
-            elif subscription_plan and lead.subscription_start_date and not subscription_end_date_obj and not lead.subscription_end_date:
-                # Calculate end date from existing start date if plan is provided but no dates are
-                from datetime import timedelta
-                if subscription_plan == "Monthly":
-                    lead.subscription_end_date = lead.subscription_start_date + timedelta(days=30)
-                elif subscription_plan == "Quarterly":
-                    lead.subscription_end_date = lead.subscription_start_date + timedelta(days=90)
-                elif subscription_plan == "6 Months":
-                    lead.subscription_end_date = lead.subscription_start_date + timedelta(days=180)
-                elif subscription_plan == "Yearly":
-                    lead.subscription_end_date = lead.subscription_start_date + timedelta(days=365)
-            if subscription_end_date_obj is not None:
-                lead.subscription_end_date = subscription_end_date_obj
-            db.add(lead)
-            db.commit()
-            db.refresh(lead)
+        _invalidate_lead_views(current_user.id)
         
         # Bell only (Low Priority): Trial Scheduled
         if status == "Trial Scheduled":
             try:
-                from backend.core.leads import get_lead_by_id
                 from backend.core.notifications import notify_center_users
-                lead_obj = get_lead_by_id(db, lead_id)
+                lead_obj = updated_lead
                 if lead_obj and lead_obj.center_id:
-                    import os
                     base_url = os.getenv("CRM_BASE_URL", "").strip().rstrip("/")
-                    from urllib.parse import quote
                     link = f"{base_url}/leads?search={quote(lead_obj.phone or '')}" if base_url and lead_obj.phone else None
                     notify_center_users(
                         db, lead_obj.center_id,
@@ -929,9 +1151,7 @@ def update_lead_endpoint(
                     )
             except Exception as _:
                 pass
-        # Return updated lead data
-        from backend.core.leads import get_lead_by_id
-        updated_lead = get_lead_by_id(db, lead_id)
+        # Return updated lead data (update_lead already returns the refreshed lead)
         if updated_lead:
             from backend.schemas.leads import LeadRead
             return LeadRead.model_validate(updated_lead)
@@ -960,41 +1180,17 @@ def convert_lead_to_student_endpoint(
     Convert a Lead to a Student (graduate from prospect to active member).
     This endpoint should be used by the 'Complete Joining' button in the frontend.
     """
-    from backend.core.leads import get_lead_by_id
     from backend.core.students import convert_lead_to_student
-    from datetime import date as date_type
     
     # Verify user has access to this lead
-    lead = get_lead_by_id(db, lead_id)
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Check permissions
-    if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
-        if lead.center_id not in user_center_ids:
-            raise HTTPException(status_code=403, detail="Not authorized to convert this lead")
+    lead = _authorize_lead(db, lead_id, current_user, "Not authorized to convert this lead")
     
     # Parse subscription dates
-    try:
-        subscription_start_date_obj = datetime.fromisoformat(subscription_start_date).date()
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid subscription_start_date format: {subscription_start_date}. Use YYYY-MM-DD")
+    subscription_start_date_obj = _parse_date(subscription_start_date, field="subscription_start_date")
     
-    subscription_end_date_obj = None
-    if subscription_end_date:
-        try:
-            subscription_end_date_obj = datetime.fromisoformat(subscription_end_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid subscription_end_date format: {subscription_end_date}. Use YYYY-MM-DD")
-    
-    # Parse student_batch_ids if provided
-    student_batch_ids_list = []
-    if student_batch_ids:
-        try:
-            student_batch_ids_list = [int(id.strip()) for id in student_batch_ids.split(",") if id.strip()]
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid student_batch_ids format. Use comma-separated integers")
+    subscription_end_date_obj = _parse_date(subscription_end_date, field="subscription_end_date") if subscription_end_date else None
+    # Parsed after the access check, so callers without access get 403/404 rather than 400
+    student_batch_ids_list = student_batch_ids_query(student_batch_ids)
     
     # Prepare student data
     student_data = {
@@ -1002,7 +1198,7 @@ def convert_lead_to_student_endpoint(
         'subscription_start_date': subscription_start_date_obj,
         'subscription_end_date': subscription_end_date_obj,
         'payment_proof_url': payment_proof_url,
-        'student_batch_ids': student_batch_ids_list,
+        'student_batch_ids': student_batch_ids_list or [],
         'center_id': lead.center_id
     }
     
@@ -1016,13 +1212,8 @@ def convert_lead_to_student_endpoint(
         
         # Return student data with lead info
         from backend.schemas.students import StudentRead
-        from sqlalchemy.orm import selectinload
         # Reload student with relationships
-        from backend.models import Student
-        stmt = select(Student).where(Student.id == student.id).options(
-            selectinload(Student.lead),
-            selectinload(Student.batches)
-        )
+        stmt = select(Student).where(Student.id == student.id).options(*STUDENT_READ_OPTIONS)
         student_with_relations = db.exec(stmt).first()
         return StudentRead.from_student(student_with_relations)
     except ValueError as e:
@@ -1040,7 +1231,6 @@ def send_enrollment_link_endpoint(
 ):
     """Send enrollment link to lead (sets enrollment_link_sent_at, link_expires_at). Center head or team lead."""
     from backend.core.leads import get_lead_by_id
-    from datetime import datetime, timedelta
 
     lead = get_lead_by_id(db, lead_id)
     if not lead:
@@ -1048,7 +1238,7 @@ def send_enrollment_link_endpoint(
     if lead.status != "Trial Attended":
         raise HTTPException(status_code=400, detail="Lead must be in Trial Attended status")
 
-    user_center_ids = [c.id for c in current_user.centers]
+    user_center_ids = get_user_center_ids(current_user)
     if current_user.role != "team_lead" and lead.center_id not in user_center_ids:
         raise HTTPException(status_code=403, detail="Not authorized for this lead")
 
@@ -1070,7 +1260,7 @@ def send_enrollment_link_endpoint(
 def verify_and_enroll_lead_endpoint(
     lead_id: int,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only Team Lead can verify and enroll"))
 ):
     """
     Verify payment and enroll student (team_lead only). Reads pending_subscription_data from lead.
@@ -1079,12 +1269,7 @@ def verify_and_enroll_lead_endpoint(
     from backend.core.leads import get_lead_by_id
     from backend.core.students import convert_lead_to_student
     from backend.core.emails import send_welcome_email
-    from backend.models import Student
     from backend.schemas.students import StudentRead
-    from sqlalchemy.orm import selectinload
-
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only Team Lead can verify and enroll")
 
     lead = get_lead_by_id(db, lead_id)
     if not lead:
@@ -1106,19 +1291,13 @@ def verify_and_enroll_lead_endpoint(
 
     if not start_date_str:
         raise HTTPException(status_code=400, detail="Missing start_date in pending data")
-    from datetime import date as date_type, timedelta
-    try:
-        start_date = date_type.fromisoformat(start_date_str)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid start_date in pending data")
+    start_date = _parse_date(start_date_str, detail="Invalid start_date in pending data")
 
     student_batch_ids = [batch_id] if batch_id else []
     if not student_batch_ids and getattr(lead, "preferred_batch_id", None):
         student_batch_ids = [lead.preferred_batch_id]
 
-    months_map = {"Monthly": 1, "Quarterly": 3, "3 Months": 3, "6 Months": 6, "Yearly": 12}
-    months = months_map.get(subscription_plan, 1)
-    end_date = start_date + timedelta(days=months * 31)
+    end_date = _plan_end_date(subscription_plan, start_date)
     end_date_str = end_date.isoformat()
 
     student_data = {
@@ -1149,8 +1328,6 @@ def verify_and_enroll_lead_endpoint(
         # Success signal: Enrollment Finalized notification (high priority / gold dot)
         try:
             from backend.core.notifications import notify_center_users
-            from urllib.parse import quote
-            from backend.models import Batch
             player_name = lead.player_name or "Player"
             batch_name = "—"
             if student_batch_ids:
@@ -1166,89 +1343,82 @@ def verify_and_enroll_lead_endpoint(
             )
         except Exception:
             pass
-        stmt = select(Student).where(Student.id == student.id).options(
-            selectinload(Student.lead), selectinload(Student.batches)
-        )
+        stmt = select(Student).where(Student.id == student.id).options(*STUDENT_READ_OPTIONS)
         student_with_relations = db.exec(stmt).first()
         return StudentRead.from_student(student_with_relations)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+STUDENTS_MAX_PAGE_SIZE = 100
+
+
 @app.get("/students")
 def get_students_endpoint(
     center_id: Optional[int] = None,
     is_active: Optional[bool] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all students. Team lead sees all; team_member/observer see only their assigned centers; coach has no access."""
-    from backend.schemas.students import StudentRead
-    from sqlalchemy.orm import selectinload
+    """
+    Get all students. Team lead sees all; team_member/observer see only their assigned centers; coach has no access.
+    Without `limit` returns the full list; with it, one page (limit capped at STUDENTS_MAX_PAGE_SIZE):
+    {"students": [...], "total": N, "limit": L, "offset": O}.
+    """
+    from backend.schemas.students import StudentRead, StudentReadList
+
+    if limit is not None:
+        limit = max(1, min(limit, STUDENTS_MAX_PAGE_SIZE))
+        offset = max(0, offset)
 
     # Role-based filtering: team_lead = all; team_member/observer = their assigned centers only
     # Coach: allowed (e.g. for Check-In) but gets masked data via mask_student_for_coach below
     center_ids_arg = None
-    if current_user.role in ("team_member", "observer"):
-        user_center_ids = [c.id for c in current_user.centers]
-        if not user_center_ids:
-            students = []
-        else:
-            center_ids_arg = user_center_ids
+    if current_user.role in CENTER_SCOPED_ROLES:
+        center_ids_arg = list(get_user_center_ids(current_user))
 
+    filters = dict(
+        center_id=center_id if current_user.role == "team_lead" else None,
+        center_ids=center_ids_arg,
+        is_active=is_active,
+    )
     if center_ids_arg is not None and len(center_ids_arg) == 0:
         students = []
+        total = 0
     else:
-        students = get_all_students(
-            db,
-            center_id=center_id if current_user.role == "team_lead" else None,
-            center_ids=center_ids_arg,
-            is_active=is_active
-        )
-    
-    # Eagerly load lead relationships
-    from backend.models import Student
-    from sqlmodel import select
-    if students:
-        student_ids = [s.id for s in students]
-        stmt = select(Student).where(Student.id.in_(student_ids)).options(
-            selectinload(Student.lead),
-            selectinload(Student.batches)
-        )
-        students = list(db.exec(stmt).all())
-    
-    # Convert to response format
-    result = []
-    for student in students:
-        student_data = StudentRead.from_student(student)
-        # Mask sensitive fields for coaches
-        if current_user.role == "coach":
-            from backend.core.lead_privacy import mask_student_for_coach
-            student_dict = student_data.model_dump()
-            masked_dict = mask_student_for_coach(student_dict)
-            result.append(masked_dict)
-        else:
-            result.append(student_data.model_dump())
+        students = get_all_students(db, limit=limit, offset=offset, **filters)
+        total = count_students(db, **filters) if limit is not None else None
     
-    return result
+    # Convert to response format (lead and batches already eager-loaded by get_all_students),
+    # dumping the whole list in one pass
+    result = StudentReadList.dump_python([StudentRead.from_student(s) for s in students], mode="json")
+    # Mask sensitive fields for coaches
+    if current_user.role == "coach":
+        from backend.core.lead_privacy import mask_student_for_coach
+        result = [mask_student_for_coach(d) for d in result]
+
+    # Already JSON-mode primitives: let orjson serialize directly (no jsonable_encoder pass)
+    if limit is None:
+        return ORJSONResponse(result)
+    return ORJSONResponse({"students": result, "total": total, "limit": limit, "offset": offset})
 
 
 @app.get("/students/payment-unverified")
 def get_payment_unverified_students_endpoint(
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(team_lead_only("Only Team Lead can view payment audit")),
 ):
     """List students with UTR but payment not yet verified (team_lead only). For Financial Audit card."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only Team Lead can view payment audit")
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import joinedload
     from sqlalchemy import and_
     stmt = (
         select(Student)
         .where(and_(Student.utr_number.isnot(None), Student.utr_number != "", Student.is_payment_verified == False))
-        .options(selectinload(Student.lead))
+        .options(joinedload(Student.lead))
     )
-    students = list(db.exec(stmt).all())
+    students = db.exec(stmt).all()
     return [
         {
             "id": s.id,
@@ -1279,11 +1449,9 @@ def _do_verify_payment(db: Session, student: Student) -> None:
 def verify_student_payment_endpoint(
     student_id: int,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(team_lead_only("Only Team Lead can verify payment")),
 ):
     """Mark student payment as verified (team_lead only). Resets renewal intent flags. Creates audit log."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only Team Lead can verify payment")
     student = db.get(Student, student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
@@ -1306,19 +1474,15 @@ def get_student_by_lead_endpoint(
 ):
     """Get the student record for a lead (e.g. after join, for welcome email)."""
     from backend.schemas.students import StudentRead
-    from sqlalchemy.orm import selectinload
 
     student = get_student_by_lead_id(db, lead_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found for this lead")
     if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
+        user_center_ids = get_user_center_ids(current_user)
         if student.center_id not in user_center_ids:
             raise HTTPException(status_code=403, detail="Not authorized to view this student")
-    stmt = select(Student).where(Student.id == student.id).options(
-        selectinload(Student.lead),
-        selectinload(Student.batches),
-    )
+    stmt = select(Student).where(Student.id == student.id).options(*STUDENT_READ_OPTIONS)
     student = db.exec(stmt).first()
     return StudentRead.from_student(student).model_dump()
 
@@ -1338,10 +1502,7 @@ def update_student_endpoint(
 ):
     """Update a student's subscription, batches, status, or center (with strict governance)."""
     from backend.core.students import get_student_by_lead_id, update_student
-    from backend.models import Student, StudentBatchLink, Batch
-    from sqlalchemy.orm import selectinload
     from sqlmodel import select
-    from datetime import date as date_type
     
     # Get student
     student = db.get(Student, student_id)
@@ -1350,7 +1511,7 @@ def update_student_endpoint(
     
     # Check permissions (basic access check)
     if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
+        user_center_ids = get_user_center_ids(current_user)
         if student.center_id not in user_center_ids:
             raise HTTPException(status_code=403, detail="Not authorized to update this student")
     
@@ -1360,7 +1521,7 @@ def update_student_endpoint(
         batch_ids_list = []
         if student_batch_ids:
             try:
-                batch_ids_list = [int(id.strip()) for id in student_batch_ids.split(",") if id.strip()]
+                batch_ids_list = _parse_id_list(student_batch_ids)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid student_batch_ids format. Use comma-separated integers")
     
@@ -1369,16 +1530,10 @@ def update_student_endpoint(
     parsed_end_date = None
     
     if subscription_start_date:
-        try:
-            parsed_start_date = datetime.fromisoformat(subscription_start_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid subscription_start_date format: {subscription_start_date}")
+        parsed_start_date = _parse_date(subscription_start_date, field="subscription_start_date")
     
     if subscription_end_date:
-        try:
-            parsed_end_date = datetime.fromisoformat(subscription_end_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid subscription_end_date format: {subscription_end_date}")
+        parsed_end_date = _parse_date(subscription_end_date, field="subscription_end_date")
     
     # Track if subscription is being renewed (new dates or plan provided)
     subscription_renewed = False
@@ -1402,25 +1557,15 @@ def update_student_endpoint(
             subscription_end_date=parsed_end_date,
             payment_proof_url=payment_proof_url,
             student_batch_ids=batch_ids_list,
-            is_active=is_active
+            is_active=is_active,
+            # Renewal Reset: reset renewal flags when subscription is renewed (same commit as the update)
+            reset_renewal=subscription_renewed
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
-    # Renewal Reset: Reset renewal flags when subscription is renewed
-    if subscription_renewed:
-        updated_student.renewal_intent = False
-        updated_student.in_grace_period = False
-        updated_student.grace_nudge_count = 0
-        db.add(updated_student)
-        db.commit()
-        db.refresh(updated_student)
-    
     # Reload with relationships
-    stmt = select(Student).where(Student.id == student_id).options(
-        selectinload(Student.lead),
-        selectinload(Student.batches)
-    )
+    stmt = select(Student).where(Student.id == student_id).options(*STUDENT_READ_OPTIONS)
     updated_student = db.exec(stmt).first()
     
     from backend.schemas.students import StudentRead
@@ -1436,8 +1581,6 @@ def update_renewal_intent_endpoint(
     Public endpoint to update renewal_intent for a student.
     Called from the public renewal page.
     """
-    from backend.models import Student, Lead
-    from sqlalchemy.orm import selectinload
     from sqlmodel import select
     
     # Find student by lead's public_token
@@ -1451,9 +1594,7 @@ def update_renewal_intent_endpoint(
     
     # Find the student associated with this lead
     student = db.exec(
-        select(Student)
-        .where(Student.lead_id == lead.id)
-        .options(selectinload(Student.lead))
+        select(Student).where(Student.lead_id == lead.id)
     ).first()
     
     if not student:
@@ -1495,7 +1636,6 @@ def renew_confirm_public(
     Updates student record, sets renewal_intent=True, is_payment_verified=False.
     Audit: 'Parent submitted renewal transaction via public portal. Pending verification.'
     """
-    from datetime import date as date_type, timedelta
     from backend.core.audit import log_lead_activity
 
     lead = db.exec(select(Lead).where(Lead.public_token == public_token)).first()
@@ -1518,14 +1658,9 @@ def renew_confirm_public(
     if utr and (len(utr) != 12 or not utr.isdigit()):
         raise HTTPException(status_code=400, detail="UTR must be exactly 12 digits")
 
-    try:
-        start_date = date_type.fromisoformat(body.subscription_start_date)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid start_date (use YYYY-MM-DD)")
+    start_date = _parse_date(body.subscription_start_date, detail="Invalid start_date (use YYYY-MM-DD)")
 
-    months_map = {"Monthly": 1, "Quarterly": 3, "3 Months": 3, "6 Months": 6, "Yearly": 12}
-    months = months_map.get(body.subscription_plan, 1)
-    end_date = start_date + timedelta(days=months * 31)
+    end_date = _plan_end_date(body.subscription_plan, start_date)
 
     student.subscription_plan = body.subscription_plan
     student.subscription_start_date = start_date
@@ -1562,8 +1697,6 @@ def send_grace_nudge_endpoint(
     Send a grace period nudge to a student.
     Increments grace_nudge_count.
     """
-    from backend.models import Student, AuditLog
-    from datetime import datetime
     
     student = db.get(Student, student_id)
     if not student:
@@ -1571,7 +1704,7 @@ def send_grace_nudge_endpoint(
     
     # Verify user has access
     if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
+        user_center_ids = get_user_center_ids(current_user)
         if student.center_id not in user_center_ids:
             raise HTTPException(status_code=403, detail="Not authorized to update this student")
     
@@ -1583,28 +1716,27 @@ def send_grace_nudge_endpoint(
     
     # Increment grace_nudge_count
     old_count = student.grace_nudge_count
-    student.grace_nudge_count = old_count + 1
-    
-    # Log the action
-    if student.lead:
-        audit_log = AuditLog(
-            lead_id=student.lead_id,
-            user_id=current_user.id,
-            action_type='grace_nudge_sent',
-            description=f'Grace period nudge sent (grace_nudge_count: {old_count} → {student.grace_nudge_count})',
-            old_value=str(old_count),
-            new_value=str(student.grace_nudge_count),
-            timestamp=datetime.utcnow()
-        )
-        db.add(audit_log)
+    new_count = old_count + 1
+    student.grace_nudge_count = new_count
+    
+    # Log the action in the same commit (lead_id is a non-null FK, so no need to load student.lead)
+    audit_log = AuditLog(
+        lead_id=student.lead_id,
+        user_id=current_user.id,
+        action_type='grace_nudge_sent',
+        description=f'Grace period nudge sent (grace_nudge_count: {old_count} → {new_count})',
+        old_value=str(old_count),
+        new_value=str(new_count),
+        timestamp=datetime.utcnow()
+    )
+    db.add(audit_log)
     
     db.add(student)
     db.commit()
-    db.refresh(student)
     
     return {
         "message": "Grace nudge sent successfully",
-        "grace_nudge_count": student.grace_nudge_count
+        "grace_nudge_count": new_count
     }
 
 
@@ -1619,13 +1751,12 @@ def send_welcome_email_endpoint(
     Uses placeholder email sender; configure EMAIL_API_KEY (Resend/SendGrid) for real sending.
     """
     from backend.core.emails import send_welcome_email
-    from backend.models import Student
 
     student = db.get(Student, student_id)
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
+        user_center_ids = get_user_center_ids(current_user)
         if student.center_id not in user_center_ids:
             raise HTTPException(status_code=403, detail="Not authorized for this student")
     try:
@@ -1644,8 +1775,6 @@ def get_student_by_token_endpoint(
     Public endpoint to get student information by public_token.
     Used by the renewal page to display student info.
     """
-    from backend.models import Student, Lead
-    from sqlalchemy.orm import selectinload
     from sqlmodel import select
     
     # Find lead by public_token
@@ -1660,7 +1789,7 @@ def get_student_by_token_endpoint(
     student = db.exec(
         select(Student)
         .where(Student.lead_id == lead.id)
-        .options(selectinload(Student.lead), selectinload(Student.batches))
+        .options(*STUDENT_READ_OPTIONS)
     ).first()
     
     if not student:
@@ -1678,26 +1807,11 @@ def update_date_of_birth_endpoint(
     current_user: User = Depends(get_current_user)
 ):
     """Update a lead's date of birth. Age is derived from this in the UI."""
-    from backend.core.leads import get_lead_by_id
-    from datetime import date as date_type
     
     # Verify user has access to this lead
-    lead = get_lead_by_id(db, lead_id)
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
+    lead = _authorize_lead(db, lead_id, current_user, "Not authorized to update this lead")
     
-    # Check permissions
-    if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
-        if lead.center_id not in user_center_ids:
-            raise HTTPException(status_code=403, detail="Not authorized to update this lead")
-    
-    dob_parsed = None
-    if date_of_birth:
-        try:
-            dob_parsed = date_type.fromisoformat(date_of_birth)
-        except (ValueError, TypeError):
-            raise HTTPException(status_code=400, detail="date_of_birth must be YYYY-MM-DD")
+    dob_parsed = _parse_date(date_of_birth, detail="date_of_birth must be YYYY-MM-DD") if date_of_birth else None
     
     try:
         updated_lead = update_lead(
@@ -1707,6 +1821,7 @@ def update_date_of_birth_endpoint(
             date_of_birth=dob_parsed,
             user_id=current_user.id
         )
+        _invalidate_lead_views(current_user.id)
         return {"status": "updated", "date_of_birth": updated_lead.date_of_birth.isoformat() if updated_lead.date_of_birth else None}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1721,10 +1836,9 @@ def update_lead_metadata_endpoint(
 ):
     """Update a lead's extra_data field (e.g., skill reports)."""
     from backend.core.lead_metadata import update_lead_metadata
-    from backend.core.leads import get_lead_by_id, get_leads_for_user
     
-    # Verify user has access to this lead
-    lead = get_lead_by_id(db, lead_id)
+    # Verify user has access to this lead (center access resolved in the same query)
+    lead, has_center_access = get_lead_with_access(db, lead_id, current_user)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     
@@ -1733,37 +1847,32 @@ def update_lead_metadata_endpoint(
         # Coaches can only update skill reports for leads/students in their assigned batches
         # Check: 1) lead has trial_batch_id or permanent_batch_id in coach's batches
         # 2) OR lead has associated student assigned to batches via StudentBatchLink
-        from backend.models import BatchCoachLink, StudentBatchLink, Student
         from sqlmodel import select
         
-        # Get coach's assigned batch IDs
-        coach_batch_ids = db.exec(
-            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == current_user.id)
-        ).all()
-        coach_batch_ids_list = list(coach_batch_ids)
+        # Get coach's assigned batch IDs (memoized for the request)
+        coach_batch_ids = get_coach_batch_ids(db, current_user)
         
-        if not coach_batch_ids_list:
+        if not coach_batch_ids:
             raise HTTPException(status_code=403, detail="You don't have any assigned batches")
         
         # Check if lead is in coach's batches via trial_batch_id or permanent_batch_id
         lead_in_batch = (
-            (lead.trial_batch_id and lead.trial_batch_id in coach_batch_ids_list) or
-            (lead.permanent_batch_id and lead.permanent_batch_id in coach_batch_ids_list)
+            (lead.trial_batch_id and lead.trial_batch_id in coach_batch_ids) or
+            (lead.permanent_batch_id and lead.permanent_batch_id in coach_batch_ids)
         )
         
-        # If not, check if lead has associated student assigned to coach's batches
+        # If not, check if lead has associated student assigned to coach's batches (one query)
         student_in_batch = False
         if not lead_in_batch:
-            student = db.exec(select(Student).where(Student.lead_id == lead_id)).first()
-            if student:
-                # Check if student is assigned to any of coach's batches
-                student_batch_links = db.exec(
-                    select(StudentBatchLink.batch_id).where(
-                        StudentBatchLink.student_id == student.id,
-                        StudentBatchLink.batch_id.in_(coach_batch_ids_list)
-                    )
-                ).all()
-                student_in_batch = len(list(student_batch_links)) > 0
+            student_in_batch = db.exec(
+                select(StudentBatchLink.batch_id)
+                .join(Student, Student.id == StudentBatchLink.student_id)
+                .where(
+                    Student.lead_id == lead_id,
+                    StudentBatchLink.batch_id.in_(coach_batch_ids)
+                )
+                .limit(1)
+            ).first() is not None
         
         if not lead_in_batch and not student_in_batch:
             raise HTTPException(status_code=403, detail="You don't have access to update this lead/student")
@@ -1777,8 +1886,7 @@ def update_lead_metadata_endpoint(
         pass
     else:
         # Regular users (sales) can update leads in their assigned centers
-        user_center_ids = [c.id for c in current_user.centers]
-        if lead.center_id not in user_center_ids:
+        if not has_center_access:
             raise HTTPException(status_code=403, detail="Not authorized to update this lead")
     
     try:
@@ -1793,10 +1901,14 @@ def update_lead_metadata_endpoint(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+ACTIVITY_MAX_PAGE_SIZE = 200
+
+
 @app.get("/leads/{lead_id}/activity")
 def get_lead_activity(
     lead_id: int,
     limit: Optional[int] = 50,
+    before_id: Optional[int] = None,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -1804,25 +1916,20 @@ def get_lead_activity(
     Get activity/audit log for a specific lead.
     
     Query Parameters:
-        limit: Maximum number of activities to return (default: 50)
+        limit: Maximum number of activities to return (default: 50, capped at ACTIVITY_MAX_PAGE_SIZE)
+        before_id: Keyset cursor; pass the previous page's next_before_id to get older entries
     """
-    from backend.core.leads import get_lead_by_id
-    from sqlmodel import select
-    
     # Verify user has access to this lead
-    lead = get_lead_by_id(db, lead_id)
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
+    _authorize_lead(db, lead_id, current_user, "Not authorized to view this lead")
     
-    # Check permissions
-    if current_user.role != "team_lead":
-        user_center_ids = [c.id for c in current_user.centers]
-        if lead.center_id not in user_center_ids:
-            raise HTTPException(status_code=403, detail="Not authorized to view this lead")
+    limit = max(1, min(limit or ACTIVITY_MAX_PAGE_SIZE, ACTIVITY_MAX_PAGE_SIZE))
     
     # Get audit logs
-    logs = get_audit_logs_for_lead(db, lead_id, limit=limit)
-    return {"activities": logs}
+    logs = get_audit_logs_for_lead(db, lead_id, limit=limit, before_id=before_id)
+    return ORJSONResponse({
+        "activities": [log.model_dump() for log in logs],
+        "next_before_id": logs[-1].id if len(logs) == limit else None,
+    })
 
 
 # --- BULK OPERATIONS ENDPOINTS ---
@@ -1834,24 +1941,15 @@ def bulk_update_status(
 ):
     """
     Bulk update lead status.
+    Access is verified in the same query that loads the leads.
     """
-    # Verify user has access to all leads
-    accessible_lead_ids = verify_leads_accessible(db, request.lead_ids, current_user)
-    
-    if len(accessible_lead_ids) != len(request.lead_ids):
-        return {
-            "updated_count": 0,
-            "errors": ["Some leads are not accessible or not found"],
-            "accessible_lead_ids": accessible_lead_ids
-        }
-    
     result = bulk_update_lead_status(
         db=db,
-        lead_ids=accessible_lead_ids,
+        lead_ids=request.lead_ids,
         new_status=request.new_status,
-        user_id=current_user.id
+        user=current_user
     )
-    
+    _invalidate_lead_views(current_user.id)
     return result
 
 
@@ -1859,31 +1957,19 @@ def bulk_update_status(
 def bulk_assign_center(
     request: BulkAssignCenterRequest,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can reassign leads"))
 ):
     """
     Bulk assign leads to a center.
     Only team leads can perform this operation.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can reassign leads")
-    
-    # Verify user has access to all leads
-    accessible_lead_ids = verify_leads_accessible(db, request.lead_ids, current_user)
-    
-    if len(accessible_lead_ids) != len(request.lead_ids):
-        return {
-            "updated_count": 0,
-            "errors": ["Some leads are not accessible or not found"],
-            "accessible_lead_ids": accessible_lead_ids
-        }
-    
     result = bulk_update_lead_assignment(
         db=db,
-        lead_ids=accessible_lead_ids,
+        lead_ids=request.lead_ids,
         new_center_id=request.center_id,
-        user_id=current_user.id
+        user=current_user
     )
+    _invalidate_lead_views()
     # Bell only (Low Priority): Lead(s) assigned to center
     if result.get("updated_count", 0) > 0:
         try:
@@ -1919,14 +2005,10 @@ def get_command_center_analytics(
     """
     from backend.core.analytics import get_command_center_analytics
     
-    target = None
-    if target_date:
-        try:
-            target = datetime.fromisoformat(target_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    target = _parse_date(target_date) if target_date else None
     
-    return get_command_center_analytics(db, current_user, target)
+    # Nested dicts of primitives/dates: orjson serializes them directly (no jsonable_encoder pass)
+    return ORJSONResponse(get_command_center_analytics(db, current_user, target))
 
 
 @app.get("/students/{student_id}/milestones")
@@ -1941,7 +2023,6 @@ def get_student_milestones_endpoint(
     Returns total sessions attended and milestone information.
     """
     from backend.core.analytics import get_student_milestones
-    from backend.models import Student, BatchCoachLink, StudentBatchLink
     from sqlmodel import select
     
     # Verify student exists and user has access
@@ -1952,27 +2033,24 @@ def get_student_milestones_endpoint(
     # Check access permissions based on role
     if current_user.role == "coach":
         # Coaches can view milestones for students in their assigned batches
-        coach_batch_ids = db.exec(
-            select(BatchCoachLink.batch_id).where(BatchCoachLink.user_id == current_user.id)
-        ).all()
-        coach_batch_ids_list = list(coach_batch_ids)
+        coach_batch_ids = get_coach_batch_ids(db, current_user)
         
-        if not coach_batch_ids_list:
+        if not coach_batch_ids:
             raise HTTPException(status_code=403, detail="You don't have any assigned batches")
         
-        # Check if student is assigned to any of coach's batches
-        student_batch_links = db.exec(
+        # Check if student is assigned to any of coach's batches (first match is enough)
+        in_coach_batch = db.exec(
             select(StudentBatchLink.batch_id).where(
                 StudentBatchLink.student_id == student_id,
-                StudentBatchLink.batch_id.in_(coach_batch_ids_list)
-            )
-        ).all()
+                StudentBatchLink.batch_id.in_(coach_batch_ids)
+            ).limit(1)
+        ).first() is not None
         
-        if not list(student_batch_links):
+        if not in_coach_batch:
             raise HTTPException(status_code=403, detail="Not authorized to view this student")
     elif current_user.role != "team_lead":
         # Regular users (sales) can view students in their assigned centers
-        center_ids = [c.id for c in current_user.centers]
+        center_ids = get_user_center_ids(current_user)
         if student.center_id not in center_ids:
             raise HTTPException(status_code=403, detail="Not authorized to view this student")
     
@@ -1983,7 +2061,7 @@ def get_student_milestones_endpoint(
 @app.post("/subscriptions/run-expiry-check")
 def run_subscription_expiry_check(
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can trigger subscription expiry check"))
 ):
     """
     Manually trigger subscription expiry check.
@@ -1991,9 +2069,6 @@ def run_subscription_expiry_check(
     
     Requires team_lead role.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can trigger subscription expiry check")
-    
     from backend.core.subscriptions import check_subscription_expirations
     
     expired_lead_ids = check_subscription_expirations(db)
@@ -2005,8 +2080,27 @@ def run_subscription_expiry_check(
     }
 
 
+ANALYTICS_CACHE_CONTROL = "private, max-age=60"
+
+
+def _cacheable_json(request: Request, content) -> Response:
+    """
+    JSON response with a weak ETag and short private Cache-Control.
+    Returns 304 (no body) when the client's If-None-Match already matches.
+    """
+    import hashlib
+    response = ORJSONResponse(jsonable_encoder(content))
+    etag = f'W/"{hashlib.md5(response.body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": ANALYTICS_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
 @app.get("/analytics/conversion-rates")
 def get_conversion_rates(
+    request: Request,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -2014,11 +2108,12 @@ def get_conversion_rates(
     Get conversion rates and business funnel (5-min cached).
     Returns legacy conversion_rates and new funnel (Engagement, Commitment, Success).
     """
-    return get_conversion_rates_cached(db)
+    return _cacheable_json(request, get_conversion_rates_cached(db))
 
 
 @app.get("/analytics/time-to-contact")
 def get_time_to_contact(
+    request: Request,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -2027,49 +2122,52 @@ def get_time_to_contact(
     """
     avg_hours = calculate_average_time_to_contact_cached(db)
     if avg_hours is None:
-        return {"average_hours": None, "message": "No data available"}
-    return {"average_hours": avg_hours}
+        return _cacheable_json(request, {"average_hours": None, "message": "No data available"})
+    return _cacheable_json(request, {"average_hours": avg_hours})
 
 
 @app.get("/analytics/status-distribution")
 def get_status_distribution_endpoint(
+    request: Request,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get count of leads per status.
+    Get count of leads per status (60s cached).
     """
-    distribution = get_status_distribution(db)
-    return {"distribution": distribution}
+    distribution = get_status_distribution_cached(db)
+    return _cacheable_json(request, {"distribution": distribution})
 
 
 @app.get("/analytics/abandoned-count")
 def get_abandoned_leads_count_endpoint(
+    request: Request,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get the count of abandoned leads.
+    Get the count of abandoned leads (60s cached).
     """
-    count = get_abandoned_leads_count(db)
-    return {"abandoned_leads_count": count}
+    count = get_abandoned_leads_count_cached(db)
+    return _cacheable_json(request, {"abandoned_leads_count": count})
 
 
 @app.get("/analytics/at-risk-count")
 def get_at_risk_leads_count_endpoint(
+    request: Request,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get the count of at-risk leads (10 days inactive).
+    Get the count of at-risk leads (10 days inactive, 60s cached).
     """
-    count = get_at_risk_leads_count(db)
-    return {"at_risk_leads_count": count}
+    count = get_at_risk_leads_count_cached(db)
+    return _cacheable_json(request, {"at_risk_leads_count": count})
 
 
 # --- REPORT AUDIT ENDPOINTS ---
 @app.post("/leads/{lead_id}/report-sent")
-async def log_report_sent_endpoint(
+def log_report_sent_endpoint(
     lead_id: int,
     details: Optional[str] = None,
     db: Session = Depends(get_session),
@@ -2097,7 +2195,7 @@ async def log_report_sent_endpoint(
 
 # --- SKILL EVALUATION ENDPOINTS ---
 @app.post("/leads/{lead_id}/skills")
-async def create_skill_evaluation_endpoint(
+def create_skill_evaluation_endpoint(
     lead_id: int,
     technical_score: int,
     fitness_score: int,
@@ -2140,7 +2238,7 @@ async def create_skill_evaluation_endpoint(
 
 
 @app.get("/leads/{lead_id}/skills/summary")
-async def get_skill_summary_endpoint(
+def get_skill_summary_endpoint(
     lead_id: int,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
@@ -2152,25 +2250,18 @@ async def get_skill_summary_endpoint(
     Path Parameters:
         lead_id: Lead (student) ID
     """
-    # Verify lead exists
-    lead = db.get(Lead, lead_id)
-    if not lead:
+    # Existence, privacy check (coaches: only leads in their batches) and summary in one query
+    lead_exists, has_access, summary = get_skill_summary_with_access(db, lead_id, current_user)
+    if not lead_exists:
         raise HTTPException(status_code=404, detail="Lead not found")
-    
-    # Privacy check: coaches can only see evaluations for leads in their batches
-    if current_user.role == "coach":
-        from backend.core.leads import get_leads_for_user
-        user_leads, _ = get_leads_for_user(db, current_user, limit=10000)
-        if not any(l.id == lead_id for l in user_leads):
-            raise HTTPException(status_code=403, detail="You don't have access to this lead")
-    
-    summary = get_skill_summary_for_lead(db, lead_id)
+    if not has_access:
+        raise HTTPException(status_code=403, detail="You don't have access to this lead")
     return summary
 
 
 # --- LEAD STAGING ENDPOINTS ---
 @app.post("/staging/leads")
-async def create_staging_lead_endpoint(
+def create_staging_lead_endpoint(
     player_name: str = Body(...),
     phone: str = Body(...),
     email: Optional[str] = Body(None),
@@ -2192,16 +2283,9 @@ async def create_staging_lead_endpoint(
         date_of_birth: Optional date (YYYY-MM-DD)
         center_id: Center ID
     """
-    if current_user.role not in ("coach", "team_lead", "team_member"):
-        raise HTTPException(status_code=403, detail="Only coaches and team members can create staging leads")
+    require_role(current_user, STAGING_CREATOR_ROLES, "Only coaches and team members can create staging leads")
     
-    from datetime import date as date_type
-    dob_parsed = None
-    if date_of_birth:
-        try:
-            dob_parsed = date_type.fromisoformat(date_of_birth)
-        except (ValueError, TypeError):
-            raise HTTPException(status_code=400, detail="date_of_birth must be YYYY-MM-DD")
+    dob_parsed = _parse_date(date_of_birth, detail="date_of_birth must be YYYY-MM-DD") if date_of_birth else None
     
     try:
         staging_lead = create_staging_lead(
@@ -2235,7 +2319,7 @@ async def create_staging_lead_endpoint(
 
 
 @app.get("/staging/leads")
-async def get_staging_leads_endpoint(
+def get_staging_leads_endpoint(
     center_id: Optional[int] = None,
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
@@ -2247,15 +2331,14 @@ async def get_staging_leads_endpoint(
     Query Parameters:
         center_id: Optional center ID to filter by (overrides user centers)
     """
-    if current_user.role not in ["team_lead", "team_member"]:
-        raise HTTPException(status_code=403, detail="Only Team Leads and Team Members can view staging leads")
+    require_role(current_user, SALES_ROLES, "Only Team Leads and Team Members can view staging leads")
     
     staging_leads = get_staging_leads(db=db, user=current_user, center_id=center_id)
     return staging_leads
 
 
 @app.post("/staging/leads/{staging_id}/promote")
-async def promote_staging_lead_endpoint(
+def promote_staging_lead_endpoint(
     staging_id: int,
     date_of_birth: Optional[str] = Body(None),
     email: Optional[str] = Body(None),
@@ -2272,16 +2355,9 @@ async def promote_staging_lead_endpoint(
         email: Optional email address (overrides staging email if provided)
         address: Optional address
     """
-    if current_user.role not in ["team_lead", "team_member"]:
-        raise HTTPException(status_code=403, detail="Only Team Leads and Team Members can promote staging leads")
+    require_role(current_user, SALES_ROLES, "Only Team Leads and Team Members can promote staging leads")
     try:
-        from datetime import date as date_type
-        dob_parsed = None
-        if date_of_birth:
-            try:
-                dob_parsed = date_type.fromisoformat(date_of_birth)
-            except (ValueError, TypeError):
-                raise HTTPException(status_code=400, detail="date_of_birth must be YYYY-MM-DD")
+        dob_parsed = _parse_date(date_of_birth, detail="date_of_birth must be YYYY-MM-DD") if date_of_birth else None
         lead = promote_staging_lead(
             db=db,
             staging_id=staging_id,
@@ -2290,6 +2366,7 @@ async def promote_staging_lead_endpoint(
             address=address,
             user_id=current_user.id,
         )
+        _invalidate_lead_views()
         return {
             "id": lead.id,
             "player_name": lead.player_name,
@@ -2301,9 +2378,26 @@ async def promote_staging_lead_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/staging/leads/promote-bulk")
+def promote_staging_leads_bulk_endpoint(
+    request: BulkPromoteStagingRequest,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Promote several staging leads in one request and one commit (Team Leads and Team Members only).
+    DOB comes from the staging record (or its age); staging leads without either are
+    reported in `errors` and left in staging.
+    """
+    require_role(current_user, SALES_ROLES, "Only Team Leads and Team Members can promote staging leads")
+    result = promote_staging_leads_bulk(db=db, staging_ids=request.staging_ids, user_id=current_user.id)
+    _invalidate_lead_views()
+    return result
+
+
 # --- DIRECT LEAD CREATION ENDPOINT (Team Leads and Team Members) ---
 @app.post("/leads")
-async def create_lead_endpoint(
+def create_lead_endpoint(
     player_name: str = Body(...),
     phone: str = Body(...),
     email: Optional[str] = Body(None),
@@ -2328,11 +2422,10 @@ async def create_lead_endpoint(
 
     Status is always set to "New" for manually created leads.
     """
-    if current_user.role not in ("team_lead", "team_member"):
-        raise HTTPException(status_code=403, detail="Only Team Leads and Team Members can create leads")
+    require_role(current_user, SALES_ROLES, "Only Team Leads and Team Members can create leads")
     # Team members can only create leads in their assigned centers
     if current_user.role == "team_member":
-        user_center_ids = [c.id for c in current_user.centers]
+        user_center_ids = get_user_center_ids(current_user)
         if center_id not in user_center_ids:
             raise HTTPException(status_code=403, detail="You can only create leads in your assigned centers")
     # Check for duplicates
@@ -2340,22 +2433,13 @@ async def create_lead_endpoint(
         raise HTTPException(status_code=400, detail="A lead with this name and phone number already exists")
     
     try:
-        from datetime import timedelta, date as date_type
-        from backend.models import Lead
-        import uuid
-        
-        # Verify center exists
-        center = db.get(Center, center_id)
+        # Verify center exists (served from the 60s centers cache; no query per lead)
+        center = get_center_cached(db, center_id)
         if not center:
             raise HTTPException(status_code=400, detail=f"Center {center_id} not found")
         
         # Parse optional date_of_birth
-        dob_parsed = None
-        if date_of_birth:
-            try:
-                dob_parsed = date_type.fromisoformat(date_of_birth)
-            except (ValueError, TypeError):
-                raise HTTPException(status_code=400, detail="date_of_birth must be YYYY-MM-DD")
+        dob_parsed = _parse_date(date_of_birth, detail="date_of_birth must be YYYY-MM-DD") if date_of_birth else None
         
         # Create lead
         now = datetime.utcnow()
@@ -2377,14 +2461,13 @@ async def create_lead_endpoint(
         db.add(new_lead)
         db.commit()
         db.refresh(new_lead)
+        _invalidate_lead_views()
         # Bell only (Low Priority) - no email for new leads
         try:
             from backend.core.notifications import notify_center_users
-            import os
             base_url = os.getenv("CRM_BASE_URL", "").strip().rstrip("/")
-            from urllib.parse import quote
             link = f"{base_url}/leads?search={quote(new_lead.phone or '')}" if base_url else None
-            center_name = center.display_name or center.city or "Unknown"
+            center_name = center["display_name"] or center["city"] or "Unknown"
             notify_center_users(
                 db, new_lead.center_id,
                 type="SALES_ALERT",
@@ -2394,16 +2477,83 @@ async def create_lead_endpoint(
                 priority="low",
             )
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).exception("New lead in-app notification failed: %s", e)
+            logger.exception("New lead in-app notification failed: %s", e)
         return new_lead
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+LEADS_BULK_MAX_SIZE = 10000
+
+
+@app.post("/leads/bulk")
+def create_leads_bulk_endpoint(
+    request: BulkCreateLeadsRequest,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create many lead records in one request (Team Leads and Team Members), e.g. for backfills.
+    Same rules as POST /leads, but duplicates are skipped (reported by index) instead of failing
+    the batch, and there is one summary notification per center instead of one per lead.
+    """
+    require_role(current_user, SALES_ROLES, "Only Team Leads and Team Members can create leads")
+    if len(request.leads) > LEADS_BULK_MAX_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {LEADS_BULK_MAX_SIZE} leads per request")
+
+    center_ids = {lead.center_id for lead in request.leads}
+    # Team members can only create leads in their assigned centers
+    if current_user.role == "team_member" and not center_ids <= get_user_center_ids(current_user):
+        raise HTTPException(status_code=403, detail="You can only create leads in your assigned centers")
+    # Verify all centers exist (served from the 60s centers cache, like POST /leads)
+    centers = {c["id"]: c for c in get_all_centers_cached(db) if c["id"] in center_ids}
+    missing = sorted(center_ids - centers.keys())
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Center {missing[0]} not found")
+
+    records = [
+        {
+            **lead.model_dump(exclude={"date_of_birth"}),
+            "date_of_birth": (
+                _parse_date(lead.date_of_birth, detail="date_of_birth must be YYYY-MM-DD") if lead.date_of_birth else None
+            ),
+        }
+        for lead in request.leads
+    ]
+    lead_ids, skipped = create_leads_bulk(db, records)
+    _invalidate_lead_views()
+
+    # Bell only (Low Priority): one summary per center
+    created_by_center: Dict[int, int] = {}
+    skipped_indexes = {s["index"] for s in skipped}
+    for index, record in enumerate(records):
+        if index not in skipped_indexes:
+            created_by_center[record["center_id"]] = created_by_center.get(record["center_id"], 0) + 1
+    for center_id, count in created_by_center.items():
+        try:
+            from backend.core.notifications import notify_center_users
+            center = centers[center_id]
+            center_name = center["display_name"] or center["city"] or "Unknown"
+            notify_center_users(
+                db, center_id,
+                type="SALES_ALERT",
+                title=f"{count} new lead(s) at {center_name}",
+                message=f"{count} lead(s) were added manually at {center_name}. Check Leads to follow up.",
+                link="/leads",
+                priority="low",
+            )
+        except Exception as e:
+            logger.exception("Bulk lead in-app notification failed: %s", e)
+
+    return {"created_count": len(lead_ids), "lead_ids": lead_ids, "skipped": skipped}
+
+
 # --- ATTENDANCE ENDPOINTS ---
+ATTENDANCE_STATUSES = frozenset(("Present", "Absent", "Excused", "Late"))
+
+
 @app.post("/attendance/check-in")
-async def check_in_endpoint(
+def check_in_endpoint(
     batch_id: int,
     status: str,  # 'Present', 'Absent', 'Excused', 'Late'
     lead_id: Optional[int] = None,
@@ -2418,8 +2568,6 @@ async def check_in_endpoint(
     Only coaches assigned to the batch can record attendance.
     Must provide either lead_id (for trial students) or student_id (for active students).
     """
-    from datetime import date as date_class
-    from backend.models import Student
     
     # Validate that at least one ID is provided
     if not lead_id and not student_id:
@@ -2436,17 +2584,10 @@ async def check_in_endpoint(
         lead_id = student.lead_id
     
     # Parse date if provided
-    attendance_date = None
-    if date:
-        try:
-            attendance_date = datetime.fromisoformat(date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-    else:
-        attendance_date = date_class.today()
+    attendance_date = _parse_date(date) if date else date_type.today()
     
     # Validate status
-    if status not in ["Present", "Absent", "Excused", "Late"]:
+    if status not in ATTENDANCE_STATUSES:
         raise HTTPException(status_code=400, detail="Status must be one of: Present, Absent, Excused, Late")
     
     try:
@@ -2474,46 +2615,149 @@ async def check_in_endpoint(
         raise HTTPException(status_code=403, detail=str(e))
 
 
+@app.post("/attendance/bulk")
+def bulk_check_in_endpoint(
+    request: BulkAttendanceRequest,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Record attendance for a whole batch session at once (one commit for the plain records).
+    Only coaches assigned to the batch can record attendance.
+    Each record must provide either lead_id (for trial students) or student_id (for active students).
+    """
+    
+    attendance_date = _parse_date(request.date) if request.date else date_type.today()
+    for record in request.records:
+        if not record.lead_id and not record.student_id:
+            raise HTTPException(status_code=400, detail="Either lead_id or student_id must be provided")
+        if record.status not in ATTENDANCE_STATUSES:
+            raise HTTPException(status_code=400, detail="Status must be one of: Present, Absent, Excused, Late")
+    
+    # Resolve student_id -> lead_id for all records in one query
+    student_ids = [r.student_id for r in request.records if r.student_id and not r.lead_id]
+    lead_by_student = dict(db.exec(
+        select(Student.id, Student.lead_id).where(Student.id.in_(student_ids))
+    ).all()) if student_ids else {}
+    missing = [sid for sid in student_ids if sid not in lead_by_student]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Student {missing[0]} not found")
+    
+    records = [
+        {
+            "lead_id": r.lead_id or lead_by_student[r.student_id],
+            "status": r.status,
+            "remarks": r.remarks,
+            "internal_note": r.internal_note,
+        }
+        for r in request.records
+    ]
+    try:
+        return record_attendance_bulk(
+            db=db,
+            batch_id=request.batch_id,
+            user_id=current_user.id,
+            date=attendance_date,
+            records=records
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/attendance/history/{lead_id}")
-async def get_attendance_history_endpoint(
+def get_attendance_history_endpoint(
     lead_id: int,
-    db: Session = Depends(get_session),
+    limit: Optional[int] = None,
+    before: Optional[str] = None,
+    before_id: Optional[int] = None,
+    stream: bool = False,
+    db: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get attendance history for a specific lead.
     Coaches can only see attendance for leads in their batches.
+    
+    Query Parameters:
+        limit: Optional page size (omit for full history)
+        before: Keyset cursor - only records older than this date (YYYY-MM-DD)
+        before_id: Keyset tie-breaker - with `before`, also include records on that date with a smaller id
+        stream: If true, stream the whole (remaining) history as NDJSON, one record per line
     """
+    before_date = _parse_date(before) if before else None
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    
     try:
-        history = get_attendance_history(db=db, lead_id=lead_id, user=current_user)
-        # Format response to match frontend expectation
-        return {
+        if stream:
+            # First page fetched here so access errors still surface as 400/403, not a broken stream
+            first_page = get_attendance_history_rows(
+                db=db, lead_id=lead_id, user=current_user,
+                limit=ATTENDANCE_STREAM_PAGE_SIZE, before=before_date, before_id=before_id,
+            )
+            return StreamingResponse(
+                _stream_attendance_ndjson(current_user.id, lead_id, first_page),
+                media_type="application/x-ndjson",
+            )
+        
+        history = get_attendance_history_rows(
+            db=db, lead_id=lead_id, user=current_user,
+            limit=limit, before=before_date, before_id=before_id,
+        )
+        # Format response to match frontend expectation (plain column rows, no ORM objects).
+        # Returned as ORJSONResponse directly: orjson writes the slotted AttendanceRow
+        # dataclasses and their dates/datetimes itself, so no per-row dicts or jsonable_encoder pass.
+        return ORJSONResponse({
             "lead_id": lead_id,
-            "attendance": [
-                {
-                    "id": att.id,
-                    "batch_id": att.batch_id,
-                    "date": att.date.isoformat(),
-                    "status": att.status,
-                    "remarks": att.remarks,
-                    "recorded_at": att.recorded_at.isoformat() if att.recorded_at else None,
-                    "coach_id": att.user_id
-                }
-                for att in history
-            ],
-            "count": len(history)
-        }
+            "attendance": [AttendanceRow(*row) for row in history],
+            "count": len(history),
+            # Cursor for the next page (only when a full page was returned)
+            "next_before": history[-1][2] if limit and len(history) == limit else None,
+            "next_before_id": history[-1][0] if limit and len(history) == limit else None,
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 
+ATTENDANCE_STREAM_PAGE_SIZE = 500
+
+
+def _stream_attendance_ndjson(user_id: int, lead_id: int, first_page: List[tuple]):
+    """
+    Yield attendance records as NDJSON lines, walking the history by keyset pages so
+    long histories are never held in memory at once. Later pages use their own session:
+    the request session is closed once the endpoint returns, before the body is streamed.
+    """
+    import orjson
+    
+    def encode(page):
+        return b"".join(orjson.dumps(AttendanceRow(*row)) + b"\n" for row in page)
+    
+    page = first_page
+    if page:
+        yield encode(page)
+    if len(page) < ATTENDANCE_STREAM_PAGE_SIZE:
+        return
+    with Session(engine) as stream_db:
+        user = stream_db.get(User, user_id)
+        if user is None:
+            return
+        while len(page) == ATTENDANCE_STREAM_PAGE_SIZE:
+            page = get_attendance_history_rows(
+                stream_db, lead_id, user,
+                limit=ATTENDANCE_STREAM_PAGE_SIZE, before=page[-1][2], before_id=page[-1][0],
+            )
+            if page:
+                yield encode(page)
+
+
 # --- TASK QUEUE & CALENDAR ENDPOINTS ---
 @app.get("/tasks/daily-queue")
 def get_daily_task_queue_endpoint(
     target_date: Optional[str] = None,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -2522,12 +2766,7 @@ def get_daily_task_queue_endpoint(
     Query Parameters:
         target_date: Optional date in YYYY-MM-DD format (defaults to today)
     """
-    target = None
-    if target_date:
-        try:
-            target = datetime.fromisoformat(target_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    target = _parse_date(target_date) if target_date else None
     
     return get_daily_task_queue(db, current_user, target)
 
@@ -2544,12 +2783,7 @@ def get_daily_stats_endpoint(
     Query Parameters:
         target_date: Optional date in YYYY-MM-DD format (defaults to today)
     """
-    target = None
-    if target_date:
-        try:
-            target = datetime.fromisoformat(target_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    target = _parse_date(target_date) if target_date else None
     
     return get_daily_stats(db, current_user, target)
 
@@ -2563,7 +2797,7 @@ def get_calendar_month_endpoint(
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get calendar data for a specific month with workload heatmap.
+    Get calendar data for a specific month with workload heatmap (60s cached).
     
     Query Parameters:
         year: Year (e.g., 2024)
@@ -2580,7 +2814,7 @@ def get_calendar_month_endpoint(
     if not (1 <= month <= 12):
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
     
-    return get_calendar_month_view(db, current_user, year, month, center_id_list)
+    return get_calendar_month_view_cached(db, current_user, year, month, center_id_list)
 
 
 @app.get("/user/stats/streak")
@@ -2588,8 +2822,8 @@ def get_user_streak_endpoint(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Get user's completion streak stats."""
-    return get_user_completion_streak(db, current_user.id)
+    """Get user's completion streak stats (5-min cached)."""
+    return get_user_completion_streak_cached(db, current_user.id)
 
 
 @app.get("/user/stats/today")
@@ -2599,21 +2833,35 @@ def get_user_today_stats_endpoint(
     current_user: User = Depends(get_current_user)
 ):
     """Get user's completion stats for today (or specified date)."""
-    target = None
-    if target_date:
-        try:
-            target = datetime.fromisoformat(target_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    target = _parse_date(target_date) if target_date else None
     
     return get_user_today_completion_stats(db, current_user.id, target)
 
 
 # --- BATCH MANAGEMENT ENDPOINTS ---
+# Batch day-flag columns in week order, with their display labels
+BATCH_DAY_FLAGS = (
+    ("is_mon", "Mon"), ("is_tue", "Tue"), ("is_wed", "Wed"), ("is_thu", "Thu"),
+    ("is_fri", "Fri"), ("is_sat", "Sat"), ("is_sun", "Sun"),
+)
+
+
+def _schedule_string(flag_values) -> str:
+    """Human-readable schedule ("Mon, Wed") for day-flag values in BATCH_DAY_FLAGS order."""
+    return ", ".join(day for (_, day), on in zip(BATCH_DAY_FLAGS, flag_values) if on) or "No days selected"
+
+
+# All 128 day-flag combinations precomputed: the listing does one dict lookup per batch
+BATCH_SCHEDULE_STRINGS = {
+    flag_values: _schedule_string(flag_values)
+    for flag_values in itertools.product((False, True), repeat=len(BATCH_DAY_FLAGS))
+}
+
+
 @app.get("/batches")
 def get_batches_endpoint(
     center_id: Optional[int] = None,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -2623,19 +2871,18 @@ def get_batches_endpoint(
     """
     batches = get_all_batches(db, user=current_user, center_id=center_id)
     
-    # Get coaches for each batch
+    # Get coaches for all batches in one query; serialize each coach once even if they run many batches
+    coaches_by_batch = get_coaches_for_batches(db, [b.id for b in batches])
+    coach_dicts = {
+        c.id: {"id": c.id, "full_name": c.full_name, "email": c.email}
+        for coaches in coaches_by_batch.values() for c in coaches
+    }
     batches_with_coaches = []
     for batch in batches:
-        # Build schedule string from day flags
-        schedule_days = []
-        if batch.is_mon: schedule_days.append("Mon")
-        if batch.is_tue: schedule_days.append("Tue")
-        if batch.is_wed: schedule_days.append("Wed")
-        if batch.is_thu: schedule_days.append("Thu")
-        if batch.is_fri: schedule_days.append("Fri")
-        if batch.is_sat: schedule_days.append("Sat")
-        if batch.is_sun: schedule_days.append("Sun")
-        schedule_string = ", ".join(schedule_days) if schedule_days else "No days selected"
+        flags = {field: getattr(batch, field) for field, _ in BATCH_DAY_FLAGS}
+        # Schedule string from the precomputed table (falls back for legacy NULL flags)
+        flag_values = tuple(flags.values())
+        schedule_string = BATCH_SCHEDULE_STRINGS.get(flag_values) or _schedule_string(flag_values)
         
         batch_dict = {
             "id": batch.id,
@@ -2644,23 +2891,18 @@ def get_batches_endpoint(
             "min_age": batch.min_age,
             "max_age": batch.max_age,
             "max_capacity": batch.max_capacity,
-            "is_mon": batch.is_mon,
-            "is_tue": batch.is_tue,
-            "is_wed": batch.is_wed,
-            "is_thu": batch.is_thu,
-            "is_fri": batch.is_fri,
-            "is_sat": batch.is_sat,
-            "is_sun": batch.is_sun,
+            **flags,
             "start_time": batch.start_time.strftime("%H:%M:%S") if batch.start_time else None,  # Format as HH:MM:SS string
             "end_time": batch.end_time.strftime("%H:%M:%S") if batch.end_time else None,  # Format as HH:MM:SS string
-            "start_date": batch.start_date.isoformat() if batch.start_date else None,
+            "start_date": batch.start_date,
             "is_active": batch.is_active,
             "schedule_days": schedule_string,  # Human-readable schedule string
-            "coaches": [{"id": c.id, "full_name": c.full_name, "email": c.email} for c in get_batch_coaches(db, batch.id)]
+            "coaches": [coach_dicts[c.id] for c in coaches_by_batch.get(batch.id, ())]
         }
         batches_with_coaches.append(batch_dict)
     
-    return batches_with_coaches
+    # Plain dicts of primitives/dates: let orjson serialize directly (no jsonable_encoder pass)
+    return ORJSONResponse(batches_with_coaches)
 
 
 @app.get("/batches/{batch_id}/potential-reactivations")
@@ -2675,14 +2917,11 @@ def get_potential_reactivations_endpoint(
     Returns leads with matching center and age group that are in Nurture, On Break,
     or Dead with 'Timing Mismatch' reason, and do_not_contact is False.
     """
-    if current_user.role not in ["team_lead", "team_member"]:
-        raise HTTPException(status_code=403, detail="Only sales roles can view reactivations")
+    require_role(current_user, SALES_ROLES, "Only sales roles can view reactivations")
     
     try:
-        leads = get_potential_reactivations(db, batch_id)
-        # Serialize leads (respect privacy for coaches)
-        from backend.core.lead_privacy import serialize_leads_for_user
-        serialized_leads = serialize_leads_for_user(leads, current_user)
+        # Serialized per role (respects privacy masking), 30s cached
+        serialized_leads = get_potential_reactivations_cached(db, batch_id, current_user.role)
         return {"leads": serialized_leads, "count": len(serialized_leads)}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2728,40 +2967,21 @@ def create_batch_endpoint(
     end_time: Optional[str] = None,
     start_date: Optional[str] = None,
     is_active: bool = True,
-    coach_ids: Optional[str] = None,  # Comma-separated list of coach IDs
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can create batches")),
+    coach_ids_list: Optional[List[int]] = Depends(coach_ids_query)  # ?coach_ids=1,2,3
 ):
     """
     Create a new batch (team leads only).
     Coach IDs can be provided as comma-separated string (e.g., "1,2,3").
     At least one coach must be assigned.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can create batches")
-    
-    # Parse coach_ids if provided
-    coach_ids_list = None
-    if coach_ids:
-        try:
-            coach_ids_list = [int(id.strip()) for id in coach_ids.split(",") if id.strip()]
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid coach_ids format. Use comma-separated integers")
-        
-        # Validate: At least one coach required
-        if not coach_ids_list:
-            raise HTTPException(status_code=400, detail="At least one coach must be assigned to the batch")
-    else:
+    # Validate: At least one coach required
+    if not coach_ids_list:
         raise HTTPException(status_code=400, detail="At least one coach must be assigned to the batch")
     
     # Parse date string if provided
-    from datetime import date as date_type
-    start_date_obj = None
-    if start_date:
-        try:
-            start_date_obj = datetime.fromisoformat(start_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid start_date format: {start_date}. Use YYYY-MM-DD")
+    start_date_obj = _parse_date(start_date, field="start_date") if start_date else None
     
     try:
         if max_age < min_age:
@@ -2795,9 +3015,9 @@ def create_batch_endpoint(
 def assign_coach_to_batch_endpoint(
     batch_id: int,
     user_id: Optional[int] = None,
-    coach_ids: Optional[str] = None,  # Comma-separated list for multiple assignment
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can assign coaches")),
+    coach_ids_list: Optional[List[int]] = Depends(coach_ids_query)  # ?coach_ids=1,2,3 for multiple assignment
 ):
     """
     Assign coach(es) to a batch (team leads only).
@@ -2807,16 +3027,11 @@ def assign_coach_to_batch_endpoint(
     - coach_ids: Comma-separated list for multiple coaches (replaces all existing assignments)
     At least one coach must be assigned.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can assign coaches")
-    
     # If coach_ids is provided, use multi-assignment (replaces all)
-    if coach_ids:
+    if coach_ids_list is not None:
+        if not coach_ids_list:
+            raise HTTPException(status_code=400, detail="At least one coach must be assigned")
         try:
-            coach_ids_list = [int(id.strip()) for id in coach_ids.split(",") if id.strip()]
-            if not coach_ids_list:
-                raise HTTPException(status_code=400, detail="At least one coach must be assigned")
-            
             assign_coaches_to_batch(db, batch_id, coach_ids_list)
             return {"status": "assigned", "batch_id": batch_id, "coach_ids": coach_ids_list}
         except ValueError as e:
@@ -2852,9 +3067,9 @@ def update_batch_endpoint(
     end_time: Optional[str] = None,
     start_date: Optional[str] = None,
     is_active: Optional[bool] = None,
-    coach_ids: Optional[str] = None,  # Comma-separated list of coach IDs
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can update batches")),
+    coach_ids_list: Optional[List[int]] = Depends(coach_ids_query)  # ?coach_ids=1,2,3
 ):
     """
     Update a batch (team leads only).
@@ -2862,27 +3077,11 @@ def update_batch_endpoint(
     Coach IDs can be provided as comma-separated string (e.g., "1,2,3") to replace existing assignments.
     Team Leads can edit any field (timing, coaches, status) even if the batch is currently inactive.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can update batches")
-    
-    # Parse coach_ids if provided
-    coach_ids_list = None
-    if coach_ids:
-        try:
-            coach_ids_list = [int(id.strip()) for id in coach_ids.split(",") if id.strip()]
-            if not coach_ids_list:
-                raise HTTPException(status_code=400, detail="coach_ids cannot be empty. To remove all coaches, use assign-coach endpoint")
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid coach_ids format. Use comma-separated integers")
+    if coach_ids_list is not None and not coach_ids_list:
+        raise HTTPException(status_code=400, detail="coach_ids cannot be empty. To remove all coaches, use assign-coach endpoint")
     
     # Parse date string if provided
-    from datetime import date as date_type
-    start_date_obj = None
-    if start_date:
-        try:
-            start_date_obj = datetime.fromisoformat(start_date).date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid start_date format: {start_date}. Use YYYY-MM-DD")
+    start_date_obj = _parse_date(start_date, field="start_date") if start_date else None
     
     try:
         if min_age is not None and max_age is not None and max_age < min_age:
@@ -2917,19 +3116,15 @@ def update_batch_endpoint(
 def delete_batch_endpoint(
     batch_id: int,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(team_lead_only("Only team leads can delete batches"))
 ):
     """
     Delete a batch (team leads only).
     This will remove all coach assignments but will NOT delete associated leads.
     Leads will have their batch references set to null.
     """
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can delete batches")
-    
     try:
-        from backend.core.batches import delete_batch as delete_batch_func
-        delete_batch_func(db, batch_id)
+        delete_batch(db, batch_id)
         return {"status": "deleted", "batch_id": batch_id}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2946,7 +3141,7 @@ def get_my_batches_endpoint(
     if current_user.role != "coach":
         raise HTTPException(status_code=403, detail="Only coaches can view their assigned batches")
     
-    batches = get_coach_batches(db, current_user.id)
+    batches = get_coach_batches_cached(db, current_user.id)
     return {"batches": batches, "count": len(batches)}
 
 
@@ -2961,8 +3156,7 @@ def create_approval_request_endpoint(
     current_user: User = Depends(get_current_user),
 ):
     """Submit a universal approval request (team members only). Body: request_type, reason, current_value?, requested_value?, lead_id?, student_id?."""
-    if current_user.role not in ("team_lead", "team_member"):
-        raise HTTPException(status_code=403, detail="Access denied")
+    require_role(current_user, SALES_ROLES)
     try:
         req = create_request(
             db=db,
@@ -2994,34 +3188,31 @@ def get_pending_approval_requests_endpoint(
     current_user: User = Depends(get_current_user),
 ):
     """Get pending approval requests. Team leads see all; team members see only their own."""
-    if current_user.role not in ("team_lead", "team_member"):
-        raise HTTPException(status_code=403, detail="Access denied")
+    require_role(current_user, SALES_ROLES)
 
     requests = get_pending_requests(db)
-    formatted = []
-    for req in requests:
-        lead = db.get(Lead, req.lead_id) if req.lead_id else None
-        student = db.get(Student, req.student_id) if req.student_id else None
-        lead_for_name = lead or (db.get(Lead, student.lead_id) if student else None)
-        requester = db.get(User, req.requested_by_id)
-
-        formatted.append({
+    if current_user.role == "team_member":
+        requests = [req for req in requests if req.requested_by_id == current_user.id]
+    # Lead/student/requester names in a few IN-queries rather than db.get() per request
+    player_names = get_request_player_names(db, requests)
+    user_names = get_user_names_by_id(db, (req.requested_by_id for req in requests))
+    formatted = [
+        {
             "id": req.id,
             "request_type": req.request_type,
             "lead_id": req.lead_id,
             "student_id": req.student_id,
-            "lead_name": lead_for_name.player_name if lead_for_name else "Unknown",
+            "lead_name": player_names.get(req.id, "Unknown"),
             "requested_by_id": req.requested_by_id,
-            "requested_by_name": requester.full_name if requester else "Unknown",
+            "requested_by_name": user_names.get(req.requested_by_id, "Unknown"),
             "current_value": req.current_value,
             "requested_value": req.requested_value,
             "reason": req.reason,
             "status": req.status,
             "created_at": req.created_at.isoformat() if req.created_at else None,
-        })
-
-    if current_user.role == "team_member":
-        formatted = [r for r in formatted if r["requested_by_id"] == current_user.id]
+        }
+        for req in requests
+    ]
     formatted.sort(key=lambda x: x.get("created_at") or "", reverse=True)
     return {"requests": formatted, "count": len(formatted)}
 
@@ -3032,11 +3223,9 @@ def resolve_approval_request_endpoint(
     approved: bool,
     resolution_note: Optional[str] = None,
     db: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(team_lead_only("Only team leads can resolve requests")),
 ):
     """Approve or reject any approval request (team leads only)."""
-    if current_user.role != "team_lead":
-        raise HTTPException(status_code=403, detail="Only team leads can resolve requests")
     try:
         req = resolve_request(
             db=db,
@@ -3045,10 +3234,10 @@ def resolve_approval_request_endpoint(
             approved=approved,
             resolution_note=resolution_note,
         )
+        _invalidate_lead_views(current_user.id)
         # Notify the requester: Approval Resolution Alert
         try:
             from backend.core.notifications import send_notification
-            from urllib.parse import quote
             lead = db.get(Lead, req.lead_id) if req.lead_id else None
             player_name = lead.player_name if lead else "Unknown"
             status_text = "Approved" if approved else "Rejected"
@@ -3079,22 +3268,25 @@ def get_lead_requests_endpoint(
 ):
     """Get all approval requests for a specific lead."""
     requests = get_requests_for_lead(db, lead_id)
-    formatted = []
-    for req in requests:
-        requester = db.get(User, req.requested_by_id)
-        resolver = db.get(User, req.resolved_by_id) if req.resolved_by_id else None
-        formatted.append({
+    # Requester/resolver names in one IN-query rather than db.get() per request
+    user_names = get_user_names_by_id(
+        db, [req.requested_by_id for req in requests] + [req.resolved_by_id for req in requests if req.resolved_by_id]
+    )
+    formatted = [
+        {
             "id": req.id,
             "type": req.request_type,
             "current_status": req.current_value,
             "requested_status": req.requested_value,
             "reason": req.reason,
             "request_status": req.status,
-            "requested_by_name": requester.full_name if requester else "Unknown",
-            "resolved_by_name": resolver.full_name if resolver else None,
+            "requested_by_name": user_names.get(req.requested_by_id, "Unknown"),
+            "resolved_by_name": user_names.get(req.resolved_by_id) if req.resolved_by_id else None,
             "created_at": req.created_at.isoformat() if req.created_at else None,
             "resolved_at": req.resolved_at.isoformat() if req.resolved_at else None,
-        })
+        }
+        for req in requests
+    ]
     formatted.sort(key=lambda x: x.get("created_at") or "", reverse=True)
     return {"requests": formatted}
 
@@ -3104,20 +3296,24 @@ def get_lead_requests_endpoint(
 # ==========================================
 
 @app.get("/public/lead-preferences/{token}", response_model=LeadPreferencesRead)
-def get_lead_preferences_public(token: str, db: Session = Depends(get_session)):
+@limiter.limit("60/minute")
+def get_lead_preferences_public(request: Request, token: str, db: Session = Depends(get_session)):
     """
     Get lead preferences by public token (no auth required).
+    Rate limited per IP; responses are cached per token for 60 seconds.
 
     Returns lead name, center name, and all active batches at the center (no age filter).
     """
-    preferences_data = get_lead_preferences_by_token(db, token)
+    preferences_data = get_lead_preferences_by_token_cached(db, token)
     if not preferences_data:
         raise HTTPException(status_code=404, detail="Lead not found")
     return preferences_data
 
 
 @app.put("/public/lead-preferences/{token}", response_model=Dict[str, str])
+@limiter.limit("10/minute")
 def update_lead_preferences_public(
+    request: Request,
     token: str,
     preferences: LeadPreferencesUpdate,
     db: Session = Depends(get_session)
@@ -3152,7 +3348,6 @@ def get_join_page_public(token: str, db: Session = Depends(get_session)):
     Returns type 'lead' (new enrollment) or 'student' (renewal), and fields for form/UPI.
     For lead: includes link_expires_at, batches for selection.
     """
-    from backend.models import Batch
     lead = db.exec(select(Lead).where(Lead.public_token == token)).first()
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
@@ -3235,9 +3430,7 @@ def submit_enrollment_public(
     Requires: Email, Subscription Plan, Start Date, UTR, Screenshot.
     Sets status to 'Payment Pending Verification', stores pending_subscription_data, last_updated=now().
     """
-    from datetime import datetime, date as date_type
     from backend.core.audit import log_lead_activity, log_status_change
-    from backend.models import Batch
 
     lead = db.exec(select(Lead).where(Lead.public_token == token)).first()
     if not lead:
@@ -3262,10 +3455,7 @@ def submit_enrollment_public(
     if not batch or batch.center_id != lead.center_id:
         raise HTTPException(status_code=400, detail="Invalid batch for this center")
 
-    try:
-        start_date = date_type.fromisoformat(body.start_date)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid start date format (use YYYY-MM-DD)")
+    start_date = _parse_date(body.start_date, detail="Invalid start date format (use YYYY-MM-DD)")
 
     old_status = lead.status
     lead.status = "Payment Pending Verification"
@@ -3311,7 +3501,6 @@ def submit_join_public(
     Submit enrollment and payment details (no auth). Converts lead to student.
     Requires 12-digit UTR number. Uses default subscription (Monthly, start today).
     """
-    from datetime import date as date_type, timedelta
     from backend.core.students import convert_lead_to_student
 
     lead = db.exec(select(Lead).where(Lead.public_token == token)).first()
@@ -3345,8 +3534,7 @@ def submit_join_public(
         from backend.core.audit import log_lead_activity
         log_lead_activity(db, lead.id, None, action_type="renewal_utr", description=f"Renewal UTR submitted via public page. UTR: {utr}. Pending Verification.")
         from backend.schemas.students import StudentRead
-        from sqlalchemy.orm import selectinload
-        stmt = select(Student).where(Student.id == existing_student.id).options(selectinload(Student.lead), selectinload(Student.batches))
+        stmt = select(Student).where(Student.id == existing_student.id).options(*STUDENT_READ_OPTIONS)
         student_with_relations = db.exec(stmt).first()
         return StudentRead.from_student(student_with_relations)
 
@@ -3375,7 +3563,6 @@ def submit_join_public(
         from backend.schemas.students import StudentRead
         from backend.core.audit import log_lead_activity
         from backend.core.emails import send_payment_received_alert
-        from sqlalchemy.orm import selectinload
         # Audit: public enrollment with UTR pending verification
         log_lead_activity(
             db, lead.id, None,
@@ -3392,9 +3579,7 @@ def submit_join_public(
         # High-priority bell: Payment Submitted
         try:
             from backend.core.notifications import notify_center_users
-            import os
             base_url = os.getenv("CRM_BASE_URL", "").strip().rstrip("/")
-            from urllib.parse import quote
             link = f"{base_url}/leads?search={quote(lead.phone or '')}" if base_url and lead.phone else None
             notify_center_users(
                 db, lead.center_id,
@@ -3406,10 +3591,7 @@ def submit_join_public(
             )
         except Exception as _:
             pass
-        stmt = select(Student).where(Student.id == student.id).options(
-            selectinload(Student.lead),
-            selectinload(Student.batches),
-        )
+        stmt = select(Student).where(Student.id == student.id).options(*STUDENT_READ_OPTIONS)
         student_with_relations = db.exec(stmt).first()
         return StudentRead.from_student(student_with_relations)
     except ValueError as e:
@@ -2,7 +2,7 @@
 Pydantic schemas for bulk operations.
 """
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 
 class BulkUpdateStatusRequest(BaseModel):
@@ -14,3 +14,34 @@ class BulkAssignCenterRequest(BaseModel):
     lead_ids: List[int]
     center_id: int
 
+
+class BulkLeadCreate(BaseModel):
+    player_name: str
+    phone: str
+    email: Optional[str] = None
+    address: Optional[str] = None
+    date_of_birth: Optional[str] = None  # YYYY-MM-DD
+    center_id: int
+
+
+class BulkCreateLeadsRequest(BaseModel):
+    leads: List[BulkLeadCreate]
+
+
+
+class BulkPromoteStagingRequest(BaseModel):
+    staging_ids: List[int]
+
+
+class BulkAttendanceRecord(BaseModel):
+    lead_id: Optional[int] = None
+    student_id: Optional[int] = None
+    status: str  # 'Present', 'Absent', 'Excused', 'Late'
+    remarks: Optional[str] = None
+    internal_note: Optional[str] = None
+
+
+class BulkAttendanceRequest(BaseModel):
+    batch_id: int
+    date: Optional[str] = None  # YYYY-MM-DD, defaults to today
+    records: List[BulkAttendanceRecord]
@@ -1,7 +1,7 @@
 """
 Pydantic schemas for Student operations.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List
 from datetime import datetime, date
 
@@ -95,6 +95,10 @@ class StudentRead(BaseModel):
         )
 
 
+# Serializes a whole list of StudentRead in one pydantic-core call (instead of model_dump per row)
+StudentReadList = TypeAdapter(List[StudentRead])
+
+
 class StudentCreate(BaseModel):
     """Schema for creating a student (used internally)."""
     lead_id: int
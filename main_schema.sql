@@ -250,6 +250,8 @@ CREATE INDEX IF NOT EXISTS idx_lead_phone ON "lead"(phone);
 CREATE INDEX IF NOT EXISTS idx_lead_token ON "lead"(public_token);
 CREATE INDEX IF NOT EXISTS idx_lead_center_id ON "lead"(center_id);
 CREATE INDEX IF NOT EXISTS idx_lead_next_followup ON "lead"(next_followup_date) WHERE next_followup_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_lead_trial_batch_id ON "lead"(trial_batch_id) WHERE trial_batch_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_lead_permanent_batch_id ON "lead"(permanent_batch_id) WHERE permanent_batch_id IS NOT NULL;
 
 CREATE INDEX IF NOT EXISTS idx_student_lead_id ON "student"(lead_id);
 CREATE INDEX IF NOT EXISTS idx_student_center_id ON "student"(center_id);
@@ -261,6 +263,8 @@ CREATE INDEX IF NOT EXISTS idx_attendance_date ON "attendance"(date);
 CREATE INDEX IF NOT EXISTS idx_attendance_student_id ON "attendance"(student_id);
 CREATE INDEX IF NOT EXISTS idx_attendance_batch_id ON "attendance"(batch_id);
 CREATE INDEX IF NOT EXISTS idx_attendance_lead_id ON "attendance"(lead_id) WHERE lead_id IS NOT NULL;
+-- Lead history, newest first (keyset pagination on (date, id))
+CREATE INDEX IF NOT EXISTS idx_attendance_lead_date ON "attendance"(lead_id, date DESC, id DESC) WHERE lead_id IS NOT NULL;
 
 CREATE INDEX IF NOT EXISTS idx_auditlog_lead_id ON "auditlog"(lead_id);
 CREATE INDEX IF NOT EXISTS idx_auditlog_lead_timestamp ON "auditlog"(lead_id, timestamp DESC);
@@ -269,6 +273,9 @@ CREATE INDEX IF NOT EXISTS idx_auditlog_timestamp ON "auditlog"(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_batch_schedule ON "batch"(is_mon, is_tue, is_wed, is_thu, is_fri, is_sat, is_sun);
 CREATE INDEX IF NOT EXISTS idx_batch_center_id ON "batch"(center_id);
 CREATE INDEX IF NOT EXISTS idx_batch_is_active ON "batch"(is_active) WHERE is_active = TRUE;
+CREATE INDEX IF NOT EXISTS idx_batch_center_active ON "batch"(center_id, is_active);
+-- PK (user_id, batch_id) covers per-coach lookups; this covers per-batch coach lists
+CREATE INDEX IF NOT EXISTS idx_batchcoachlink_batch_id ON "batchcoachlink"(batch_id);
 
 CREATE INDEX IF NOT EXISTS idx_leadstaging_center ON "leadstaging"(center_id);
 CREATE INDEX IF NOT EXISTS idx_leadstaging_name_phone ON "leadstaging"(player_name, phone);